@@ -0,0 +1,22 @@
+"""Console entry point for ``agentmesh`` / ``python -m agentmesh``.
+
+Answers ``--version`` before importing the CLI, so it needs neither typer
+nor rich.
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from . import __version__
+        print(f"agentmesh {__version__}")
+        return
+    from .cli import app
+    app(prog_name="agentmesh")
+
+
+if __name__ == "__main__":
+    main()
@@ -94,6 +94,25 @@ def build_capsule(
     data_dir: Path | None = None,
 ) -> Capsule:
     """Build a context capsule from git state + mesh state. Auto-tags with current episode."""
+    capsule, bundle = prepare_capsule(agent_id, task_desc, cwd=cwd, episode_id=episode_id, data_dir=data_dir)
+    db.save_capsule(capsule, data_dir)
+    write_bundle(capsule, bundle, data_dir)
+    return capsule
+
+
+def prepare_capsule(
+    agent_id: str,
+    task_desc: str = "",
+    cwd: str | None = None,
+    episode_id: str | None = None,
+    data_dir: Path | None = None,
+) -> tuple[Capsule, dict[str, Any]]:
+    """Gather git + mesh state into a capsule and its bundle dict; writes nothing.
+
+    Callers that save the capsule inside a board transaction run this first so
+    the git subprocesses don't hold the write lock, then call write_bundle()
+    once the row is committed.
+    """
     # Auto-tag with current episode
     if episode_id is None:
         from .episodes import get_current_episode
@@ -141,12 +160,6 @@ def build_capsule(
         episode_id=episode_id,
     )
 
-    # Save to DB
-    db.save_capsule(capsule, data_dir)
-
-    # Save to disk as JSON bundle
-    bundle_dir = (data_dir or _DEFAULT_DIR) / "bundles"
-    bundle_dir.mkdir(parents=True, exist_ok=True)
     bundle = {
         "capsule_id": capsule_id,
         "agent_id": agent_id,
@@ -173,18 +186,23 @@ def build_capsule(
             "next_actions": [],
         },
     }
-    bundle_path = bundle_dir / f"{capsule_id}.json"
+    return capsule, bundle
+
+
+def write_bundle(capsule: Capsule, bundle: dict[str, Any], data_dir: Path | None = None) -> None:
+    """Write a prepared capsule's JSON bundle to disk and log the BUNDLE event."""
+    bundle_dir = (data_dir or _DEFAULT_DIR) / "bundles"
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    bundle_path = bundle_dir / f"{capsule.capsule_id}.json"
     bundle_path.write_text(json.dumps(bundle, indent=2))
 
     # Event log
     events.append_event(
-        EventKind.BUNDLE, agent_id=agent_id,
-        payload={"capsule_id": capsule_id, "task": task_desc},
+        EventKind.BUNDLE, agent_id=capsule.agent_id,
+        payload={"capsule_id": capsule.capsule_id, "task": capsule.task_desc},
         data_dir=data_dir,
     )
 
-    return capsule
-
 
 def get_capsule_bundle(capsule_id: str, data_dir: Path | None = None) -> dict | None:
     """Load a capsule bundle from disk."""
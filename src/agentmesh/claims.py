@@ -59,44 +59,91 @@ def make_claim(
     If resource_type is None, parses from path string (e.g. "PORT:3000").
     If episode_id is None, auto-reads current episode.
     """
+    # Auto-tag with current episode
+    if episode_id is None:
+        from .episodes import get_current_episode
+        episode_id = get_current_episode(data_dir)
+
+    claim = _build_claim(agent_id, path, intent, ttl_s, reason, resource_type, episode_id, priority)
+    success, conflicts = db.check_and_claim(claim, force=force, data_dir=data_dir)
+
+    if success:
+        events.append_event(EventKind.CLAIM, agent_id=agent_id,
+                            payload=_claim_payload(claim), data_dir=data_dir)
+
+    return success, claim, conflicts
+
+
+def make_claims_bulk(
+    agent_id: str,
+    specs: list[tuple[str, ClaimIntent, int, str]],
+    force: bool = False,
+    episode_id: str | None = None,
+    priority: int = 5,
+    data_dir: Path | None = None,
+    pending_events: list[Any] | None = None,
+) -> list[tuple[bool, Claim, list[Claim]]]:
+    """Claim several (path, intent, ttl_s, reason) resources in one transaction.
+
+    Each resource is still checked independently: a conflict only skips that
+    resource. Returns one (success, claim, conflicts) per spec, in order.
+    With *pending_events*, CLAIM events are queued there instead of appended,
+    for a caller whose enclosing transaction has not committed yet.
+    """
+    if episode_id is None:
+        from .episodes import get_current_episode
+        episode_id = get_current_episode(data_dir)
+
+    results: list[tuple[bool, Claim, list[Claim]]] = []
+    with db.transaction(data_dir):
+        for path, intent, ttl_s, reason in specs:
+            claim = _build_claim(agent_id, path, intent, ttl_s, reason, None, episode_id, priority)
+            success, conflicts = db.check_and_claim(claim, force=force, data_dir=data_dir)
+            results.append((success, claim, conflicts))
+
+    claim_events = [(EventKind.CLAIM, agent_id, _claim_payload(clm)) for ok, clm, _ in results if ok]
+    if pending_events is None:
+        events.append_events(claim_events, data_dir=data_dir)
+    else:
+        pending_events.extend(claim_events)
+    return results
+
+
+def _build_claim(
+    agent_id: str,
+    path: str,
+    intent: ClaimIntent,
+    ttl_s: int,
+    reason: str,
+    resource_type: ResourceType | None,
+    episode_id: str | None,
+    priority: int,
+) -> Claim:
     if resource_type is not None:
         rt = resource_type
         norm = normalize_path(path) if rt == ResourceType.FILE else path
     else:
         rt, norm = parse_resource_string(path)
 
-    # Auto-tag with current episode
-    if episode_id is None:
-        from .episodes import get_current_episode
-        episode_id = get_current_episode(data_dir)
-
     now_str = _now()
     now_dt = datetime.now(timezone.utc)
     expires = (now_dt + timedelta(seconds=ttl_s)).isoformat()
-    claim_id = f"clm_{uuid.uuid4().hex[:12]}"
-
-    claim = Claim(
-        claim_id=claim_id, agent_id=agent_id, path=norm,
+    return Claim(
+        claim_id=f"clm_{uuid.uuid4().hex[:12]}", agent_id=agent_id, path=norm,
         resource_type=rt, intent=intent, state=ClaimState.ACTIVE,
         ttl_s=ttl_s, created_at=now_str, expires_at=expires,
         reason=reason, episode_id=episode_id, priority=priority,
         effective_priority=priority,
     )
 
-    success, conflicts = db.check_and_claim(claim, force=force, data_dir=data_dir)
 
-    if success:
-        events.append_event(
-            EventKind.CLAIM, agent_id=agent_id,
-            payload={
-                "claim_id": claim_id, "path": norm, "resource_type": rt.value,
-                "intent": intent.value, "ttl_s": ttl_s,
-                "episode_id": episode_id,
-            },
-            data_dir=data_dir,
-        )
-
-    return success, claim, conflicts
+def _claim_payload(claim: Claim) -> dict[str, Any]:
+    return {
+        "claim_id": claim.claim_id, "path": claim.path,
+        "resource_type": claim.resource_type.value,
+        "intent": claim.intent.value, "ttl_s": claim.ttl_s,
+        "episode_id": claim.episode_id,
+    }
 
 
 def release(
@@ -105,8 +152,13 @@ def release(
     resource_type: ResourceType | None = None,
     release_all: bool = False,
     data_dir: Path | None = None,
+    pending_events: list[Any] | None = None,
 ) -> int:
-    """Release claims. Returns count released."""
+    """Release claims. Returns count released.
+
+    With *pending_events*, the RELEASE event is queued there instead of
+    appended (see make_claims_bulk).
+    """
     if path and resource_type is None:
         rt, norm = parse_resource_string(path)
     elif path:
@@ -120,14 +172,36 @@ def release(
         agent_id, norm, resource_type=rt, release_all=release_all, data_dir=data_dir,
     )
     if count > 0:
-        events.append_event(
-            EventKind.RELEASE, agent_id=agent_id,
-            payload={"path": norm, "resource_type": rt.value, "all": release_all, "count": count},
-            data_dir=data_dir,
-        )
+        payload = {"path": norm, "resource_type": rt.value, "all": release_all, "count": count}
+        if pending_events is None:
+            events.append_event(EventKind.RELEASE, agent_id=agent_id, payload=payload, data_dir=data_dir)
+        else:
+            pending_events.append((EventKind.RELEASE, agent_id, payload))
     return count
 
 
+def release_many(
+    agent_id: str,
+    paths: list[str],
+    data_dir: Path | None = None,
+) -> int:
+    """Release claims on several resources with one commit. Returns count released."""
+    targets: list[tuple[str, ResourceType]] = []
+    for p in paths:
+        rt, norm = parse_resource_string(p)
+        targets.append((norm, rt))
+    counts = db.release_claims_many(agent_id, targets, data_dir=data_dir)
+    events.append_events(
+        [
+            (EventKind.RELEASE, agent_id,
+             {"path": norm, "resource_type": rt.value, "all": False, "count": count})
+            for (norm, rt), count in zip(targets, counts) if count > 0
+        ],
+        data_dir=data_dir,
+    )
+    return sum(counts)
+
+
 def check(path: str, resource_type: ResourceType | None = None,
           exclude_agent: str | None = None,
           data_dir: Path | None = None) -> list[Claim]:
@@ -2,36 +2,216 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
+import importlib.util
+import operator
 import os
-import shutil
+import re
 import subprocess
+import sys
 import threading
 import time
-import uuid
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, NoReturn, Optional
 
 import typer
-from rich.console import Console
 
 from . import __version__
-from .models import Agent, AgentKind, AgentStatus, ClaimIntent, EventKind, Severity, TaskState, _now
-from . import db, events, claims, messages, status, capsules, episodes, gitbridge, weaver
 
-app = typer.Typer(name="agentmesh", help="Local-first multi-agent coordination substrate.")
-console = Console()
+if TYPE_CHECKING:
+    import string
+
+
+def _lazy_module(name: str) -> Any:
+    """Bind *name* now, but only execute the module on first attribute access.
+
+    Reuses an already-imported module so patches and identity checks see
+    the same object everywhere.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+# Submodules execute on first attribute access, so --help/--version and
+# commands that never touch the board skip pydantic, SQLite and adapter
+# autoload at startup.
+models = _lazy_module(f"{__package__}.models")
+db = _lazy_module(f"{__package__}.db")
+events = _lazy_module(f"{__package__}.events")
+claims = _lazy_module(f"{__package__}.claims")
+messages = _lazy_module(f"{__package__}.messages")
+status = _lazy_module(f"{__package__}.status")
+capsules = _lazy_module(f"{__package__}.capsules")
+episodes = _lazy_module(f"{__package__}.episodes")
+gitbridge = _lazy_module(f"{__package__}.gitbridge")
+weaver = _lazy_module(f"{__package__}.weaver")
+spawner = _lazy_module(f"{__package__}.spawner")
+worker_adapters = _lazy_module(f"{__package__}.worker_adapters")
+orchestrator = _lazy_module(f"{__package__}.orchestrator")
+orch_control = _lazy_module(f"{__package__}.orch_control")
+watchdog = _lazy_module(f"{__package__}.watchdog")
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Name of the top-level command in *argv*, or None if the whole tree is needed.
+
+    Root options other than --data-dir (e.g. --help, --version) and shell
+    completion requests need every command, so they yield None.
+    """
+    if any(k.startswith("_") and k.endswith("_COMPLETE") for k in os.environ):
+        return None
+    skip = False
+    for tok in argv:
+        if skip:
+            skip = False
+        elif tok == "--data-dir":
+            skip = True
+        elif tok.startswith("--data-dir="):
+            continue
+        elif tok.startswith("-"):
+            return None
+        else:
+            return tok
+    return None
+
+
+class _CachedTyper(typer.Typer):
+    """Typer app that builds only the Click commands it is about to run, once.
+
+    typer.Typer.__call__ re-runs get_command() -- signature and type-hint
+    introspection for every command -- on each call. Here the build is
+    limited to the top-level command or group named in argv (falling back to
+    the full tree for root help, unknown names, completion), and reused by
+    later calls until commands change. It is not cached across processes:
+    a pickled app references its callbacks by name, so loading it would
+    import this module in full anyway.
+    """
+
+    _built: tuple[tuple[int, int, str | None], Any] | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        argv = args[0] if args else kwargs.get("args")
+        target = _sniff_subcommand(list(sys.argv[1:] if argv is None else argv))
+        key = (len(self.registered_commands), len(self.registered_groups), target)
+        if self._built is None or self._built[0] != key:
+            self._built = (key, typer.main.get_command(self._pruned(target)))
+        command = self._built[1]
+        # typer.Typer.__call__, minus its get_command(self) rebuild.
+        if sys.excepthook != typer.main.except_hook:
+            sys.excepthook = typer.main.except_hook
+        try:
+            return command(*args, **kwargs)
+        except Exception as e:
+            setattr(
+                e,
+                typer.main._typer_developer_exception_attr_name,
+                typer.models.DeveloperExceptionConfig(
+                    pretty_exceptions_enable=self.pretty_exceptions_enable,
+                    pretty_exceptions_show_locals=self.pretty_exceptions_show_locals,
+                    pretty_exceptions_short=self.pretty_exceptions_short,
+                ),
+            )
+            raise e
+
+    def _pruned(self, target: str | None) -> typer.Typer:
+        if target is None:
+            return self
+        commands = [
+            c for c in self.registered_commands
+            if (c.name or typer.main.get_command_name(c.callback.__name__)) == target
+        ]
+        groups = [g for g in self.registered_groups if g.name == target]
+        if not commands and not groups:
+            return self
+        pruned = copy.copy(self)
+        pruned.registered_commands = commands
+        pruned.registered_groups = groups
+        return pruned
+
+
+class _LazyConsole:
+    """Stands in for rich's Console; imports and builds it on first use.
+
+    Rich costs ~35 ms to import, which commands that print nothing, or only
+    plain text to a pipe via _print(), never need to pay.
+    """
+
+    _console: Any = None
+
+    def _get(self) -> Any:
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+
+    @property
+    def is_terminal(self) -> bool:
+        if self._console is None and not (
+            os.environ.get("TTY_COMPATIBLE") or "FORCE_COLOR" in os.environ
+        ):
+            # Rich's own answer when neither override is set.
+            try:
+                return sys.stdout.isatty()
+            except ValueError:
+                return False
+        return self._get().is_terminal
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+
+app = _CachedTyper(name="agentmesh", help="Local-first multi-agent coordination substrate.")
+console = _LazyConsole()
 
 _DATA_DIR: Path | None = None
 EPISODE_TRAILER_KEY = "AgentMesh-Episode"
 
 
+@functools.lru_cache(maxsize=8)
+def _path_of(value: str) -> Path:
+    return Path(value)
+
+
+class _ProcCtx(NamedTuple):
+    """Process facts the commands record; read once per invocation.
+
+    A NamedTuple rather than a dataclass: nothing else on the startup path
+    imports dataclasses.
+    """
+
+    cwd: str
+    pid: int
+    tty: str
+
+
+_PROC: _ProcCtx | None = None
+
+
+def _proc_ctx() -> _ProcCtx:
+    global _PROC
+    if _PROC is None:
+        _PROC = _ProcCtx(cwd=os.getcwd(), pid=os.getpid(), tty=os.environ.get("TTY", ""))
+    return _PROC
+
+
 def _get_data_dir() -> Path | None:
+    """Board directory: resolved once by main() (--data-dir, else $AGENTMESH_DATA_DIR)."""
+    if _DATA_DIR is not None:
+        return _DATA_DIR
     env = os.environ.get("AGENTMESH_DATA_DIR")
-    if env:
-        return Path(env)
-    return _DATA_DIR
+    return _path_of(env) if env else None
 
 
 def _auto_agent_id() -> str:
@@ -43,6 +223,12 @@ def _auto_agent_id() -> str:
     env_id = os.environ.get("AGENTMESH_AGENT_ID")
     if env_id:
         return env_id
+    return _session_agent_id()
+
+
+@functools.lru_cache(maxsize=1)
+def _session_agent_id() -> str:
+    """TTY- or session-file-derived ID; stable for the life of the process."""
     tty = ""
     try:
         tty = os.ttyname(0)
@@ -53,8 +239,10 @@ def _auto_agent_id() -> str:
         return f"claude_{tty_base}"
     # No TTY (e.g. piped/cron): use a persistent session file per $HOME
     session_file = Path.home() / ".agentmesh" / ".session_id"
-    if session_file.exists():
+    try:
         return session_file.read_text().strip()
+    except FileNotFoundError:
+        pass
     session_file.parent.mkdir(parents=True, exist_ok=True)
     import uuid as _uuid
     sid = f"claude_{_uuid.uuid4().hex[:8]}"
@@ -63,45 +251,68 @@ def _auto_agent_id() -> str:
 
 
 def _ensure_db() -> None:
-    db.init_db(_get_data_dir())
+    db.init_db_once(_get_data_dir())
+
 
+def _ensure_agent_exists(agent_id: str, pending_events: list[Any] | None = None) -> None:
+    """Ensure the agent exists for claim operations (claims have FK to agents).
 
-def _ensure_agent_exists(agent_id: str) -> None:
-    """Ensure the agent exists for claim operations (claims have FK to agents)."""
-    if db.get_agent(agent_id, _get_data_dir()) is not None:
+    With *pending_events*, the REGISTER event is queued there for the caller
+    to append once its transaction commits.
+    """
+    data_dir = _get_data_dir()
+    if db.agent_exists(agent_id, data_dir):
         return
-    now = _now()
-    a = Agent(
+    proc = _proc_ctx()
+    now = models._now()
+    a = models.Agent(
         agent_id=agent_id,
-        kind=AgentKind.CLAUDE_CODE,
+        kind=models.AgentKind.CLAUDE_CODE,
         display_name=agent_id,
-        cwd=os.getcwd(),
-        pid=os.getpid(),
-        tty=os.environ.get("TTY", ""),
-        status=AgentStatus.IDLE,
+        cwd=proc.cwd,
+        pid=proc.pid,
+        tty=proc.tty,
+        status=models.AgentStatus.IDLE,
         registered_at=now,
         last_heartbeat=now,
     )
-    db.register_agent(a, _get_data_dir())
-    events.append_event(
-        EventKind.REGISTER,
-        agent_id=agent_id,
-        payload={"kind": AgentKind.CLAUDE_CODE.value, "name": agent_id, "cwd": os.getcwd()},
-        data_dir=_get_data_dir(),
+    db.register_agent(a, data_dir)
+    event = (
+        models.EventKind.REGISTER, agent_id,
+        {"kind": models.AgentKind.CLAUDE_CODE.value, "name": agent_id, "cwd": proc.cwd},
     )
+    if pending_events is None:
+        events.append_events([event], data_dir=data_dir)
+    else:
+        pending_events.append(event)
 
 
 def _policy_path(cwd: Path | None = None) -> Path:
-    base = cwd or Path.cwd()
+    base = cwd or Path(_proc_ctx().cwd)
     return base / ".agentmesh" / "policy.json"
 
 
 def _load_policy(cwd: Path | None = None) -> dict[str, Any]:
+    """Parsed policy.json for *cwd*; treat the result as read-only.
+
+    Parses are cached on (path, mtime, size), so `task finish` and the
+    commit it wraps share one parse while an edited policy is still seen.
+    """
     path = _policy_path(cwd)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:  # missing policy file
         return {}
+    return _parse_policy(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_policy(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    import json
+
     try:
-        data = json.loads(path.read_text())
+        with open(path, "rb") as fh:
+            data = json.loads(fh.read())
         return data if isinstance(data, dict) else {}
     except (json.JSONDecodeError, OSError):
         return {}
@@ -116,26 +327,158 @@ def _policy_get(policy: dict[str, Any], keys: list[str], default: Any) -> Any:
     return value
 
 
-def _write_scaffold_file(path: Path, content: str, force: bool) -> str:
-    """Write scaffold file and return status: created/updated/skipped."""
-    existed = path.exists()
-    if existed and not force:
-        return "skipped"
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
-    return "updated" if existed else "created"
+def _write_scaffold_files(files: list[tuple[Path, str]], force: bool) -> list[str]:
+    """Write scaffold files and return a created/updated/skipped status per file.
+
+    O_EXCL create doubles as the existence check, so a new file costs one
+    open and a missing parent directory is only created on demand.
+    """
+    labels: list[str] = []
+    for path, content in files:
+        try:
+            fd = _open_scaffold(path, os.O_CREAT | os.O_EXCL)
+            label = "created"
+        except FileExistsError:
+            if not force:
+                labels.append("skipped")
+                continue
+            fd = _open_scaffold(path, os.O_TRUNC)
+            label = "updated"
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode())
+        labels.append(label)
+    return labels
+
+
+def _open_scaffold(path: Path, flags: int) -> int:
+    try:
+        return os.open(path, os.O_WRONLY | flags, 0o644)
+    except FileNotFoundError:
+        if not flags & os.O_CREAT:
+            raise
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, os.O_WRONLY | flags, 0o644)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: type) -> Any:
+    """TypeAdapter for ``list[model]``; its core schema is built once per model."""
+    from pydantic import TypeAdapter
+    return TypeAdapter(list[model])
+
+
+def _dump_models_json(
+    items: list[Any], model: type, indent: int | None = 2, **kwargs: Any,
+) -> bytes:
+    """Serialize a list of pydantic models or dataclasses to UTF-8 JSON in one pass."""
+    return _list_adapter(model).dump_json(items, indent=indent, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson() -> Any:
+    """orjson if the optional ``speedups`` extra is installed, else None."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON: compact, or indent=2 with *pretty*.
+
+    Without orjson this is exactly json.dumps. With orjson (the ``speedups``
+    extra) the layout is the same but the bytes can differ: non-ASCII text
+    is written as raw UTF-8 instead of \\u escapes, floats use orjson's
+    repr (``1e16``, not ``1e+16``), and NaN/Infinity become ``null``.
+    Everything except NaN/Infinity parses back to the same values.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib handles them
+    import json
+
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_text(obj: Any, pretty: bool = False) -> str:
+    """_json_bytes() as str, for callers that embed the JSON in other text."""
+    return _json_bytes(obj, pretty).decode()
+
+
+def _write_json(data: bytes) -> None:
+    """Write a serialized JSON document plus newline straight to stdout's byte layer.
+
+    JSON must not pass through Rich markup parsing or wrapping, and writing
+    the encoder's bytes skips a decode/re-encode round trip.
+    """
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        print(data.decode())
+        return
+    out.flush()  # keep ordering with text already written to stdout
+    buffer.write(data + b"\n")
+    buffer.flush()
+
+
+def _print_json(obj: Any, pretty: bool = False) -> None:
+    """Emit --json output: compact by default, indented with --pretty."""
+    _write_json(_json_bytes(obj, pretty))
+
+
+# Same shape as Rich's markup tags: [bold], [/dim], [green] ...
+_MARKUP_TAG_RE = re.compile(r"\[/?[a-z#@][^\[\]]*\]")
+
+
+def _print(msg: str, **rich_kwargs: Any) -> None:
+    """console.print() on a terminal; plain unstyled text when piped."""
+    if console.is_terminal:
+        console.print(msg, **rich_kwargs)
+        return
+    if rich_kwargs.get("markup", True):
+        msg = _MARKUP_TAG_RE.sub("", msg)
+    sys.stdout.write(msg + "\n")
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_by_value(enum_name: str) -> dict[str, Any]:
+    """Value -> member map for a models enum, built once per process."""
+    return {m.value: m for m in getattr(models, enum_name)}
+
+
+def _parse_enum(enum_name: str, value: str, label: str) -> Any:
+    """Member of ``models.<enum_name>`` for an option value; unknown values exit 1 with the valid list."""
+    members = _enum_by_value(enum_name)
+    member = members.get(value)
+    if member is None:
+        console.print(f"Invalid {label} '{value}'. Valid: {', '.join(members)}", style="red")
+        raise typer.Exit(1)
+    return member
+
+
+def _sleep_until(deadline_ns: int) -> None:
+    """Sleep until a time.monotonic_ns() deadline; return at once if overrun."""
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1_000_000_000)
 
 
 @contextmanager
 def _orchestrator_lease(
     *,
     json_out: bool = False,
+    pretty: bool = False,
     force: bool = False,
     ttl_s: int = 300,
 ):
     """Acquire orchestration lease lock for mutating control-plane operations."""
-    from . import orch_control
-
     owner = orch_control.make_owner(_auto_agent_id())
     ok, _claim, conflicts = orch_control.acquire_lease(
         owner=owner,
@@ -146,11 +489,11 @@ def _orchestrator_lease(
     if not ok:
         holders = [{"agent_id": c.agent_id, "expires_at": c.expires_at} for c in conflicts]
         if json_out:
-            console.print(json.dumps({
+            _print_json({
                 "error": "orchestration_lock_conflict",
                 "resource": "LOCK:orchestration",
                 "holders": holders,
-            }, indent=2))
+            }, pretty)
         else:
             console.print("Orchestrator lease conflict on LOCK:orchestration", style="red")
             for h in holders:
@@ -182,8 +525,6 @@ def _orchestrator_lease_heartbeat(
         owner = owner_id
 
         def _renew_loop() -> None:
-            from . import orch_control
-
             interval = max(renew_every_s, 1.0)
             while not stop_evt.wait(interval):
                 ok, claim, conflicts = orch_control.renew_lease(
@@ -200,7 +541,7 @@ def _orchestrator_lease_heartbeat(
                     stop_evt.set()
                     return
                 events.append_event(
-                    kind=EventKind.ORCH_LEASE_RENEW,
+                    kind=models.EventKind.ORCH_LEASE_RENEW,
                     agent_id=owner,
                     payload={"op": "lease_renew_bg", "expires_at": claim.expires_at, "ttl_s": ttl_s},
                     data_dir=_get_data_dir(),
@@ -222,9 +563,11 @@ def main(
                                            help="Override data directory"),
     version: bool = typer.Option(False, "--version", "-V", help="Show version"),
 ) -> None:
-    global _DATA_DIR
-    if data_dir:
-        _DATA_DIR = Path(data_dir)
+    global _DATA_DIR, _PROC
+    _PROC = None
+    # Typer already folded AGENTMESH_DATA_DIR in via envvar=, with an
+    # explicit --data-dir taking precedence.
+    _DATA_DIR = _path_of(data_dir) if data_dir else None
     if version:
         console.print(f"agentmesh {__version__}")
         raise typer.Exit()
@@ -233,6 +576,29 @@ def main(
         console.print("\n[dim]New here? Start with:[/dim] [bold]agentmesh init[/bold]")
 
 
+_SCAFFOLD_DIR = Path(__file__).parent / "scaffold"
+
+
+@functools.lru_cache(maxsize=4)
+def _scaffold_template(name: str) -> string.Template:
+    """Read a scaffold/<name>.tmpl file once per process."""
+    import string
+
+    return string.Template((_SCAFFOLD_DIR / f"{name}.tmpl").read_text())
+
+
+def _render_scaffold_json(name: str, pretty: bool, **values: Any) -> str:
+    """Fill a pre-indented scaffold JSON template with JSON-encoded *values*."""
+    import json
+
+    text = _scaffold_template(name).substitute(
+        {key: json.dumps(value) for key, value in values.items()}
+    )
+    if pretty:
+        return text
+    return json.dumps(json.loads(text), separators=(",", ":")) + "\n"
+
+
 @app.command(name="init")
 def init_cmd(
     repo: str = typer.Option(".", "--repo", "-r", help="Target repository path"),
@@ -243,6 +609,7 @@ def init_cmd(
     claim_ttl: int = typer.Option(1800, "--claim-ttl", help="Default claim TTL in seconds"),
     capsule_default: bool = typer.Option(True, "--capsule-default/--no-capsule-default",
                                          help="Default capsule behavior for task finish"),
+    pretty: bool = typer.Option(True, "--pretty/--compact", help="Indent scaffold JSON files"),
 ) -> None:
     """Initialize AgentMesh defaults in a repository."""
     target = Path(repo).resolve()
@@ -250,153 +617,35 @@ def init_cmd(
         console.print(f"Not a directory: {target}", style="red")
         raise typer.Exit(1)
 
-    policy = {
-        "schema_version": "1.0",
-        "claims": {
-            "ttl_seconds": claim_ttl,
-        },
-        "worker_adapters": {
-            "allow_backends": [],
-            "allow_modules": [],
-            "allow_paths": [],
-        },
-        "assay": {
-            "emit_on_commit": False,
-            "required": False,
-            "command": "",
-            "timeout_s": 30,
-        },
-        "public_private": {
-            "public_path_globs": [
-                "src/**",
-                "tests/**",
-                "README.md",
-                "LICENSE",
-                "docs/spec/**",
-                "docs/*.template.json",
-                "docs/*.public.json",
-                "docs/*.sanitized.json",
-            ],
-            "private_path_globs": [
-                ".agentmesh/runs/**",
-                "docs/alpha-gate-report.json",
-                "**/ci-result*.json",
-                "**/ci-witness*.log",
-            ],
-            "review_path_globs": [
-                "docs/**",
-                "scripts/**",
-                ".github/**",
-            ],
-            "private_content_patterns": [
-                "(^|[^A-Za-z])ghp_[A-Za-z0-9]{20,}",
-                "AKIA[0-9A-Z]{16}",
-                "-----BEGIN [A-Z ]*PRIVATE KEY-----",
-                "\\bgo[- ]to[- ]market\\b",
-                "\\bpricing\\b",
-                "\\bcompetitive positioning\\b",
-            ],
-        },
-        "task_finish": {
-            "run_tests": test_command,
-            "capsule": capsule_default,
-            "signoff": True,
-            "release_all": True,
-            "end_episode": True,
-        },
-    }
+    agents_md = _scaffold_template("AGENTS.md").substitute(
+        claim_ttl=claim_ttl,
+        test_command=test_command,
+        capsule_default=str(capsule_default).lower(),
+    )
 
-    capabilities = {
-        "schema_version": "1.0",
-        "tool_name": "agentmesh",
+    values = {
+        "claim_ttl": claim_ttl,
+        "test_command": test_command,
+        "capsule_default": capsule_default,
         "tool_version": __version__,
-        "recommended_defaults": {
-            "commit_via_agentmesh": True,
-            "capsule_on_finish": capsule_default,
-            "end_episode_on_finish": True,
-            "release_claims_on_finish": True,
-            "claim_ttl_seconds": claim_ttl,
-            "test_command": test_command,
-        },
-        "happy_path": {
-            "start": "agentmesh task start --title <task_title> [--claim <resource> ...]",
-            "finish": "agentmesh task finish --message <msg> [--run-tests <cmd>]",
-        },
-        "commands": {
-            "init": "agentmesh init [--repo <path>] [--install-hooks] [--policy]",
-            "task.start": "agentmesh task start --title <title> [--claim <resource> ...]",
-            "task.finish": "agentmesh task finish --message <msg> [--run-tests <cmd>]",
-            "resource.claim": "agentmesh claim <resource ...>",
-            "resource.check": "agentmesh check <path>",
-            "mesh.status": "agentmesh status",
-            "git.commit": "agentmesh commit -m <msg> [--run-tests <cmd>] [--capsule]",
-            "public_private.classify": "agentmesh classify [--staged] [--json] [--fail-on-private] [--fail-on-review]",
-            "release.check": "agentmesh release-check [--staged|--all] [--require-witness] [--run-tests <cmd>] [--json]",
-            "alpha_gate.sanitize_report": "agentmesh sanitize-alpha-gate-report --in <private_report_json> --out <public_report_json>",
-            "weave.verify": "agentmesh weave verify",
-            "weave.export": "agentmesh weave export --md",
-            "episode.export": "agentmesh episode export <episode_id>",
-            "episode.import": "agentmesh episode import <meshpack_path>",
-        },
-        "resource_prefixes": [
-            "PORT:<number>",
-            "LOCK:<name>",
-            "TEST_SUITE:<name>",
-            "TEMP_DIR:<path>",
-            "<file_path>",
-        ],
-        "agent_guidance": [
-            "Prefer task.start/task.finish for basic workflows.",
-            "Claim resources before editing shared files.",
-            "Treat weave verify failures as blocking.",
-            "Run release-check before publishing: agentmesh release-check --staged --json",
-            "Convert private alpha gate reports before publishing: agentmesh sanitize-alpha-gate-report",
-        ],
     }
-
-    agents_md = f"""# AgentMesh Repo Playbook
-
-This repo uses AgentMesh as a local coordination + provenance layer around normal git workflows.
-
-## Happy Path
-
-```bash
-agentmesh task start --title "<task>" --claim <resource>
-# edit + stage as normal
-git add <files...>
-agentmesh task finish --message "<commit message>"
-```
-
-Default policy:
-- claim TTL: `{claim_ttl}` seconds
-- task finish test command: `{test_command}`
-- task finish capsule default: `{str(capsule_default).lower()}`
-
-## Useful Commands
-
-- `agentmesh status`
-- `agentmesh check <path>`
-- `agentmesh weave verify`
-- `agentmesh weave export --md`
-"""
-
     files: list[tuple[Path, str]] = [
         (target / "AGENTS.md", agents_md),
         (
             target / ".agentmesh" / "capabilities.json",
-            json.dumps(capabilities, indent=2) + "\n",
+            _render_scaffold_json("capabilities.json", pretty, **values),
         ),
     ]
     if write_policy:
         files.append(
             (
                 target / ".agentmesh" / "policy.json",
-                json.dumps(policy, indent=2) + "\n",
+                _render_scaffold_json("policy.json", pretty, **values),
             )
         )
 
-    for path, content in files:
-        status_label = _write_scaffold_file(path, content, force=force)
+    labels = _write_scaffold_files(files, force=force)
+    for (path, _), status_label in zip(files, labels):
         console.print(f"{status_label:7} {path}")
 
     if install_hooks:
@@ -418,17 +667,18 @@ def register(
     """Register an agent in the mesh."""
     _ensure_db()
     agent_id = agent or _auto_agent_id()
-    agent_kind = AgentKind(kind)
-    now = _now()
-    a = Agent(
+    agent_kind = _parse_enum("AgentKind", kind, "kind")
+    proc = _proc_ctx()
+    now = models._now()
+    a = models.Agent(
         agent_id=agent_id, kind=agent_kind, display_name=name or agent_id,
-        cwd=os.getcwd(), pid=os.getpid(), tty=os.environ.get("TTY", ""),
-        status=AgentStatus.IDLE, registered_at=now, last_heartbeat=now,
+        cwd=proc.cwd, pid=proc.pid, tty=proc.tty,
+        status=models.AgentStatus.IDLE, registered_at=now, last_heartbeat=now,
     )
     db.register_agent(a, _get_data_dir())
     events.append_event(
-        EventKind.REGISTER, agent_id=agent_id,
-        payload={"kind": kind, "name": name, "cwd": os.getcwd()},
+        models.EventKind.REGISTER, agent_id=agent_id,
+        payload={"kind": kind, "name": name, "cwd": proc.cwd},
         data_dir=_get_data_dir(),
     )
     console.print(f"Registered [bold]{agent_id}[/bold]")
@@ -443,7 +693,7 @@ def deregister(
     agent_id = agent or _auto_agent_id()
     ok = db.deregister_agent(agent_id, _get_data_dir())
     if ok:
-        events.append_event(EventKind.DEREGISTER, agent_id=agent_id, data_dir=_get_data_dir())
+        events.append_event(models.EventKind.DEREGISTER, agent_id=agent_id, data_dir=_get_data_dir())
         console.print(f"Deregistered [bold]{agent_id}[/bold]")
     else:
         console.print(f"Agent [bold]{agent_id}[/bold] not found", style="red")
@@ -458,11 +708,11 @@ def heartbeat(
     """Update agent heartbeat and status."""
     _ensure_db()
     agent_id = agent or _auto_agent_id()
-    agent_status = AgentStatus(status)
+    agent_status = _parse_enum("AgentStatus", status, "status")
     ok = db.update_heartbeat(agent_id, agent_status, data_dir=_get_data_dir())
     if ok:
         events.append_event(
-            EventKind.HEARTBEAT, agent_id=agent_id,
+            models.EventKind.HEARTBEAT, agent_id=agent_id,
             payload={"status": status}, data_dir=_get_data_dir(),
         )
     else:
@@ -472,6 +722,15 @@ def heartbeat(
 
 # -- Claim commands --
 
+@functools.lru_cache(maxsize=1)
+def _claim_label_prefixes() -> dict[Any, str]:
+    """Claim output label per ResourceType, e.g. "[PORT] "; files get none."""
+    return {
+        rt: "" if rt is models.ResourceType.FILE else f"[{rt.value.upper()}] "
+        for rt in models.ResourceType
+    }
+
+
 @app.command()
 def claim(
     resources: list[str] = typer.Argument(..., help="Resources to claim (paths, PORT:N, LOCK:name, TEST_SUITE:name, TEMP_DIR:path)"),
@@ -483,25 +742,33 @@ def claim(
 ) -> None:
     """Claim resources for editing. Supports file paths and typed resources (PORT:3000, LOCK:npm)."""
     _ensure_db()
+    data_dir = _get_data_dir()
     agent_id = agent or _auto_agent_id()
-    _ensure_agent_exists(agent_id)
-    claim_intent = ClaimIntent(intent)
+    claim_intent = _parse_enum("ClaimIntent", intent, "intent")
     had_conflict = False
-    for p in resources:
-        ok, clm, conflicts = claims.make_claim(
-            agent_id, p, intent=claim_intent, ttl_s=ttl,
-            reason=reason, force=force, data_dir=_get_data_dir(),
+    # Auto-registration and the claims share one commit and one event append.
+    pending: list[Any] = []
+    with db.transaction(data_dir):
+        _ensure_agent_exists(agent_id, pending)
+        results = claims.make_claims_bulk(
+            agent_id, [(p, claim_intent, ttl, reason) for p in resources],
+            force=force, data_dir=data_dir, pending_events=pending,
         )
+    events.append_events(pending, data_dir=data_dir)
+    from rich.markup import escape
+
+    prefixes = _claim_label_prefixes()
+    lines = []
+    for p, (ok, clm, conflicts) in zip(resources, results):
         if ok:
-            rt_label = clm.resource_type.value.upper() if clm.resource_type.value != "file" else ""
-            prefix = f"[{rt_label}] " if rt_label else ""
-            console.print(f"Claimed {prefix}[bold]{clm.path}[/bold] (ttl={ttl}s)")
+            lines.append(f"Claimed {prefixes[clm.resource_type]}[bold]{escape(clm.path)}[/bold] (ttl={ttl}s)")
             if conflicts:
-                console.print(f"  (forced over {len(conflicts)} existing claim(s))", style="yellow")
+                lines.append(f"[yellow]  (forced over {len(conflicts)} existing claim(s))[/yellow]")
         else:
             had_conflict = True
-            console.print(f"CONFLICT on [bold]{p}[/bold]:", style="red bold")
-            console.print(claims.format_conflict(conflicts))
+            lines.append(f"[red bold]CONFLICT on [bold]{escape(p)}[/bold]:[/red bold]")
+            lines.append(escape(claims.format_conflict(conflicts)))
+    console.print("\n".join(lines))
     if had_conflict:
         raise typer.Exit(1)
 
@@ -519,9 +786,7 @@ def release(
         count = claims.release(agent_id, release_all=True, data_dir=_get_data_dir())
         console.print(f"Released {count} claim(s)")
     elif paths:
-        total = 0
-        for p in paths:
-            total += claims.release(agent_id, path=p, data_dir=_get_data_dir())
+        total = claims.release_many(agent_id, paths, data_dir=_get_data_dir())
         console.print(f"Released {total} claim(s)")
     else:
         console.print("Specify paths or --all", style="red")
@@ -538,8 +803,7 @@ def check(
     _ensure_db()
     conflicts = claims.check(path, exclude_agent=agent, data_dir=_get_data_dir())
     if json_out:
-        import json as json_mod
-        console.print(json_mod.dumps([c.model_dump() for c in conflicts], indent=2))
+        _write_json(_dump_models_json(conflicts, models.Claim))
     elif conflicts:
         console.print(f"CONFLICT on [bold]{path}[/bold]:", style="red bold")
         console.print(claims.format_conflict(conflicts))
@@ -559,7 +823,7 @@ def gc(
         console.print(f"Would GC data older than {max_age}h (dry run)")
         return
     result = db.gc_old_data(max_age_hours=max_age, data_dir=_get_data_dir())
-    events.append_event(EventKind.GC, payload=result, data_dir=_get_data_dir())
+    events.append_event(models.EventKind.GC, payload=result, data_dir=_get_data_dir())
     console.print(f"GC: {result['claims']} claims, {result['agents']} agents, {result['messages']} messages")
 
 
@@ -576,7 +840,7 @@ def msg(
     """Post a message to the board."""
     _ensure_db()
     agent_id = agent or _auto_agent_id()
-    sev = Severity(severity)
+    sev = _parse_enum("Severity", severity, "severity")
     m = messages.post(agent_id, text, to_agent=to, channel=channel, severity=sev, data_dir=_get_data_dir())
     style = messages.severity_style(sev)
     console.print(f"[{style}][{sev.value}][/] {text}")
@@ -593,7 +857,7 @@ def inbox_cmd(
     """List messages."""
     _ensure_db()
     agent_id = agent or _auto_agent_id()
-    sev = Severity(severity) if severity else None
+    sev = _parse_enum("Severity", severity, "severity") if severity else None
     msgs = messages.inbox(
         agent_id=agent_id, unread=unread, channel=channel,
         severity=sev, limit=limit, data_dir=_get_data_dir(),
@@ -601,15 +865,29 @@ def inbox_cmd(
     if not msgs:
         console.print("[dim]No messages[/dim]")
         return
+    if not console.is_terminal:
+        # Piped: plain lines, no markup parsing (bodies may contain "[/x]").
+        sys.stdout.write("".join(
+            f"[{m.severity.value}] {m.from_agent}{f' -> {m.to_agent}' if m.to_agent else ''}: "
+            f"{m.body}  {m.created_at[:19]}\n"
+            for m in msgs
+        ))
+        return
+    from rich.markup import escape
+
+    prefixes = {s: f"[{messages.severity_style(s)}][{s.value}][/]" for s in models.Severity}
+    lines = []
     for m in msgs:
-        style = messages.severity_style(m.severity)
-        prefix = f"[{style}][{m.severity.value}][/]"
         to_str = f" -> {m.to_agent}" if m.to_agent else ""
-        console.print(f"{prefix} {m.from_agent}{to_str}: {m.body}  [dim]{m.created_at[:19]}[/dim]")
+        lines.append(f"{prefixes[m.severity]} {m.from_agent}{to_str}: {escape(m.body)}  [dim]{m.created_at[:19]}[/dim]")
+    console.print("\n".join(lines))
 
 
 # -- Status command --
 
+_STATUS_WATCH_MAX_IDLE_S = 30.0
+
+
 @app.command(name="status")
 def status_cmd(
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
@@ -617,21 +895,33 @@ def status_cmd(
 ) -> None:
     """Show mesh status dashboard."""
     _ensure_db()
+    data_dir = _get_data_dir()
     if json_out:
-        result = status.render_status(data_dir=_get_data_dir(), as_json=True)
-        console.print(result)
+        _print_json(status.status_payload(data_dir), pretty=True)
         return
     if watch:
-        import time
+        from rich.live import Live
+
+        # Live repaints the dashboard in place instead of clearing the screen.
+        live = Live(console=console._get(), auto_refresh=False)
         try:
-            while True:
-                console.clear()
-                status.render_status(data_dir=_get_data_dir(), console=console)
-                time.sleep(2)
+            with live:
+                while True:
+                    live.update(status.build_renderable(data_dir), refresh=True)
+                    # Redraw only when an event is logged or another process
+                    # commits to the board; time-based fields refresh on idle.
+                    signature = events.log_signature(data_dir)
+                    version = db.data_version(data_dir)
+                    idle_until = time.monotonic() + _STATUS_WATCH_MAX_IDLE_S
+                    while time.monotonic() < idle_until:
+                        if events.wait_for_change(signature, 0.25, data_dir) != signature:
+                            break
+                        if db.data_version(data_dir) != version:
+                            break
         except KeyboardInterrupt:
             pass
     else:
-        status.render_status(data_dir=_get_data_dir(), console=console)
+        status.render_status(data_dir=data_dir, console=console._get())
 
 
 # -- Doctor command --
@@ -639,6 +929,7 @@ def status_cmd(
 @app.command(name="doctor")
 def doctor_cmd() -> None:
     """Check environment and report what needs fixing."""
+    import shutil
     import subprocess
     ok_count = 0
     warn_count = 0
@@ -670,7 +961,7 @@ def doctor_cmd() -> None:
         fail("Not inside a git repository", "cd into a git repo first")
 
     # 2. Initialized check
-    am_dir = Path.cwd() / ".agentmesh"
+    am_dir = Path(_proc_ctx().cwd) / ".agentmesh"
     if am_dir.is_dir():
         ok(".agentmesh/ directory exists")
     else:
@@ -728,7 +1019,7 @@ def classify_cmd(
     """Classify files as public/private/review using deterministic policy rules."""
     from . import public_private
 
-    repo_root = Path.cwd()
+    repo_root = Path(_proc_ctx().cwd)
     target_paths: list[str] = []
 
     if staged:
@@ -757,7 +1048,7 @@ def classify_cmd(
     review_count = sum(1 for r in results if r.classification == public_private.REVIEW)
 
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "results": [
                 {
                     "path": r.path,
@@ -771,7 +1062,7 @@ def classify_cmd(
                 "private": private_count,
                 "review": review_count,
             },
-        }, indent=2))
+        }, pretty=True)
     else:
         for r in results:
             if r.classification == public_private.PRIVATE:
@@ -809,10 +1100,10 @@ def release_check_cmd(
     """Deterministic preflight for publishing/release automation."""
     from . import public_private
 
-    repo_root = Path.cwd()
+    repo_root = Path(_proc_ctx().cwd)
     if not gitbridge.is_git_repo(str(repo_root)):
         if json_out:
-            console.print(json.dumps({"error": "not_git_repo"}, indent=2))
+            _print_json({"error": "not_git_repo"}, pretty=True)
         else:
             console.print("Not a git repository", style="red")
         raise typer.Exit(1)
@@ -837,7 +1128,7 @@ def release_check_cmd(
                 target_paths.extend([ln.strip() for ln in tracked.splitlines() if ln.strip()])
             except subprocess.CalledProcessError:
                 if json_out:
-                    console.print(json.dumps({"error": "git_ls_files_failed"}, indent=2))
+                    _print_json({"error": "git_ls_files_failed"}, pretty=True)
                 else:
                     console.print("Failed to list tracked files", style="red")
                 raise typer.Exit(1)
@@ -921,7 +1212,7 @@ def release_check_cmd(
     }
 
     if json_out:
-        print(json.dumps(payload, indent=2))
+        _print_json(payload, pretty=True)
     else:
         rc = payload["release_check"]
         console.print(f"classify: public={rc['classification']['public']} private={private_count} review={review_count}")
@@ -948,7 +1239,7 @@ def sanitize_alpha_gate_report_cmd(
     dst = Path(out_path)
     if not src.exists():
         if json_out:
-            print(json.dumps({"error": "input_not_found", "path": str(src)}, indent=2))
+            _print_json({"error": "input_not_found", "path": str(src)}, pretty=True)
         else:
             console.print(f"Input report not found: {src}", style="red")
         raise typer.Exit(1)
@@ -957,19 +1248,19 @@ def sanitize_alpha_gate_report_cmd(
         report = write_sanitized_alpha_gate_report(src, dst)
     except Exception as exc:
         if json_out:
-            print(json.dumps({"error": "sanitize_failed", "detail": str(exc)}, indent=2))
+            _print_json({"error": "sanitize_failed", "detail": str(exc)}, pretty=True)
         else:
             console.print(f"Sanitize failed: {exc}", style="red")
         raise typer.Exit(1)
 
     if json_out:
-        print(json.dumps({
+        _print_json({
             "ok": True,
             "input": str(src),
             "output": str(dst),
             "overall_pass": report.get("overall_pass", False),
             "sanitized": report.get("sanitized", True),
-        }, indent=2))
+        }, pretty=True)
     else:
         console.print(f"Wrote sanitized report: {dst}")
 
@@ -1006,38 +1297,45 @@ def bundle_get(
         console.print(f"Capsule [bold]{capsule_id}[/bold] not found", style="red")
         raise typer.Exit(1)
     if json_out:
-        console.print(json.dumps(bundle, indent=2))
-    elif sbar:
+        _print_json(bundle, pretty=True)
+        return
+    from rich.markup import escape
+
+    if sbar:
         sbar_data = bundle.get("sbar", {})
         if not sbar_data:
             console.print("No SBAR data in this capsule", style="yellow")
             return
-        console.print(f"[bold]SBAR Handoff -- {capsule_id}[/bold]\n")
         sit = sbar_data.get("situation", {})
-        console.print(f"[bold cyan]S[/bold cyan]ituation: {sit.get('global_objective', '')}  ({sit.get('git_head', '')})")
         bg = sbar_data.get("background", {})
-        n_files = len(bg.get("changed_files", []))
-        console.print(f"[bold cyan]B[/bold cyan]ackground: {n_files} file(s) changed")
-        for f in bg.get("changed_files", []):
-            console.print(f"  {f.get('path', '')}")
+        changed = bg.get("changed_files", [])
         assess = sbar_data.get("assessment", {})
-        console.print(f"[bold cyan]A[/bold cyan]ssessment: tests={assess.get('test_status', 'unknown')}, open_claims={len(assess.get('open_claims', []))}")
         rec = sbar_data.get("recommendation", {})
         actions = rec.get("next_actions", [])
         blockers = rec.get("blockers", [])
-        console.print(f"[bold cyan]R[/bold cyan]ecommendation: {len(actions)} action(s), {len(blockers)} blocker(s)")
-        for a in actions:
-            console.print(f"  - {a}")
+        lines = [
+            f"[bold]SBAR Handoff -- {capsule_id}[/bold]\n",
+            f"[bold cyan]S[/bold cyan]ituation: {escape(str(sit.get('global_objective', '')))}  ({sit.get('git_head', '')})",
+            f"[bold cyan]B[/bold cyan]ackground: {len(changed)} file(s) changed",
+            *(f"  {escape(f.get('path', ''))}" for f in changed),
+            f"[bold cyan]A[/bold cyan]ssessment: tests={assess.get('test_status', 'unknown')}, open_claims={len(assess.get('open_claims', []))}",
+            f"[bold cyan]R[/bold cyan]ecommendation: {len(actions)} action(s), {len(blockers)} blocker(s)",
+            *(f"  - {escape(str(a))}" for a in actions),
+        ]
+        console.print("\n".join(lines))
     else:
-        console.print(f"Capsule: [bold]{capsule_id}[/bold]")
-        console.print(f"  Agent: {bundle['agent_id']}")
-        console.print(f"  Task: {bundle.get('task_desc', '')}")
         git = bundle.get("git", {})
-        console.print(f"  Branch: {git.get('branch', '')}  SHA: {git.get('sha', '')}")
         mesh = bundle.get("mesh", {})
-        console.print(f"  Claims: {len(mesh.get('open_claims', []))}  Agents: {len(mesh.get('active_agents', []))}")
+        lines = [
+            f"Capsule: [bold]{capsule_id}[/bold]",
+            f"  Agent: {bundle['agent_id']}",
+            f"  Task: {escape(bundle.get('task_desc', ''))}",
+            f"  Branch: {git.get('branch', '')}  SHA: {git.get('sha', '')}",
+            f"  Claims: {len(mesh.get('open_claims', []))}  Agents: {len(mesh.get('active_agents', []))}",
+        ]
         if bundle.get("sbar"):
-            console.print("  [dim]SBAR available (use --sbar to view)[/dim]")
+            lines.append("  [dim]SBAR available (use --sbar to view)[/dim]")
+        console.print("\n".join(lines))
 
 
 # -- Episode commands --
@@ -1057,7 +1355,7 @@ def episode_start(
         title=title, parent_episode_id=parent, data_dir=_get_data_dir(),
     )
     events.append_event(
-        EventKind.EPISODE_START,
+        models.EventKind.EPISODE_START,
         payload={"episode_id": ep_id, "title": title},
         data_dir=_get_data_dir(),
     )
@@ -1070,11 +1368,12 @@ def episode_start(
 def episode_current() -> None:
     """Show current episode."""
     _ensure_db()
-    ep_id = episodes.get_current_episode(_get_data_dir())
+    data_dir = _get_data_dir()
+    ep_id = episodes.get_current_episode(data_dir)
     if not ep_id:
         console.print("[dim]No active episode[/dim]")
         return
-    ep = db.get_episode(ep_id, _get_data_dir())
+    ep = db.get_episode(ep_id, data_dir)
     if ep:
         console.print(f"Episode [bold]{ep.episode_id}[/bold]")
         if ep.title:
@@ -1093,7 +1392,7 @@ def episode_end() -> None:
         console.print("[dim]No active episode to end[/dim]")
         return
     events.append_event(
-        EventKind.EPISODE_END,
+        models.EventKind.EPISODE_END,
         payload={"episode_id": ep_id},
         data_dir=_get_data_dir(),
     )
@@ -1161,7 +1460,7 @@ def wait(
         resource_type=rt, data_dir=_get_data_dir(),
     )
     events.append_event(
-        EventKind.WAIT, agent_id=agent_id,
+        models.EventKind.WAIT, agent_id=agent_id,
         payload={"resource": norm, "resource_type": rt.value, "priority": priority, "reason": reason},
         data_dir=_get_data_dir(),
     )
@@ -1189,7 +1488,7 @@ def steal(
     )
     if ok:
         events.append_event(
-            EventKind.STEAL, agent_id=agent_id,
+            models.EventKind.STEAL, agent_id=agent_id,
             payload={"resource": norm, "resource_type": rt.value, "reason": msg_text},
             data_dir=_get_data_dir(),
         )
@@ -1201,6 +1500,14 @@ def steal(
 
 # -- Commit command (git-weave bridge) --
 
+def _warm_witness() -> None:
+    """Import the optional witness module; _commit handles a missing one."""
+    try:
+        from . import witness  # noqa: F401
+    except ImportError:
+        pass
+
+
 @app.command(name="commit")
 def commit_cmd(
     message: str = typer.Option(..., "--message", "-m", help="Commit message"),
@@ -1219,50 +1526,79 @@ def commit_cmd(
 
     Exit codes: 0=success, 1=commit failed/nothing staged, 7=commit succeeded but Assay emission failed (partial success).
     """
-    _ensure_db()
-    # task_finish calls this function directly; normalize Typer OptionInfo defaults.
-    if not isinstance(emit_assay, bool):
-        emit_assay = False
-    if not isinstance(assay_command, str):
-        assay_command = ""
-    if not isinstance(assay_timeout_s, int):
-        assay_timeout_s = 30
-    if not isinstance(assay_required, bool):
-        assay_required = False
+    _commit(
+        message, agent, episode_trailer, run_tests, capsule, signoff,
+        emit_assay=emit_assay, assay_command=assay_command,
+        assay_timeout_s=assay_timeout_s, assay_required=assay_required,
+    )
 
+
+def _commit(
+    message: str,
+    agent: Optional[str],
+    episode_trailer: bool,
+    run_tests: Optional[str],
+    capsule: bool,
+    signoff: bool,
+    emit_assay: bool = False,
+    assay_command: str = "",
+    assay_timeout_s: int = 30,
+    assay_required: bool = False,
+    pending_events: list[Any] | None = None,
+) -> None:
+    """Body of ``agentmesh commit``.
+
+    With *pending_events* (task finish), the COMMIT event is queued there for
+    the caller's single log write -- unless an Assay command will run, which
+    must find the commit already logged.
+    """
+    _ensure_db()
+    data_dir = _get_data_dir()
     agent_id = agent or _auto_agent_id()
-    cwd = os.getcwd()
+    cwd = _proc_ctx().cwd
 
     if not gitbridge.is_git_repo(cwd):
         console.print("Not a git repository", style="red")
         raise typer.Exit(1)
 
-    staged_files = gitbridge.get_staged_files(cwd)
+    # Files, diff and patch hash come from one snapshot of the final staged
+    # state; with --run-tests only the cheap emptiness check runs up front.
+    snapshot = None if run_tests else gitbridge.get_staged_snapshot(cwd)
+    staged_files = snapshot[0] if snapshot else gitbridge.get_staged_files(cwd)
     if not staged_files:
         console.print("Nothing staged to commit", style="red")
         raise typer.Exit(1)
 
     if run_tests:
+        # The witness signer pulls in cryptography; import it while the test
+        # subprocess runs instead of after it.
+        warm = None
+        if episode_trailer:
+            warm = threading.Thread(target=_warm_witness, name="agentmesh-witness-warm", daemon=True)
+            warm.start()
         console.print(f"Running tests: {run_tests}")
         passed, summary = gitbridge.run_tests(run_tests, cwd=cwd)
+        if warm is not None:
+            warm.join()
         if not passed:
             console.print(f"Tests failed, aborting commit:\n{summary}", style="red")
             raise typer.Exit(1)
         console.print("[green]Tests passed[/green]")
-        # Recompute after tests (tests may have re-staged files)
-        staged_files = gitbridge.get_staged_files(cwd)
-
-    # Compute patch hash from final staged state (after any test mutations)
-    diff_text = gitbridge.get_staged_diff(cwd)
-    patch_hash = gitbridge.compute_patch_hash(diff_text)
-
-    # Build trailer -- witness if key available, else episode-only
-    trailer = ""
+        # Snapshot after tests (tests may have re-staged files)
+        snapshot = gitbridge.get_staged_snapshot(cwd)
+        staged_files = snapshot[0]
+    patch_hash = snapshot[2]
+
+    # Build trailer -- witness if key available, else episode-only. Both need
+    # an active episode, read once here and reused for the assay env below.
+    current_ep = episodes.get_current_episode(data_dir)
     witness_result = None
-    if episode_trailer:
+    if episode_trailer and current_ep:
         try:
             from . import witness as _witness
-            witness_result = _witness.create_and_sign(agent_id, cwd=cwd, data_dir=_get_data_dir())
+            witness_result = _witness.create_and_sign(
+                agent_id, cwd=cwd, data_dir=data_dir, snapshot=snapshot, episode_id=current_ep,
+            )
         except ImportError as exc:
             missing = getattr(exc, "name", "") or ""
             if missing.startswith("cryptography") or missing == "agentmesh.witness":
@@ -1271,12 +1607,8 @@ def commit_cmd(
             else:
                 raise
 
-    if witness_result:
-        _w, _w_hash, _sig, _kid, trailer = witness_result
-    elif episode_trailer:
-        ep_id = episodes.get_current_episode(_get_data_dir())
-        if ep_id:
-            trailer = f"{EPISODE_TRAILER_KEY}: {ep_id}"
+    trailer = witness_result[4] if witness_result else (
+        f"{EPISODE_TRAILER_KEY}: {current_ep}" if episode_trailer and current_ep else "")
 
     extra_args: list[str] | None = ["--signoff"] if signoff else None
     ok, sha, err = gitbridge.git_commit(message, extra_args=extra_args, trailer=trailer, cwd=cwd)
@@ -1284,33 +1616,29 @@ def commit_cmd(
         console.print(f"git commit failed: {err}", style="red")
         raise typer.Exit(1)
 
-    # Capsule if requested (before weave, so we can link capsule_id)
-    capsule_id = ""
-    if capsule:
-        cap = capsules.build_capsule(agent_id, task_desc=message, cwd=cwd, data_dir=_get_data_dir())
-        capsule_id = cap.capsule_id
-
-    # Weave event (linked to capsule if created)
-    evt = weaver.append_weave(
-        capsule_id=capsule_id,
-        git_commit_sha=sha,
-        git_patch_hash=patch_hash,
-        affected_symbols=staged_files,
-        data_dir=_get_data_dir(),
-    )
-
-    # Event log
-    events.append_event(
-        EventKind.COMMIT, agent_id=agent_id,
-        payload={
-            "sha": sha,
-            "patch_hash": patch_hash,
-            "files": staged_files,
-            "weave_event_id": evt.event_id,
-            "witness_hash": witness_result[1] if witness_result else "",
-        },
-        data_dir=_get_data_dir(),
+    # Capsule if requested (before weave, so we can link capsule_id). Its git
+    # and mesh state is gathered before the board transaction, and the bundle
+    # file is written only once the capsule and weave rows have committed.
+    prepared = (
+        capsules.prepare_capsule(agent_id, task_desc=message, cwd=cwd, data_dir=data_dir)
+        if capsule else None
     )
+    with db.transaction(data_dir):
+        capsule_id = ""
+        if prepared:
+            db.save_capsule(prepared[0], data_dir)
+            capsule_id = prepared[0].capsule_id
+
+        # Weave event (linked to capsule if created)
+        evt = weaver.append_weave(
+            capsule_id=capsule_id,
+            git_commit_sha=sha,
+            git_patch_hash=patch_hash,
+            affected_symbols=staged_files,
+            data_dir=data_dir,
+        )
+    if prepared:
+        capsules.write_bundle(*prepared, data_dir=data_dir)
 
     policy = _load_policy(Path(cwd))
     assay_cfg = _policy_get(policy, ["assay"], {})
@@ -1323,10 +1651,28 @@ def commit_cmd(
     effective_assay_timeout = assay_timeout_s if assay_timeout_s > 0 else max(cfg_timeout_s, 1)
     assay_hard_fail = assay_required or bool(assay_cfg.get("required", False))
 
+    # Event log
+    commit_event = (
+        models.EventKind.COMMIT, agent_id,
+        {
+            "sha": sha,
+            "patch_hash": patch_hash,
+            "files": staged_files,
+            "weave_event_id": evt.event_id,
+            "witness_hash": witness_result[1] if witness_result else "",
+        },
+    )
+    if pending_events is not None and not assay_enabled:
+        pending_events.append(commit_event)
+    else:
+        events.append_events([commit_event], data_dir=data_dir)
+
     if assay_enabled:
+        import json
+
         if not assay_cmd:
             assay_cmd = "assay receipt emit"
-        episode_id = episodes.get_current_episode(_get_data_dir()) or ""
+        episode_id = current_ep
         env = {
             **os.environ,
             "AGENTMESH_COMMIT_SHA": sha,
@@ -1362,7 +1708,7 @@ def commit_cmd(
 
         assay_ok = returncode == 0 and not assay_error
         events.append_event(
-            EventKind.ASSAY_RECEIPT,
+            models.EventKind.ASSAY_RECEIPT,
             agent_id=agent_id,
             payload={
                 "sha": sha,
@@ -1373,7 +1719,7 @@ def commit_cmd(
                 "stderr": assay_stderr[-1000:],
                 "error": assay_error,
             },
-            data_dir=_get_data_dir(),
+            data_dir=data_dir,
         )
 
         if assay_ok:
@@ -1433,21 +1779,21 @@ def task_start(
 ) -> None:
     """Start a task: ensure an episode exists and optionally claim resources."""
     _ensure_db()
+    data_dir = _get_data_dir()
     agent_id = agent or _auto_agent_id()
     _ensure_agent_exists(agent_id)
-    policy = _load_policy(Path.cwd())
+    policy = _load_policy()
     policy_ttl = _policy_get(policy, ["claims", "ttl_seconds"], 1800)
     effective_ttl = ttl if ttl is not None else (policy_ttl if isinstance(policy_ttl, int) else 1800)
 
     # Bridge to orchestrator if --orch-task is provided
     if orch_task:
-        from . import orchestrator
-        orch_t = db.get_task(orch_task, _get_data_dir())
+        orch_t = db.get_task(orch_task, data_dir)
         if orch_t is None:
             console.print(f"Orchestrator task {orch_task} not found", style="red")
             raise typer.Exit(1)
         try:
-            orchestrator.transition_task(orch_task, TaskState.RUNNING, agent_id=agent_id, data_dir=_get_data_dir())
+            orchestrator.transition_task(orch_task, models.TaskState.RUNNING, agent_id=agent_id, data_dir=data_dir)
         except orchestrator.TransitionError as e:
             console.print(str(e), style="red")
             raise typer.Exit(1)
@@ -1455,38 +1801,22 @@ def task_start(
         # Use the orchestrator task's episode if available
         if orch_t.episode_id:
             ep_id = orch_t.episode_id
-            episodes.set_current_episode(ep_id, _get_data_dir())
+            episodes.set_current_episode(ep_id, data_dir)
             console.print(f"Using episode [bold]{ep_id}[/bold] (from orch task)")
             if not claim_resources:
                 console.print("[dim]No claims requested[/dim]")
             else:
-                had_conflict = False
-                for resource in claim_resources:
-                    ok, clm, conflicts = claims.make_claim(
-                        agent_id, resource, intent=ClaimIntent.EDIT,
-                        ttl_s=effective_ttl, reason=f"task:{title}",
-                        data_dir=_get_data_dir(),
-                    )
-                    if ok:
-                        rt_label = clm.resource_type.value.upper() if clm.resource_type.value != "file" else ""
-                        prefix = f"[{rt_label}] " if rt_label else ""
-                        console.print(f"Claimed {prefix}[bold]{clm.path}[/bold] (ttl={effective_ttl}s)")
-                    else:
-                        had_conflict = True
-                        console.print(f"CONFLICT on [bold]{resource}[/bold]:", style="red bold")
-                        console.print(claims.format_conflict(conflicts))
-                if had_conflict:
-                    raise typer.Exit(1)
+                _task_claim_resources(agent_id, claim_resources, effective_ttl, title, ep_id, data_dir)
             return
 
-    ep_id = episodes.get_current_episode(_get_data_dir()) if reuse_current else ""
+    ep_id = episodes.get_current_episode(data_dir) if reuse_current else ""
     created_new = False
     if not ep_id:
-        ep_id = episodes.start_episode(title=title, data_dir=_get_data_dir())
+        ep_id = episodes.start_episode(title=title, data_dir=data_dir)
         events.append_event(
-            EventKind.EPISODE_START,
+            models.EventKind.EPISODE_START,
             payload={"episode_id": ep_id, "title": title},
-            data_dir=_get_data_dir(),
+            data_dir=data_dir,
         )
         created_new = True
 
@@ -1499,20 +1829,20 @@ def task_start(
         console.print("[dim]No claims requested[/dim]")
         return
 
+    _task_claim_resources(agent_id, claim_resources, effective_ttl, title, ep_id, data_dir)
+
+
+def _task_claim_resources(
+    agent_id: str, resources: list[str], ttl_s: int, title: str, episode_id: str, data_dir: Path,
+) -> None:
+    """Claim every --claim resource of `task start` in one transaction, then report."""
+    specs = [(resource, models.ClaimIntent.EDIT, ttl_s, f"task:{title}") for resource in resources]
+    results = claims.make_claims_bulk(agent_id, specs, episode_id=episode_id, data_dir=data_dir)
     had_conflict = False
-    for resource in claim_resources:
-        ok, clm, conflicts = claims.make_claim(
-            agent_id,
-            resource,
-            intent=ClaimIntent.EDIT,
-            ttl_s=effective_ttl,
-            reason=f"task:{title}",
-            data_dir=_get_data_dir(),
-        )
+    for resource, (ok, clm, conflicts) in zip(resources, results):
         if ok:
-            rt_label = clm.resource_type.value.upper() if clm.resource_type.value != "file" else ""
-            prefix = f"[{rt_label}] " if rt_label else ""
-            console.print(f"Claimed {prefix}[bold]{clm.path}[/bold] (ttl={effective_ttl}s)")
+            prefix = _claim_label_prefixes()[clm.resource_type]
+            console.print(f"Claimed {prefix}[bold]{clm.path}[/bold] (ttl={ttl_s}s)")
         else:
             had_conflict = True
             console.print(f"CONFLICT on [bold]{resource}[/bold]:", style="red bold")
@@ -1547,61 +1877,92 @@ def task_finish(
 ) -> None:
     """Finish a task: commit with provenance, optionally release claims and end episode."""
     _ensure_db()
+    data_dir = _get_data_dir()
     agent_id = agent or _auto_agent_id()
-    policy = _load_policy(Path.cwd())
-    policy_finish = _policy_get(policy, ["task_finish"], {})
+    pf = _policy_get(_load_policy(), ["task_finish"], {})
+    if not isinstance(pf, dict):
+        pf = {}
+
+    p_test = pf.get("run_tests")
+    p_capsule = pf.get("capsule")
+    p_signoff = pf.get("signoff")
+    p_release_all = pf.get("release_all")
+    p_end_episode = pf.get("end_episode")
 
     effective_run_tests = run_tests
-    if effective_run_tests is None and isinstance(policy_finish, dict):
-        p_test = policy_finish.get("run_tests")
-        if isinstance(p_test, str) and p_test.strip():
-            effective_run_tests = p_test
-
-    def _bool_default(value: Optional[bool], key: str, fallback: bool) -> bool:
-        if value is not None:
-            return value
-        if isinstance(policy_finish, dict) and isinstance(policy_finish.get(key), bool):
-            return policy_finish[key]
-        return fallback
-
-    effective_capsule = _bool_default(capsule, "capsule", True)
-    effective_signoff = _bool_default(signoff, "signoff", False)
-    effective_release_all = _bool_default(release_all, "release_all", True)
-    effective_end_episode = _bool_default(end_episode, "end_episode", True)
-
-    commit_cmd(
-        message=message,
-        agent=agent_id,
-        episode_trailer=True,
-        run_tests=effective_run_tests,
-        capsule=effective_capsule,
-        signoff=effective_signoff,
+    if effective_run_tests is None and isinstance(p_test, str) and p_test.strip():
+        effective_run_tests = p_test
+    effective_capsule = capsule if capsule is not None else (
+        p_capsule if isinstance(p_capsule, bool) else True)
+    effective_signoff = signoff if signoff is not None else (
+        p_signoff if isinstance(p_signoff, bool) else False)
+    effective_release_all = release_all if release_all is not None else (
+        p_release_all if isinstance(p_release_all, bool) else True)
+    effective_end_episode = end_episode if end_episode is not None else (
+        p_end_episode if isinstance(p_end_episode, bool) else True)
+
+    # The COMMIT event and the post-commit bookkeeping events are queued and
+    # appended in one log write once the bookkeeping transaction commits.
+    pending: list[Any] = []
+    _commit(
+        message, agent_id, episode_trailer=True, run_tests=effective_run_tests,
+        capsule=effective_capsule, signoff=effective_signoff, pending_events=pending,
     )
+    committed = len(pending)
+    try:
+        _task_finish_bookkeeping(
+            agent_id, orch_task, effective_release_all, effective_end_episode, data_dir, pending,
+        )
+    except BaseException:
+        # Bookkeeping rolled back; the commit itself still gets logged.
+        events.append_events(pending[:committed], data_dir=data_dir)
+        raise
+    events.append_events(pending, data_dir=data_dir)
+
+
+def _task_finish_bookkeeping(
+    agent_id: str,
+    orch_task: str | None,
+    release_all: bool,
+    end_episode: bool,
+    data_dir: Path | None,
+    pending: list[Any],
+) -> None:
+    """task finish's post-commit steps, in one board transaction; events go to *pending*.
 
-    # Bridge to orchestrator: transition to PR_OPEN after successful commit
-    if orch_task:
-        from . import orchestrator
-        try:
-            orchestrator.transition_task(orch_task, TaskState.PR_OPEN, agent_id=agent_id, data_dir=_get_data_dir())
-            console.print(f"Orch task [bold]{orch_task}[/bold] -> pr_open")
-        except orchestrator.TransitionError as e:
-            console.print(f"Orch transition warning: {e}", style="yellow")
-
-    if effective_release_all:
-        released = claims.release(agent_id, release_all=True, data_dir=_get_data_dir())
-        console.print(f"Released {released} claim(s)")
+    Only DB writes run inside the transaction. The current_episode pointer
+    is cleared and the status lines are printed once it has committed.
+    """
+    lines: list[tuple[str, str | None]] = []
+    ep_id = ""
+    with db.transaction(data_dir):
+        # Bridge to orchestrator: transition to PR_OPEN after successful commit
+        if orch_task:
+            try:
+                orchestrator.transition_task(
+                    orch_task, models.TaskState.PR_OPEN, agent_id=agent_id,
+                    data_dir=data_dir, pending_events=pending,
+                )
+                lines.append((f"Orch task [bold]{orch_task}[/bold] -> pr_open", None))
+            except orchestrator.TransitionError as e:
+                lines.append((f"Orch transition warning: {e}", "yellow"))
+
+        if release_all:
+            released = claims.release(agent_id, release_all=True, data_dir=data_dir, pending_events=pending)
+            lines.append((f"Released {released} claim(s)", None))
+
+        if end_episode:
+            ep_id = episodes.end_episode(data_dir, clear_current=False)
+            if ep_id:
+                pending.append((models.EventKind.EPISODE_END, "", {"episode_id": ep_id}))
+                lines.append((f"Episode [bold]{ep_id}[/bold] ended", None))
+            else:
+                lines.append(("[dim]No active episode to end[/dim]", None))
 
-    if effective_end_episode:
-        ep_id = episodes.end_episode(_get_data_dir())
-        if ep_id:
-            events.append_event(
-                EventKind.EPISODE_END,
-                payload={"episode_id": ep_id},
-                data_dir=_get_data_dir(),
-            )
-            console.print(f"Episode [bold]{ep_id}[/bold] ended")
-        else:
-            console.print("[dim]No active episode to end[/dim]")
+    if ep_id:
+        episodes.clear_current_episode(data_dir)
+    for text, style in lines:
+        console.print(text, style=style)
 
 
 # -- Bridge commands --
@@ -1640,7 +2001,7 @@ def bridge_emit(
         "reason": result.reason,
         "ccoi_envelope": result.envelope,
     }
-    console.print(json.dumps(output, indent=2))
+    _print_json(output, pretty=True)
 
 
 # -- Weave commands --
@@ -1660,7 +2021,6 @@ def weave_record(
 ) -> None:
     """Record a provenance weave event."""
     _ensure_db()
-    from . import weaver
     syms = [s.strip() for s in symbols.split(",")] if symbols else []
     evt = weaver.append_weave(
         capsule_id=capsule_id, git_commit_sha=commit,
@@ -1675,13 +2035,12 @@ def weave_record(
 def weave_verify() -> None:
     """Verify the weave hash chain."""
     _ensure_db()
-    from . import weaver
     valid, err = weaver.verify_weave(_get_data_dir())
     if valid:
         console.print("[green]Weave chain valid[/green]")
     else:
         events.append_event(
-            EventKind.WEAVE_CHAIN_BREAK,
+            models.EventKind.WEAVE_CHAIN_BREAK,
             agent_id=_auto_agent_id(),
             payload={"error": err},
             data_dir=_get_data_dir(),
@@ -1696,13 +2055,13 @@ def weave_trace(
 ) -> None:
     """Trace provenance for a file."""
     _ensure_db()
-    from . import weaver
     evts = weaver.trace_file(path, data_dir=_get_data_dir())
     if not evts:
         console.print(f"[dim]No weave events for {path}[/dim]")
         return
-    for e in evts:
-        console.print(f"  {e.event_id}  commit={e.git_commit_sha or '-'}  capsule={e.capsule_id or '-'}")
+    console.print("\n".join(
+        f"  {e.event_id}  commit={e.git_commit_sha or '-'}  capsule={e.capsule_id or '-'}" for e in evts
+    ))
 
 
 @weave_app.command(name="export")
@@ -1712,13 +2071,11 @@ def weave_export(
 ) -> None:
     """Export weave events."""
     _ensure_db()
-    from . import weaver
     if md:
         output = weaver.export_weave_md(episode_id=episode, data_dir=_get_data_dir())
         console.print(output)
     else:
-        evts = db.list_weave_events(_get_data_dir(), episode_id=episode)
-        console.print(json.dumps([e.model_dump() for e in evts], indent=2))
+        _print_json(db.list_weave_event_dicts(_get_data_dir(), episode_id=episode), pretty=True)
 
 
 # -- Orchestrator commands --
@@ -1727,6 +2084,11 @@ orch_app = typer.Typer(help="Task orchestrator lifecycle commands.")
 app.add_typer(orch_app, name="orch")
 
 
+def _parse_task_state(value: str) -> Any:
+    """TaskState for a --to/--state value; unknown values exit 1 with the valid list."""
+    return _parse_enum("TaskState", value, "state")
+
+
 @orch_app.command(name="create")
 def orch_create(
     title: str = typer.Option(..., "--title", "-t", help="Task title"),
@@ -1736,17 +2098,17 @@ def orch_create(
     verify_tests: str = typer.Option("", "--verify-tests", help="Independent test verification command for harvest"),
     depends_on: list[str] = typer.Option([], "--depends-on", "-p", help="Dependency task ID (repeatable)"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Create a new orchestrator task (starts in PLANNED state)."""
     _ensure_db()
-    from . import orchestrator
     meta: dict[str, Any] = {}
     if max_cost_usd > 0:
         meta["max_cost_usd"] = max_cost_usd
     if verify_tests.strip():
         meta["verify_tests_command"] = verify_tests.strip()
     dep_list = [d.strip() for d in depends_on if d.strip()]
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         task = orchestrator.create_task(
             title=title,
             description=description,
@@ -1756,14 +2118,14 @@ def orch_create(
             data_dir=_get_data_dir(),
         )
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "task_id": task.task_id,
             "state": task.state.value,
             "title": task.title,
             "max_cost_usd": task.meta.get("max_cost_usd", 0.0),
             "verify_tests_command": task.meta.get("verify_tests_command", ""),
             "depends_on": task.meta.get("depends_on", []),
-        }, indent=2))
+        }, pretty)
     else:
         console.print(f"Created [bold]{task.task_id}[/bold]  state={task.state.value}")
 
@@ -1774,28 +2136,28 @@ def orch_assign(
     agent: str = typer.Option("", "--agent", "-a", help="Agent ID (auto-detected if omitted)"),
     branch: str = typer.Option("", "--branch", "-b", help="Git branch"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Assign a PLANNED task to an agent."""
     _ensure_db()
-    from . import orchestrator
     agent_id = agent or _auto_agent_id()
     _ensure_agent_exists(agent_id)
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         try:
             task = orchestrator.assign_task(task_id, agent_id, branch=branch, data_dir=_get_data_dir())
         except orchestrator.TransitionError as e:
             if json_out:
-                console.print(json.dumps({"error": str(e)}, indent=2))
+                _print_json({"error": str(e)}, pretty)
             else:
                 console.print(str(e), style="red")
             raise typer.Exit(1)
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "task_id": task.task_id,
             "state": task.state.value,
             "assigned_agent_id": agent_id,
             "branch": task.branch,
-        }, indent=2))
+        }, pretty)
     else:
         console.print(f"Assigned [bold]{task.task_id}[/bold] to {agent_id}  state={task.state.value}")
 
@@ -1805,12 +2167,12 @@ def orch_depends(
     task_id: str = typer.Argument(..., help="Task ID"),
     on: list[str] = typer.Option([], "--on", "-o", help="Dependency task ID (repeatable)"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Set dependencies for a task and validate the graph is acyclic."""
     _ensure_db()
-    from . import orchestrator
 
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         try:
             task = orchestrator.set_task_dependencies(
                 task_id,
@@ -1819,14 +2181,14 @@ def orch_depends(
             )
         except orchestrator.TransitionError as e:
             if json_out:
-                console.print(json.dumps({"error": str(e)}, indent=2))
+                _print_json({"error": str(e)}, pretty)
             else:
                 console.print(str(e), style="red")
             raise typer.Exit(1)
 
     deps = task.meta.get("depends_on", []) if isinstance(task.meta, dict) else []
     if json_out:
-        console.print(json.dumps({"task_id": task.task_id, "depends_on": deps}, indent=2))
+        _print_json({"task_id": task.task_id, "depends_on": deps}, pretty)
     else:
         rendered = ", ".join(deps) if deps else "(none)"
         console.print(f"Dependencies for [bold]{task.task_id}[/bold]: {rendered}")
@@ -1839,33 +2201,28 @@ def orch_advance(
     reason: str = typer.Option("", "--reason", "-r", help="Reason for transition"),
     pr_url: str = typer.Option("", "--pr-url", help="PR URL (for pr_open transition)"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Advance a task to the next state."""
+    to_state = _parse_task_state(to)
     _ensure_db()
-    from . import orchestrator
-    try:
-        to_state = TaskState(to)
-    except ValueError:
-        valid = ", ".join(s.value for s in TaskState)
-        console.print(f"Invalid state '{to}'. Valid: {valid}", style="red")
-        raise typer.Exit(1)
     kwargs: dict[str, Any] = {}
     if pr_url:
         kwargs["pr_url"] = pr_url
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         try:
             task = orchestrator.advance_task(task_id, to_state, reason=reason, data_dir=_get_data_dir(), **kwargs)
         except orchestrator.TransitionError as e:
             if json_out:
-                console.print(json.dumps({"error": str(e)}, indent=2))
+                _print_json({"error": str(e)}, pretty)
             else:
                 console.print(str(e), style="red")
             raise typer.Exit(1)
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "task_id": task.task_id,
             "state": task.state.value,
-        }, indent=2))
+        }, pretty)
     else:
         console.print(f"Advanced [bold]{task.task_id}[/bold] to {task.state.value}")
 
@@ -1875,21 +2232,21 @@ def orch_abort(
     task_id: str = typer.Argument(..., help="Task ID"),
     reason: str = typer.Option("", "--reason", "-r", help="Abort reason"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Abort a task from any non-terminal state."""
     _ensure_db()
-    from . import orchestrator
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         try:
             task = orchestrator.abort_task(task_id, reason=reason, data_dir=_get_data_dir())
         except orchestrator.TransitionError as e:
             if json_out:
-                console.print(json.dumps({"error": str(e)}, indent=2))
+                _print_json({"error": str(e)}, pretty)
             else:
                 console.print(str(e), style="red")
             raise typer.Exit(1)
     if json_out:
-        console.print(json.dumps({"task_id": task.task_id, "state": task.state.value}, indent=2))
+        _print_json({"task_id": task.task_id, "state": task.state.value}, pretty)
     else:
         console.print(f"Aborted [bold]{task.task_id}[/bold]")
 
@@ -1898,14 +2255,15 @@ def orch_abort(
 def orch_show(
     task_id: str = typer.Argument(..., help="Task ID"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Show task details and attempts."""
     _ensure_db()
-    task = db.get_task(task_id, _get_data_dir())
-    if task is None:
+    found = db.get_task_with_attempts(task_id, _get_data_dir())
+    if found is None:
         console.print(f"Task {task_id} not found", style="red")
         raise typer.Exit(1)
-    attempts = db.list_attempts(task_id, _get_data_dir())
+    task, attempts = found
     if json_out:
         data = {
             "task_id": task.task_id,
@@ -1924,20 +2282,23 @@ def orch_show(
                 for a in attempts
             ],
         }
-        console.print(json.dumps(data, indent=2))
+        _print_json(data, pretty)
     else:
-        console.print(f"[bold]{task.task_id}[/bold]  {task.title}")
-        console.print(f"  state={task.state.value}  agent={task.assigned_agent_id or '-'}  branch={task.branch or '-'}")
+        lines = [
+            f"[bold]{task.task_id}[/bold]  {task.title}",
+            f"  state={task.state.value}  agent={task.assigned_agent_id or '-'}  branch={task.branch or '-'}",
+        ]
         if task.pr_url:
-            console.print(f"  pr={task.pr_url}")
+            lines.append(f"  pr={task.pr_url}")
         if task.description:
-            console.print(f"  desc={task.description}")
-        console.print(f"  created={task.created_at[:19]}  updated={task.updated_at[:19]}")
+            lines.append(f"  desc={task.description}")
+        lines.append(f"  created={task.created_at[:19]}  updated={task.updated_at[:19]}")
         if attempts:
-            console.print(f"  attempts ({len(attempts)}):")
+            lines.append(f"  attempts ({len(attempts)}):")
             for a in attempts:
                 outcome = a.outcome or "in_progress"
-                console.print(f"    #{a.attempt_number} {a.agent_id} {outcome}")
+                lines.append(f"    #{a.attempt_number} {a.agent_id} {outcome}")
+        console.print("\n".join(lines))
 
 
 @orch_app.command(name="freeze")
@@ -1945,25 +2306,27 @@ def orch_freeze(
     off: bool = typer.Option(False, "--off", help="Disable freeze instead of enabling"),
     reason: str = typer.Option("", "--reason", "-r", help="Reason for freeze/unfreeze"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Toggle spawn freeze for orchestrator workers."""
     _ensure_db()
-    from . import orch_control
+    data_dir = _get_data_dir()
 
     enabled = not off
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         owner = orch_control.make_owner(_auto_agent_id())
-        orch_control.set_frozen(enabled, owner=owner, reason=reason, data_dir=_get_data_dir())
-        weaver.append_weave(trace_id="orch:freeze", data_dir=_get_data_dir())
+        with db.transaction(data_dir):
+            orch_control.set_frozen(enabled, owner=owner, reason=reason, data_dir=data_dir)
+            weaver.append_weave(trace_id="orch:freeze", data_dir=data_dir)
         events.append_event(
-            kind=EventKind.ORCH_FREEZE,
+            kind=models.EventKind.ORCH_FREEZE,
             agent_id=owner,
             payload={"frozen": enabled, "reason": reason},
-            data_dir=_get_data_dir(),
+            data_dir=data_dir,
         )
 
     if json_out:
-        console.print(json.dumps({"frozen": enabled, "reason": reason}, indent=2))
+        _print_json({"frozen": enabled, "reason": reason}, pretty)
     else:
         state = "enabled" if enabled else "disabled"
         console.print(f"Orchestrator freeze {state}")
@@ -1974,25 +2337,27 @@ def orch_lock_merges(
     off: bool = typer.Option(False, "--off", help="Disable merge lock instead of enabling"),
     reason: str = typer.Option("", "--reason", "-r", help="Reason for lock/unlock"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Toggle merge transition lock (blocks REVIEW_PASS -> MERGED)."""
     _ensure_db()
-    from . import orch_control
+    data_dir = _get_data_dir()
 
     enabled = not off
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         owner = orch_control.make_owner(_auto_agent_id())
-        orch_control.set_merges_locked(enabled, owner=owner, reason=reason, data_dir=_get_data_dir())
-        weaver.append_weave(trace_id="orch:lock_merges", data_dir=_get_data_dir())
+        with db.transaction(data_dir):
+            orch_control.set_merges_locked(enabled, owner=owner, reason=reason, data_dir=data_dir)
+            weaver.append_weave(trace_id="orch:lock_merges", data_dir=data_dir)
         events.append_event(
-            kind=EventKind.ORCH_LOCK_MERGES,
+            kind=models.EventKind.ORCH_LOCK_MERGES,
             agent_id=owner,
             payload={"merges_locked": enabled, "reason": reason},
-            data_dir=_get_data_dir(),
+            data_dir=data_dir,
         )
 
     if json_out:
-        console.print(json.dumps({"merges_locked": enabled, "reason": reason}, indent=2))
+        _print_json({"merges_locked": enabled, "reason": reason}, pretty)
     else:
         state = "enabled" if enabled else "disabled"
         console.print(f"Merge lock {state}")
@@ -2003,63 +2368,63 @@ def orch_abort_all(
     reason: str = typer.Option("emergency abort-all", "--reason", "-r", help="Abort reason"),
     keep_worktrees: bool = typer.Option(False, "--keep-worktrees", help="Do not remove worker worktrees"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Abort all active workers and all non-terminal tasks."""
     _ensure_db()
-    from . import orch_control, orchestrator, spawner
+    data_dir = _get_data_dir()
 
     aborted_spawns: list[str] = []
     aborted_tasks: list[str] = []
     lock_cleared = 0
 
-    with _orchestrator_lease(json_out=json_out, force=True):
-        active_spawns = spawner.list_spawns(active_only=True, data_dir=_get_data_dir())
-        for rec in active_spawns:
-            try:
-                spawner.abort(
-                    rec.spawn_id,
-                    reason=reason,
-                    cleanup_worktree=not keep_worktrees,
-                    data_dir=_get_data_dir(),
-                )
-                aborted_spawns.append(rec.spawn_id)
-            except spawner.SpawnError:
-                continue
+    # Snapshot targets before taking the lease; the batch aborts re-check
+    # spawn/task state inside their own transactions, so a stale snapshot
+    # only means already-finished entries are skipped.
+    spawn_ids = [
+        rec.spawn_id
+        for rec in spawner.list_spawns(active_only=True, data_dir=data_dir)
+    ]
+    task_ids = [
+        t.task_id
+        for t in db.list_tasks(data_dir=data_dir, limit=1000)
+        if t.state not in orchestrator.TERMINAL_STATES
+    ]
 
-        tasks = db.list_tasks(data_dir=_get_data_dir(), limit=1000)
-        for task in tasks:
-            if task.state in orchestrator.TERMINAL_STATES:
-                continue
-            try:
-                orchestrator.abort_task(
-                    task.task_id,
-                    reason=reason,
-                    agent_id=task.assigned_agent_id,
-                    data_dir=_get_data_dir(),
-                )
-                aborted_tasks.append(task.task_id)
-            except orchestrator.TransitionError:
-                continue
+    with _orchestrator_lease(json_out=json_out, pretty=pretty, force=True):
+        aborted_spawns = [
+            rec.spawn_id for rec in spawner.abort_many(
+                spawn_ids,
+                reason=reason,
+                cleanup_worktree=not keep_worktrees,
+                data_dir=data_dir,
+            )
+        ]
+        aborted_tasks = orchestrator.abort_tasks_many(
+            task_ids,
+            reason=reason,
+            data_dir=data_dir,
+        )
 
-        lock_cleared = orch_control.clear_lease(data_dir=_get_data_dir())
-        weaver.append_weave(trace_id="orch:abort_all", data_dir=_get_data_dir())
+        lock_cleared = orch_control.clear_lease(data_dir=data_dir)
+        weaver.append_weave(trace_id="orch:abort_all", data_dir=data_dir)
         events.append_event(
-            kind=EventKind.ORCH_ABORT_ALL,
+            kind=models.EventKind.ORCH_ABORT_ALL,
             payload={
                 "reason": reason,
                 "aborted_spawns": aborted_spawns,
                 "aborted_tasks": aborted_tasks,
                 "lock_cleared": lock_cleared,
             },
-            data_dir=_get_data_dir(),
+            data_dir=data_dir,
         )
 
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "aborted_spawns": aborted_spawns,
             "aborted_tasks": aborted_tasks,
             "lock_cleared": lock_cleared,
-        }, indent=2))
+        }, pretty)
     else:
         console.print(f"Aborted spawns: {len(aborted_spawns)}")
         console.print(f"Aborted tasks: {len(aborted_tasks)}")
@@ -2074,25 +2439,34 @@ def orch_watch(
 ) -> None:
     """Stream orchestration-relevant events."""
     _ensure_db()
+    data_dir = _get_data_dir()
     from . import events as eventlog
 
     interested = {
-        EventKind.TASK_TRANSITION.value,
-        EventKind.WORKER_SPAWN.value,
-        EventKind.WORKER_DONE.value,
-        EventKind.COST_EXCEEDED.value,
-        EventKind.ORCH_FREEZE.value,
-        EventKind.ORCH_LOCK_MERGES.value,
-        EventKind.ORCH_ABORT_ALL.value,
-        EventKind.ORCH_LEASE_RENEW.value,
-        EventKind.ADAPTER_LOAD.value,
-        EventKind.WEAVE_CHAIN_BREAK.value,
+        models.EventKind.TASK_TRANSITION.value,
+        models.EventKind.WORKER_SPAWN.value,
+        models.EventKind.WORKER_DONE.value,
+        models.EventKind.COST_EXCEEDED.value,
+        models.EventKind.ORCH_FREEZE.value,
+        models.EventKind.ORCH_LOCK_MERGES.value,
+        models.EventKind.ORCH_ABORT_ALL.value,
+        models.EventKind.ORCH_LEASE_RENEW.value,
+        models.EventKind.ADAPTER_LOAD.value,
+        models.EventKind.WEAVE_CHAIN_BREAK.value,
     }
 
     since = 0
+    signature: tuple[int, int] | None = None
+    period_ns = int(max(interval_s, 0.1) * 1_000_000_000)
     try:
         while True:
-            new_events = eventlog.read_events(data_dir=_get_data_dir(), since_seq=since)
+            next_tick_ns = time.monotonic_ns() + period_ns
+            current = eventlog.log_signature(data_dir)
+            if current == signature:
+                new_events = []
+            else:
+                signature = current
+                new_events = eventlog.read_events(data_dir=data_dir, since_seq=since)
             for evt in new_events:
                 since = max(since, evt.seq)
                 kind = evt.kind.value if hasattr(evt.kind, "value") else str(evt.kind)
@@ -2106,14 +2480,22 @@ def orch_watch(
                     "payload": evt.payload,
                 }
                 if json_out:
-                    print(json.dumps(row, separators=(",", ":")))
+                    _print_json(row)
                 else:
+                    # Plain text: skip Rich markup parsing and highlighting per row.
                     console.print(
-                        f"{row['seq']:>6}  {row['ts'][:19]}  {row['kind']:16}  {row['agent_id'] or '-'}"
+                        f"{row['seq']:>6}  {row['ts'][:19]}  {row['kind']:16}  {row['agent_id'] or '-'}",
+                        markup=False,
+                        highlight=False,
                     )
             if once:
                 break
-            time.sleep(max(interval_s, 0.1))
+            # Wake early as soon as the log is appended to.
+            eventlog.wait_for_change(
+                signature,
+                timeout_s=max(0, next_tick_ns - time.monotonic_ns()) / 1_000_000_000,
+                data_dir=data_dir,
+            )
     except KeyboardInterrupt:
         return
 
@@ -2130,9 +2512,9 @@ def orch_run(
 ) -> None:
     """Run orchestrator control loop with auto lease renewal."""
     _ensure_db()
-    from . import watchdog
 
     loops = 0
+    period_ns = int(max(interval_s, 0.1) * 1_000_000_000)
     try:
         with _orchestrator_lease_heartbeat(
             json_out=json_out,
@@ -2142,10 +2524,11 @@ def orch_run(
             if not json_out:
                 console.print(f"Runner lease owner: {owner}")
             while True:
+                next_tick_ns = time.monotonic_ns() + period_ns
                 if not lease_state.get("renew_ok", True):
                     msg = lease_state.get("error", "lease renewal failed")
                     if json_out:
-                        print(json.dumps({"error": "lease_renew_failed", "detail": msg}, separators=(",", ":")))
+                        _print_json({"error": "lease_renew_failed", "detail": msg})
                     else:
                         console.print(f"Lease renewal failed: {msg}", style="red")
                     raise typer.Exit(1)
@@ -2165,19 +2548,21 @@ def orch_run(
                     "cost_exceeded_tasks": result.cost_exceeded_tasks,
                 }
                 if json_out:
-                    print(json.dumps(row, separators=(",", ":")))
+                    _print_json(row)
                 else:
                     console.print(
                         f"loop={row['loop']} clean={row['clean']} "
                         f"stale={len(row['stale_agents'])} aborted={len(row['aborted_tasks'])} "
                         f"harvested={len(row['harvested_spawns'])} timeout={len(row['timed_out_spawns'])} "
-                        f"cost={len(row['cost_exceeded_tasks'])}"
+                        f"cost={len(row['cost_exceeded_tasks'])}",
+                        markup=False,
+                        highlight=False,
                     )
 
                 loops += 1
                 if max_iterations > 0 and loops >= max_iterations:
                     break
-                time.sleep(max(interval_s, 0.1))
+                _sleep_until(next_tick_ns)
     except KeyboardInterrupt:
         return
 
@@ -2187,16 +2572,16 @@ def orch_lease_renew(
     owner: str = typer.Option("", "--owner", "-o", help="Existing orchestrator owner id"),
     ttl: int = typer.Option(300, "--ttl", help="Lease TTL seconds"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Renew orchestrator lease for long-running orchestrator daemons."""
     _ensure_db()
-    from . import orch_control
 
     if not owner:
         owner = os.environ.get("AGENTMESH_ORCH_OWNER", "").strip()
     if not owner:
         if json_out:
-            console.print(json.dumps({"error": "owner_required"}, indent=2))
+            _print_json({"error": "owner_required"}, pretty)
         else:
             console.print("Owner is required (--owner or AGENTMESH_ORCH_OWNER)", style="red")
         raise typer.Exit(1)
@@ -2208,28 +2593,28 @@ def orch_lease_renew(
     )
     if not ok:
         if json_out:
-            console.print(json.dumps({
+            _print_json({
                 "error": "orchestration_lock_conflict",
                 "resource": "LOCK:orchestration",
                 "holders": [{"agent_id": c.agent_id, "expires_at": c.expires_at} for c in conflicts],
-            }, indent=2))
+            }, pretty)
         else:
             console.print("Lease renewal failed due to lock conflict", style="red")
         raise typer.Exit(1)
 
     events.append_event(
-        kind=EventKind.ORCH_LEASE_RENEW,
+        kind=models.EventKind.ORCH_LEASE_RENEW,
         agent_id=owner,
         payload={"op": "lease_renew", "expires_at": claim.expires_at, "ttl_s": ttl},
         data_dir=_get_data_dir(),
     )
 
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "owner": owner,
             "expires_at": claim.expires_at,
             "ttl_s": ttl,
-        }, indent=2))
+        }, pretty)
     else:
         console.print(f"Lease renewed for {owner} until {claim.expires_at}")
 
@@ -2239,25 +2624,22 @@ def orch_list(
     state: str = typer.Option("", "--state", "-s", help="Filter by state"),
     agent: str = typer.Option("", "--agent", "-a", help="Filter by assigned agent"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """List orchestrator tasks."""
     _ensure_db()
-    filter_state = TaskState(state) if state else None
+    filter_state = _parse_task_state(state) if state else None
     tasks = db.list_tasks(data_dir=_get_data_dir(), state=filter_state, assigned_agent_id=agent or None)
     if json_out:
-        data = [
-            {"task_id": t.task_id, "title": t.title, "state": t.state.value,
-             "assigned_agent_id": t.assigned_agent_id, "branch": t.branch}
-            for t in tasks
-        ]
-        console.print(json.dumps(data, indent=2))
+        fields = {"task_id", "title", "state", "assigned_agent_id", "branch"}
+        _write_json(_dump_models_json(tasks, models.Task, indent=2 if pretty else None, include={"__all__": fields}))
     else:
         if not tasks:
             console.print("[dim]No tasks[/dim]")
             return
-        for t in tasks:
-            agent_str = t.assigned_agent_id or "-"
-            console.print(f"  {t.task_id}  {t.state.value:12}  {agent_str:20}  {t.title}")
+        console.print("\n".join(
+            f"  {t.task_id}  {t.state.value:12}  {t.assigned_agent_id or '-':20}  {t.title}" for t in tasks
+        ))
 
 
 # -- Watchdog command --
@@ -2267,11 +2649,11 @@ def watchdog_cmd(
     threshold: int = typer.Option(300, "--threshold", "-t", help="Stale threshold in seconds"),
     spawn_timeout: int = typer.Option(1800, "--spawn-timeout", help="Default spawn timeout in seconds"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Run watchdog scan: detect stale agents, reap them, abort their tasks, harvest/abort orphaned spawns."""
     _ensure_db()
-    from . import watchdog
-    with _orchestrator_lease(json_out=json_out):
+    with _orchestrator_lease(json_out=json_out, pretty=pretty):
         result = watchdog.scan(
             stale_threshold_s=threshold,
             spawn_timeout_s=spawn_timeout,
@@ -2288,7 +2670,7 @@ def watchdog_cmd(
             "cost_exceeded_spawns": result.cost_exceeded_spawns,
             "clean": result.clean,
         }
-        console.print(json.dumps(data, indent=2))
+        _print_json(data, pretty)
     elif result.clean:
         console.print("[green]Clean[/green] -- no stale agents or orphaned spawns")
     else:
@@ -2345,7 +2727,7 @@ def witness_verify_cmd(
                 style="red", markup=False,
             )
         raise typer.Exit(1)
-    result = _witness.verify_commit(commit, cwd=os.getcwd(), data_dir=_get_data_dir())
+    result = _witness.verify_commit(commit, cwd=_proc_ctx().cwd, data_dir=_get_data_dir())
     if json_out:
         import json as _json
         # Map raw status to structured fields
@@ -2495,11 +2877,39 @@ def hooks_status_cmd() -> None:
 
 # -- Worker commands (spawner bridge) --
 
+def _fail_fast(msg: str) -> NoReturn:
+    """Print *msg* and exit 1 immediately, skipping atexit/interpreter teardown."""
+    sys.stdout.flush()
+    sys.stderr.write(msg + "\n")
+    sys.stderr.flush()
+    os._exit(1)
+
+
+def _spawner_command(fn):
+    """Worker command wrapper: ensure the DB, report SpawnError and exit 1.
+
+    With AGENTMESH_FAST_EXIT set, errors go to stderr and the process exits
+    via os._exit(), for scripted retry loops that only need the exit code.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        _ensure_db()
+        try:
+            return fn(*args, **kwargs)
+        except spawner.SpawnError as e:
+            if os.environ.get("AGENTMESH_FAST_EXIT"):
+                _fail_fast(str(e))
+            _print(str(e), style="red")
+            raise typer.Exit(1)
+    return wrapper
+
+
 worker_app = typer.Typer(help="Worker lifecycle commands (spawn Claude Code in worktrees).")
 app.add_typer(worker_app, name="worker")
 
 
 @worker_app.command(name="spawn")
+@_spawner_command
 def worker_spawn(
     task_id: str = typer.Argument(..., help="Orchestrator task ID (must be ASSIGNED)"),
     agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent ID"),
@@ -2508,26 +2918,21 @@ def worker_spawn(
     timeout: int = typer.Option(0, "--timeout", help="Worker timeout in seconds (0=no timeout)"),
     backend: str = typer.Option("claude_code", "--backend", "-b", help="Worker backend adapter name"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Spawn a worker in an isolated worktree for a task."""
-    _ensure_db()
-    from . import spawner
     agent_id = agent or _auto_agent_id()
-    try:
-        record = spawner.spawn(
-            task_id=task_id,
-            agent_id=agent_id,
-            repo_cwd=str(Path(repo).resolve()),
-            model=model,
-            timeout_s=timeout,
-            backend=backend,
-            data_dir=_get_data_dir(),
-        )
-    except spawner.SpawnError as e:
-        console.print(str(e), style="red")
-        raise typer.Exit(1)
+    record = spawner.spawn(
+        task_id=task_id,
+        agent_id=agent_id,
+        repo_cwd=repo,
+        model=model,
+        timeout_s=timeout,
+        backend=backend,
+        data_dir=_get_data_dir(),
+    )
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "spawn_id": record.spawn_id,
             "task_id": record.task_id,
             "pid": record.pid,
@@ -2535,123 +2940,212 @@ def worker_spawn(
             "branch": record.branch,
             "backend": record.backend,
             "backend_version": record.backend_version,
-        }, indent=2))
+        }, pretty=pretty)
     else:
-        console.print(f"Spawned [bold]{record.spawn_id}[/bold]  pid={record.pid}")
-        console.print(
+        _print(
+            f"Spawned [bold]{record.spawn_id}[/bold]  pid={record.pid}\n"
             f"  task={record.task_id}  branch={record.branch}  "
-            f"backend={record.backend}@{record.backend_version or '?'}",
+            f"backend={record.backend}@{record.backend_version or '?'}\n"
+            f"  worktree={record.worktree_path}"
         )
-        console.print(f"  worktree={record.worktree_path}")
+
+
+@worker_app.command(name="spawn-batch")
+@_spawner_command
+def worker_spawn_batch(
+    task_ids: list[str] = typer.Argument(..., help="Orchestrator task IDs (must be ASSIGNED)"),
+    agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent ID"),
+    model: str = typer.Option("sonnet", "--model", "-m", help="Claude model to use"),
+    repo: str = typer.Option(".", "--repo", "-r", help="Repository root path"),
+    timeout: int = typer.Option(0, "--timeout", help="Worker timeout in seconds (0=no timeout)"),
+    backend: str = typer.Option("claude_code", "--backend", "-b", help="Worker backend adapter name"),
+    json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
+) -> None:
+    """Spawn workers for several tasks in one invocation."""
+    records, errors = spawner.spawn_many(
+        task_ids,
+        agent_id=agent or _auto_agent_id(),
+        repo_cwd=repo,
+        model=model,
+        timeout_s=timeout,
+        backend=backend,
+        data_dir=_get_data_dir(),
+    )
+    if json_out:
+        _print_json({
+            "spawned": [
+                {"spawn_id": r.spawn_id, "task_id": r.task_id, "pid": r.pid, "branch": r.branch}
+                for r in records
+            ],
+            "errors": errors,
+        }, pretty=pretty)
+    else:
+        for r in records:
+            _print(f"Spawned [bold]{r.spawn_id}[/bold]  pid={r.pid}  task={r.task_id}")
+        for task_id, err in errors.items():
+            _print(f"{task_id}: {err}", style="red", markup=False)
+    if errors:
+        raise typer.Exit(1)
 
 
 @worker_app.command(name="check")
+@_spawner_command
 def worker_check(
     spawn_id: str = typer.Argument(..., help="Spawn ID to check"),
+    wait: bool = typer.Option(False, "--wait", help="Block until the worker exits"),
+    timeout: float = typer.Option(0.0, "--timeout", help="Max seconds to --wait (0 = no limit)"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Check liveness of a spawned worker (poll only, no side effects)."""
-    _ensure_db()
-    from . import spawner
-    try:
+    if wait:
+        result = spawner.wait(spawn_id, timeout_s=timeout, data_dir=_get_data_dir())
+    else:
         result = spawner.check(spawn_id, data_dir=_get_data_dir())
-    except spawner.SpawnError as e:
-        console.print(str(e), style="red")
-        raise typer.Exit(1)
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "spawn_id": result.spawn_id,
             "running": result.running,
             "exit_code": result.exit_code,
-        }, indent=2))
+        }, pretty=pretty)
     else:
         status_str = "[green]running[/green]" if result.running else "[dim]exited[/dim]"
-        console.print(f"{result.spawn_id}  {status_str}")
+        _print(f"{result.spawn_id}  {status_str}")
+
+
+@worker_app.command(name="wait")
+@_spawner_command
+def worker_wait(
+    spawn_ids: list[str] = typer.Argument(..., help="Spawn IDs to wait on"),
+    timeout: float = typer.Option(0.0, "--timeout", help="Max seconds to wait (0 = no limit)"),
+    json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
+) -> None:
+    """Block until any of the given workers exits (poll only, no side effects)."""
+    results = spawner.wait_any(spawn_ids, timeout_s=timeout, data_dir=_get_data_dir())
+    if json_out:
+        _print_json([
+            {"spawn_id": r.spawn_id, "running": r.running, "exit_code": r.exit_code}
+            for r in results
+        ], pretty=pretty)
+    else:
+        if not results:
+            _print("[dim]No worker exited before timeout[/dim]")
+        for r in results:
+            _print(f"{r.spawn_id}  [dim]exited[/dim]  exit_code={r.exit_code}")
 
 
 @worker_app.command(name="harvest")
+@_spawner_command
 def worker_harvest(
     spawn_id: str = typer.Argument(..., help="Spawn ID to harvest"),
     keep_worktree: bool = typer.Option(False, "--keep-worktree", help="Do not remove the worktree"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """Collect output from a finished worker and transition task state."""
-    _ensure_db()
-    from . import spawner
-    try:
-        result = spawner.harvest(
-            spawn_id, cleanup_worktree=not keep_worktree, data_dir=_get_data_dir(),
-        )
-    except spawner.SpawnError as e:
-        console.print(str(e), style="red")
-        raise typer.Exit(1)
+    result = spawner.harvest(
+        spawn_id, cleanup_worktree=not keep_worktree, data_dir=_get_data_dir(),
+    )
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "spawn_id": result.spawn_id,
             "outcome": result.outcome,
-        }, indent=2))
+        }, pretty=pretty)
     else:
         style = "green" if result.outcome == "success" else "red"
-        console.print(f"Harvested [bold]{result.spawn_id}[/bold]  [{style}]{result.outcome}[/{style}]")
+        _print(f"Harvested [bold]{result.spawn_id}[/bold]  [{style}]{result.outcome}[/{style}]")
+
+
+@worker_app.command(name="harvest-batch")
+@_spawner_command
+def worker_harvest_batch(
+    spawn_ids: list[str] = typer.Argument(..., help="Spawn IDs to harvest"),
+    keep_worktree: bool = typer.Option(False, "--keep-worktree", help="Do not remove the worktrees"),
+    json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
+) -> None:
+    """Harvest several finished workers in one pass."""
+    results, errors = spawner.harvest_many(
+        spawn_ids, cleanup_worktree=not keep_worktree, data_dir=_get_data_dir(),
+    )
+    if json_out:
+        _print_json({
+            "harvested": [{"spawn_id": r.spawn_id, "outcome": r.outcome} for r in results],
+            "errors": errors,
+        }, pretty=pretty)
+    else:
+        for r in results:
+            style = "green" if r.outcome == "success" else "red"
+            _print(f"Harvested [bold]{r.spawn_id}[/bold]  [{style}]{r.outcome}[/{style}]")
+        for spawn_id, err in errors.items():
+            _print(f"{spawn_id}: {err}", style="red", markup=False)
+    if errors:
+        raise typer.Exit(1)
 
 
 @worker_app.command(name="abort")
+@_spawner_command
 def worker_abort(
     spawn_id: str = typer.Argument(..., help="Spawn ID to abort"),
     reason: str = typer.Option("", "--reason", "-r", help="Abort reason"),
     keep_worktree: bool = typer.Option(False, "--keep-worktree", help="Do not remove the worktree"),
 ) -> None:
     """Abort a running worker: kill process, abort task, clean up."""
-    _ensure_db()
-    from . import spawner
-    try:
-        record = spawner.abort(
-            spawn_id, reason=reason,
-            cleanup_worktree=not keep_worktree, data_dir=_get_data_dir(),
-        )
-    except spawner.SpawnError as e:
-        console.print(str(e), style="red")
-        raise typer.Exit(1)
-    console.print(f"Aborted [bold]{record.spawn_id}[/bold]  task={record.task_id}")
+    record = spawner.abort(
+        spawn_id, reason=reason,
+        cleanup_worktree=not keep_worktree, data_dir=_get_data_dir(),
+    )
+    _print(f"Aborted [bold]{record.spawn_id}[/bold]  task={record.task_id}")
+
+
+def _spawn_row(r: Any) -> dict[str, Any]:
+    """The fields worker list --json/--ndjson report for a SpawnRecord, in output order."""
+    return {"spawn_id": r.spawn_id, "task_id": r.task_id, "pid": r.pid,
+            "branch": r.branch, "outcome": r.outcome, "ended_at": r.ended_at}
 
 
 @worker_app.command(name="list")
 def worker_list(
     active: bool = typer.Option(False, "--active", help="Only show active (running) workers"),
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per line"),
 ) -> None:
     """List spawned workers."""
     _ensure_db()
-    from . import spawner
+    if ndjson:
+        for r in spawner.iter_spawns(active_only=active, data_dir=_get_data_dir()):
+            sys.stdout.write(_json_text(_spawn_row(r)) + "\n")
+        return
     records = spawner.list_spawns(active_only=active, data_dir=_get_data_dir())
     if json_out:
-        data = [
-            {"spawn_id": r.spawn_id, "task_id": r.task_id, "pid": r.pid,
-             "branch": r.branch, "outcome": r.outcome, "ended_at": r.ended_at}
-            for r in records
-        ]
-        console.print(json.dumps(data, indent=2))
+        # A plain dict projection: a TypeAdapter schema build for the
+        # dataclass costs more than this whole path in a one-shot process.
+        _print_json([_spawn_row(r) for r in records], pretty=pretty)
     else:
         if not records:
-            console.print("[dim]No workers[/dim]")
+            _print("[dim]No workers[/dim]")
             return
-        for r in records:
-            status_str = r.outcome or "running"
-            console.print(f"  {r.spawn_id}  pid={r.pid}  {status_str:10}  {r.branch}")
+        row = operator.attrgetter("spawn_id", "pid", "outcome", "branch")
+        _print("\n".join(
+            "  %s  pid=%s  %-10s  %s" % (sid, pid, outcome or "running", branch)
+            for sid, pid, outcome, branch in map(row, records)
+        ), markup=False, highlight=False)
 
 
 @worker_app.command(name="backends")
 def worker_backends(
     json_out: bool = typer.Option(False, "--json", help="JSON output"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON output"),
 ) -> None:
     """List registered worker backend adapters."""
-    from .worker_adapters import get_adapter_load_errors, list_adapters
-
-    infos = list_adapters()
-    errors = get_adapter_load_errors()
+    infos = worker_adapters.list_adapters()
+    errors = worker_adapters.get_adapter_load_errors()
 
     if json_out:
-        console.print(json.dumps({
+        _print_json({
             "backends": [
                 {
                     "name": i.name,
@@ -2662,19 +3156,20 @@ def worker_backends(
                 for i in infos
             ],
             "load_errors": errors,
-        }, indent=2))
+        }, pretty=pretty)
         return
 
+    lines: list[str] = []
     if not infos:
-        console.print("[dim]No worker backends registered[/dim]")
+        lines.append("[dim]No worker backends registered[/dim]")
     for i in infos:
-        console.print(f"  {i.name:18} {i.version or '(no version)'}")
+        lines.append(f"  {i.name:18} {i.version or '(no version)'}")
         if i.module:
-            console.print(f"    module={i.module}")
+            lines.append(f"    module={i.module}")
         if i.origin:
-            console.print(f"    origin={i.origin}")
+            lines.append(f"    origin={i.origin}")
 
     if errors:
-        console.print("[yellow]autoload errors:[/yellow]")
-        for e in errors:
-            console.print(f"  {e}")
+        lines.append("[yellow]autoload errors:[/yellow]")
+        lines.extend(f"  {e}" for e in errors)
+    _print("\n".join(lines))
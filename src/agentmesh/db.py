@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
 import functools
 import json
 import os
 import random
 import sqlite3
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from .models import (
     Agent, AgentStatus, Attempt, Capsule, Claim, ClaimIntent, ClaimState,
@@ -46,6 +51,10 @@ def _retry_on_busy(fn):
         raise last_err  # type: ignore[misc]
     return wrapper
 
+# Stored in PRAGMA user_version once init_db() has fully run. Bump it
+# whenever _SCHEMA or a migration in init_db() changes.
+_SCHEMA_VERSION = 1
+
 _SCHEMA = """\
 PRAGMA journal_mode=WAL;
 PRAGMA busy_timeout=5000;
@@ -212,21 +221,204 @@ def _table_exists(conn: sqlite3.Connection, table_name: str) -> bool:
     return row is not None
 
 
-def get_connection(data_dir: Path | None = None) -> sqlite3.Connection:
-    """Get a new SQLite connection with WAL mode."""
+_tx_local = threading.local()
+
+
+class _TxConnection:
+    """Connection handle given to db helpers running inside transaction().
+
+    commit()/close() defer to the enclosing block. An explicit BEGIN maps to
+    a SAVEPOINT so helpers that commit/rollback their own unit of work keep
+    that behaviour without ending the outer transaction.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._savepoints: list[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def execute(self, sql: str, *args: Any) -> sqlite3.Cursor:
+        if sql.lstrip().upper().startswith("BEGIN"):
+            name = f"am_sp_{id(self):x}_{len(self._savepoints)}"
+            self._savepoints.append(name)
+            return self._conn.execute(f"SAVEPOINT {name}")
+        return self._conn.execute(sql, *args)
+
+    def commit(self) -> None:
+        if self._savepoints:
+            self._conn.execute(f"RELEASE {self._savepoints.pop()}")
+
+    def rollback(self) -> None:
+        if self._savepoints:
+            name = self._savepoints.pop()
+            self._conn.execute(f"ROLLBACK TO {name}")
+            self._conn.execute(f"RELEASE {name}")
+
+    def close(self) -> None:
+        pass
+
+
+@contextmanager
+def transaction(data_dir: Path | None = None):
+    """Group several db helpers into one write transaction (one commit).
+
+    Helpers called on this thread for the same data_dir inside the block
+    share its connection; everything is rolled back if the block raises.
+    Nested transaction() blocks join the outer one. The block runs on this
+    thread's pooled connection, so a command's transactions and plain
+    helper calls share one open handle.
+    """
     path = _db_path(data_dir)
-    conn = sqlite3.connect(str(path), timeout=10)
+    active = getattr(_tx_local, "active", None)
+    if active is not None and active[0] == path:
+        yield _TxConnection(active[1])
+        return
+
+    conn = _pooled_connection(path)
+    conn.execute("BEGIN IMMEDIATE")
+    _tx_local.active = (path, conn)
+    try:
+        yield _TxConnection(conn)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        _tx_local.active = active
+        conn.close()
+
+
+# Per-thread connection pool: one cached connection per board.db path, kept
+# for the life of the thread (e.g. the whole `orch run` loop).
+_POOL_MAX_PER_THREAD = 4
+_pool_local = threading.local()
+_pooled_all: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+
+
+class _PooledConnection:
+    """Cached connection handle; close() returns it to the thread's pool.
+
+    Any transaction a helper left open is rolled back on close(), matching
+    what closing a real connection would do.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self.in_use = False
+        self.disposed = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        if not self.disposed and self._conn.in_transaction:
+            self._conn.rollback()
+        self.in_use = False
+
+    def dispose(self) -> None:
+        self.disposed = True
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+
+
+def _pooled_connection(path: Path) -> sqlite3.Connection:
+    pool: OrderedDict[Path, _PooledConnection] | None = getattr(_pool_local, "pool", None)
+    if pool is None:
+        pool = _pool_local.pool = OrderedDict()
+    pooled = pool.get(path)
+    if pooled is not None and pooled.in_use:
+        # Re-entrant use on this thread: hand out a private connection.
+        return _open_connection(path)
+    if pooled is None or pooled.disposed:
+        pooled = _PooledConnection(_open_connection(path, check_same_thread=False))
+        pool[path] = pooled
+        _pooled_all.add(pooled)
+        while len(pool) > _POOL_MAX_PER_THREAD:
+            _, evicted = pool.popitem(last=False)
+            if not evicted.in_use:
+                evicted.dispose()
+    pool.move_to_end(path)
+    pooled.in_use = True
+    return pooled  # type: ignore[return-value]
+
+
+def close_pooled_connections() -> None:
+    """Close every cached connection (all threads)."""
+    for pooled in list(_pooled_all):
+        pooled.dispose()
+    _pooled_all.clear()
+    _pool_local.pool = OrderedDict()
+
+
+atexit.register(close_pooled_connections)
+
+
+# board.db paths this process has already switched to WAL. journal_mode=WAL
+# is persisted in the database file, so later connections skip the pragma
+# (it takes a lock and probes the journal on every call).
+_wal_paths: set[str] = set()
+
+
+def _open_connection(path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(path), timeout=10, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    key = str(path)
+    if key not in _wal_paths:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_paths.add(key)
     conn.execute("PRAGMA busy_timeout=5000")
     conn.execute("PRAGMA foreign_keys=ON")
+    # Per-connection settings. Under WAL, synchronous=NORMAL only fsyncs at
+    # checkpoints: commits stay atomic and consistent across processes and a
+    # crashed CLI, but the last few may be lost on OS crash or power loss.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
+def get_connection(data_dir: Path | None = None) -> sqlite3.Connection:
+    """Get a SQLite connection with WAL mode from this thread's pool.
+
+    Callers still close() it when done; that hands it back to the pool.
+    Inside a transaction() block for the same data_dir, returns a handle on
+    the block's shared connection instead.
+    """
+    path = _db_path(data_dir)
+    active = getattr(_tx_local, "active", None)
+    if active is not None and active[0] == path:
+        return _TxConnection(active[1])  # type: ignore[return-value]
+    return _pooled_connection(path)
+
+
+def data_version(data_dir: Path | None = None) -> int:
+    """PRAGMA data_version on this thread's pooled connection.
+
+    The value changes whenever another connection commits to board.db, so
+    pollers can tell the board is idle without re-running their queries.
+    """
+    conn = get_connection(data_dir)
+    try:
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
 def init_db(data_dir: Path | None = None) -> None:
-    """Initialize schema if needed."""
+    """Initialize schema if needed.
+
+    A board already stamped with the current _SCHEMA_VERSION costs one
+    pragma read; otherwise the schema script and every migration run.
+    """
     conn = get_connection(data_dir)
     try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+            return
         conn.executescript(_SCHEMA)
     finally:
         conn.close()
@@ -238,6 +430,45 @@ def init_db(data_dir: Path | None = None) -> None:
     migrate_add_tasks_tables(data_dir)
     migrate_add_spawns_table(data_dir)
     migrate_weave_add_sequence_id(data_dir)
+    conn = get_connection(data_dir)
+    try:
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _file_identity(path: Path) -> tuple[str, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return str(path), st.st_dev, st.st_ino
+
+
+# Database files this process has already run init_db() against.
+_initialized: set[tuple[str, int, int]] = set()
+_init_lock = threading.Lock()
+
+
+def init_db_once(data_dir: Path | None = None) -> None:
+    """init_db(), skipped if this process already initialized the same file.
+
+    Keyed on path + inode so a deleted and recreated board is migrated again.
+    Threads that race on the first call wait for one init_db() to finish.
+    """
+    path = _db_path(data_dir)
+    key = _file_identity(path)
+    if key is not None and key in _initialized:
+        return
+    with _init_lock:
+        key = _file_identity(path)
+        if key is not None and key in _initialized:
+            return
+        init_db(data_dir)
+        key = _file_identity(path)
+        if key is not None:
+            _initialized.add(key)
 
 
 def migrate_claims_add_resource_type(data_dir: Path | None = None) -> None:
@@ -648,21 +879,68 @@ def finalize_spawn(
         conn.close()
 
 
+@_retry_on_busy
+def finalize_spawns_many(
+    spawn_ids: list[str],
+    ended_at: str,
+    outcome: str,
+    data_dir: Path | None = None,
+) -> list[str]:
+    """Batch variant of finalize_spawn in a single write transaction.
+
+    Returns the spawn_ids this caller claimed, in input order.
+    """
+    if not spawn_ids:
+        return []
+    conn = get_connection(data_dir)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        open_ids = {
+            r["spawn_id"] for r in conn.execute(
+                "SELECT spawn_id FROM spawns WHERE ended_at = ''"
+            ).fetchall()
+        }
+        claimed = [s for s in dict.fromkeys(spawn_ids) if s in open_ids]
+        conn.executemany(
+            "UPDATE spawns SET ended_at = ?, outcome = ? "
+            "WHERE spawn_id = ? AND ended_at = ''",
+            [(ended_at, outcome, s) for s in claimed],
+        )
+        conn.commit()
+        return claimed
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+_LIST_SPAWNS_SQL = "SELECT * FROM spawns ORDER BY started_at"
+_LIST_ACTIVE_SPAWNS_SQL = "SELECT * FROM spawns WHERE ended_at = '' ORDER BY started_at"
+
+
 def list_spawns_db(
     active_only: bool = False,
     data_dir: Path | None = None,
 ) -> list[dict[str, Any]]:
     conn = get_connection(data_dir)
     try:
-        if active_only:
-            rows = conn.execute(
-                "SELECT * FROM spawns WHERE ended_at = '' ORDER BY started_at"
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT * FROM spawns ORDER BY started_at"
-            ).fetchall()
-        return [dict(r) for r in rows]
+        sql = _LIST_ACTIVE_SPAWNS_SQL if active_only else _LIST_SPAWNS_SQL
+        return [dict(r) for r in conn.execute(sql).fetchall()]
+    finally:
+        conn.close()
+
+
+def iter_spawns_db(
+    active_only: bool = False,
+    data_dir: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Like list_spawns_db, but yields rows as SQLite produces them."""
+    conn = get_connection(data_dir)
+    try:
+        sql = _LIST_ACTIVE_SPAWNS_SQL if active_only else _LIST_SPAWNS_SQL
+        for r in conn.execute(sql):
+            yield dict(r)
     finally:
         conn.close()
 
@@ -743,6 +1021,54 @@ def update_task(
         conn.close()
 
 
+# Ids bound per IN (...) query; well under SQLite's default 999-variable limit.
+_IN_CHUNK = 500
+
+
+@_retry_on_busy
+def update_tasks_state_many(
+    task_ids: list[str],
+    state: TaskState,
+    skip_states: set[TaskState] | None = None,
+    data_dir: Path | None = None,
+) -> list[Task]:
+    """Move many tasks to *state* in one write transaction.
+
+    Tasks currently in *skip_states* are left alone. Returns the tasks that
+    were updated (as they were before the update), in input order.
+    """
+    if not task_ids:
+        return []
+    from .models import _now
+    skip = {s.value for s in (skip_states or set())}
+    conn = get_connection(data_dir)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        ids = list(dict.fromkeys(task_ids))
+        guard = f" AND state NOT IN ({', '.join('?' * len(skip))})" if skip else ""
+        by_id: dict[str, Task] = {}
+        for i in range(0, len(ids), _IN_CHUNK):
+            chunk = ids[i:i + _IN_CHUNK]
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE task_id IN ({', '.join('?' * len(chunk))}){guard}",
+                chunk + sorted(skip),
+            ).fetchall()
+            by_id.update((r["task_id"], _row_to_task(r)) for r in rows)
+        updated = [by_id[t] for t in ids if t in by_id]
+        now = _now()
+        conn.executemany(
+            "UPDATE tasks SET state = ?, updated_at = ? WHERE task_id = ?",
+            [(state.value, now, t.task_id) for t in updated],
+        )
+        conn.commit()
+        return updated
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def list_tasks(
     data_dir: Path | None = None,
     state: TaskState | None = None,
@@ -811,6 +1137,63 @@ def end_attempt(
         conn.close()
 
 
+@_retry_on_busy
+def end_attempts_many(
+    attempt_ids: list[str],
+    outcome: str,
+    error_summary: str = "",
+    data_dir: Path | None = None,
+) -> int:
+    """Batch variant of end_attempt. Returns rows updated."""
+    if not attempt_ids:
+        return 0
+    from .models import _now
+    now = _now()
+    conn = get_connection(data_dir)
+    try:
+        cur = conn.executemany(
+            "UPDATE attempts SET ended_at = ?, outcome = ?, error_summary = ? "
+            "WHERE attempt_id = ?",
+            [(now, outcome, error_summary, a) for a in attempt_ids],
+        )
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+@_retry_on_busy
+def end_open_attempts_many(
+    task_ids: list[str],
+    outcome: str,
+    error_summary: str = "",
+    data_dir: Path | None = None,
+    error_summaries: dict[str, str] | None = None,
+) -> int:
+    """Close the latest open attempt of each task. Returns rows updated.
+
+    *error_summaries* overrides *error_summary* per task_id.
+    """
+    if not task_ids:
+        return 0
+    from .models import _now
+    now = _now()
+    summaries = error_summaries or {}
+    conn = get_connection(data_dir)
+    try:
+        cur = conn.executemany(
+            "UPDATE attempts SET ended_at = ?, outcome = ?, error_summary = ? "
+            "WHERE attempt_id = ("
+            "SELECT attempt_id FROM attempts WHERE task_id = ? AND ended_at = '' "
+            "ORDER BY attempt_number DESC LIMIT 1)",
+            [(now, outcome, summaries.get(t, error_summary), t) for t in task_ids],
+        )
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
 def list_attempts(
     task_id: str,
     data_dir: Path | None = None,
@@ -826,6 +1209,31 @@ def list_attempts(
         conn.close()
 
 
+def get_task_with_attempts(
+    task_id: str,
+    data_dir: Path | None = None,
+) -> tuple[Task, list[Attempt]] | None:
+    """Task plus its attempts from one connection and read snapshot."""
+    conn = get_connection(data_dir)
+    try:
+        conn.execute("BEGIN")
+        try:
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE task_id = ?", (task_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            rows = conn.execute(
+                "SELECT * FROM attempts WHERE task_id = ? ORDER BY attempt_number",
+                (task_id,),
+            ).fetchall()
+        finally:
+            conn.rollback()
+        return _row_to_task(row), [_row_to_attempt(r) for r in rows]
+    finally:
+        conn.close()
+
+
 # -- Agent CRUD --
 
 def register_agent(agent: Agent, data_dir: Path | None = None) -> None:
@@ -856,6 +1264,18 @@ def deregister_agent(agent_id: str, data_dir: Path | None = None) -> bool:
         conn.close()
 
 
+def agent_exists(agent_id: str, data_dir: Path | None = None) -> bool:
+    """True if *agent_id* has a row (any status); skips building an Agent."""
+    conn = get_connection(data_dir)
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM agents WHERE agent_id = ? LIMIT 1", (agent_id,)
+        ).fetchone()
+        return row is not None
+    finally:
+        conn.close()
+
+
 def get_agent(agent_id: str, data_dir: Path | None = None) -> Agent | None:
     conn = get_connection(data_dir)
     try:
@@ -1040,6 +1460,30 @@ def release_claim(agent_id: str, path: str | None = None,
         conn.close()
 
 
+def release_claims_many(agent_id: str, targets: list[tuple[str, ResourceType]],
+                        data_dir: Path | None = None) -> list[int]:
+    """Release this agent's active claims on each (path, resource_type) in one commit.
+
+    Returns the number of claims released per target, in order.
+    """
+    from .models import _now
+    conn = get_connection(data_dir)
+    try:
+        now = _now()
+        counts = [
+            conn.execute(
+                "UPDATE claims SET state = 'released', released_at = ? "
+                "WHERE agent_id = ? AND path = ? AND resource_type = ? AND state = 'active'",
+                (now, agent_id, path, rt.value),
+            ).rowcount
+            for path, rt in targets
+        ]
+        conn.commit()
+        return counts
+    finally:
+        conn.close()
+
+
 def list_claims(data_dir: Path | None = None, agent_id: str | None = None,
                 active_only: bool = True) -> list[Claim]:
     conn = get_connection(data_dir)
@@ -1502,6 +1946,21 @@ def get_last_weave_sequence(data_dir: Path | None = None) -> int:
         conn.close()
 
 
+def _weave_event_rows(
+    conn: sqlite3.Connection, columns: str, episode_id: str | None, limit: int,
+) -> list[sqlite3.Row]:
+    sql = f"SELECT {columns} FROM weave_events"
+    params: list[Any] = []
+    if episode_id:
+        sql += " WHERE episode_id = ?"
+        params.append(episode_id)
+    sql += " ORDER BY sequence_id, created_at"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
 def list_weave_events(
     data_dir: Path | None = None,
     episode_id: str | None = None,
@@ -1510,31 +1969,40 @@ def list_weave_events(
     """List weave events. limit=0 means no limit (all events)."""
     conn = get_connection(data_dir)
     try:
-        if episode_id and limit:
-            rows = conn.execute(
-                "SELECT * FROM weave_events WHERE episode_id = ? "
-                "ORDER BY sequence_id, created_at LIMIT ?",
-                (episode_id, limit),
-            ).fetchall()
-        elif episode_id:
-            rows = conn.execute(
-                "SELECT * FROM weave_events WHERE episode_id = ? "
-                "ORDER BY sequence_id, created_at",
-                (episode_id,),
-            ).fetchall()
-        elif limit:
-            rows = conn.execute(
-                "SELECT * FROM weave_events ORDER BY sequence_id, created_at LIMIT ?", (limit,)
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT * FROM weave_events ORDER BY sequence_id, created_at"
-            ).fetchall()
+        rows = _weave_event_rows(conn, "*", episode_id, limit)
         return [_row_to_weave_event(r) for r in rows]
     finally:
         conn.close()
 
 
+# WeaveEvent field order, so exported dicts match model_dump() key order.
+_WEAVE_EXPORT_COLUMNS = (
+    "event_id, sequence_id, episode_id, prev_hash, capsule_id, git_commit_sha, "
+    "git_patch_hash, affected_symbols, trace_id, parent_event_id, event_hash, created_at"
+)
+
+
+def list_weave_event_dicts(
+    data_dir: Path | None = None,
+    episode_id: str | None = None,
+) -> list[dict[str, Any]]:
+    """Weave events as plain dicts shaped like WeaveEvent.model_dump(), for export.
+
+    Skips per-row model construction; only affected_symbols needs decoding.
+    """
+    conn = get_connection(data_dir)
+    try:
+        rows = _weave_event_rows(conn, _WEAVE_EXPORT_COLUMNS, episode_id, 0)
+    finally:
+        conn.close()
+    out: list[dict[str, Any]] = []
+    for r in rows:
+        d = dict(zip(r.keys(), r))
+        d["affected_symbols"] = json.loads(d["affected_symbols"])
+        out.append(d)
+    return out
+
+
 # -- Waiter CRUD --
 
 @_retry_on_busy
@@ -49,10 +49,10 @@ def start_episode(
 def get_current_episode(data_dir: Path | None = None) -> str:
     """Read the current episode ID from the current_episode file. Returns '' if none."""
     d = data_dir or _DEFAULT_DIR
-    path = d / "current_episode"
-    if not path.exists():
+    try:
+        return (d / "current_episode").read_text().strip()
+    except FileNotFoundError:
         return ""
-    return path.read_text().strip()
 
 
 def set_current_episode(episode_id: str, data_dir: Path | None = None) -> None:
@@ -63,16 +63,26 @@ def set_current_episode(episode_id: str, data_dir: Path | None = None) -> None:
     path.write_text(episode_id)
 
 
-def end_episode(data_dir: Path | None = None) -> str:
-    """End the current episode. Returns the ended episode_id, or '' if none."""
+def clear_current_episode(data_dir: Path | None = None) -> None:
+    """Remove the current episode pointer, if any."""
+    d = data_dir or _DEFAULT_DIR
+    path = d / "current_episode"
+    if path.exists():
+        path.unlink()
+
+
+def end_episode(data_dir: Path | None = None, clear_current: bool = True) -> str:
+    """End the current episode. Returns the ended episode_id, or '' if none.
+
+    With clear_current=False the current_episode pointer is left in place so
+    a caller inside a board transaction can clear it after COMMIT.
+    """
     from . import db
 
     episode_id = get_current_episode(data_dir)
     if not episode_id:
         return ""
     db.end_episode(episode_id, ended_at=_now(), data_dir=data_dir)
-    d = data_dir or _DEFAULT_DIR
-    path = d / "current_episode"
-    if path.exists():
-        path.unlink()
+    if clear_current:
+        clear_current_episode(data_dir)
     return episode_id
@@ -6,6 +6,7 @@ import fcntl
 import hashlib
 import json
 import os
+import time
 from pathlib import Path
 from typing import Any
 
@@ -71,6 +72,20 @@ def append_event(
     data_dir: Path | None = None,
 ) -> Event:
     """Append a new event to the JSONL log. Process-safe via flock + O_APPEND."""
+    return append_events([(kind, agent_id, payload)], data_dir)[0]
+
+
+def append_events(
+    items: list[tuple[EventKind, str, dict[str, Any] | None]],
+    data_dir: Path | None = None,
+) -> list[Event]:
+    """Append several (kind, agent_id, payload) events under one lock and write.
+
+    The chain tail is read once and all lines go out in a single O_APPEND
+    write, so a batch costs the same I/O as a single event.
+    """
+    if not items:
+        return []
     path = _event_path(data_dir)
 
     # Open with O_APPEND for atomic appends
@@ -80,25 +95,28 @@ def append_event(
         try:
             # Read current state while holding lock
             seq, prev_hash, event_num = _read_last_event(path)
-            new_seq = seq + 1
-            new_event_num = max(event_num, new_seq - 1) + 1
-            event_id = f"evt_{new_event_num:06d}"
-
-            data = {
-                "event_id": event_id,
-                "seq": new_seq,
-                "ts": _now(),
-                "kind": kind.value,
-                "agent_id": agent_id,
-                "payload": payload or {},
-                "prev_hash": prev_hash,
-            }
-            data["event_hash"] = _hash_event(data)
-
-            line = json.dumps(data, separators=(",", ":")) + "\n"
-            os.write(fd, line.encode())
-
-            return Event(**data)
+            ts = _now()
+            lines: list[str] = []
+            out: list[Event] = []
+            for kind, agent_id, payload in items:
+                seq += 1
+                event_num = max(event_num, seq - 1) + 1
+                data = {
+                    "event_id": f"evt_{event_num:06d}",
+                    "seq": seq,
+                    "ts": ts,
+                    "kind": kind.value,
+                    "agent_id": agent_id,
+                    "payload": payload or {},
+                    "prev_hash": prev_hash,
+                }
+                data["event_hash"] = _hash_event(data)
+                prev_hash = data["event_hash"]
+                lines.append(json.dumps(data, separators=(",", ":")) + "\n")
+                out.append(Event(**data))
+
+            os.write(fd, "".join(lines).encode())
+            return out
         finally:
             fcntl.flock(fd, fcntl.LOCK_UN)
     finally:
@@ -122,6 +140,38 @@ def read_events(data_dir: Path | None = None, since_seq: int = 0) -> list[Event]
     return events
 
 
+def log_signature(data_dir: Path | None = None) -> tuple[int, int]:
+    """(size, mtime_ns) of the event log; (0, 0) if it does not exist yet."""
+    try:
+        st = _event_path(data_dir).stat()
+    except FileNotFoundError:
+        return 0, 0
+    return st.st_size, st.st_mtime_ns
+
+
+def wait_for_change(
+    signature: tuple[int, int],
+    timeout_s: float,
+    data_dir: Path | None = None,
+    poll_s: float = 0.05,
+) -> tuple[int, int]:
+    """Block until the event log differs from *signature* or *timeout_s* passes.
+
+    Uses cheap stat() probes instead of re-reading the log, so idle waits
+    cost almost nothing and appends are noticed within *poll_s*.
+    Returns the latest signature.
+    """
+    deadline = time.monotonic() + max(timeout_s, 0.0)
+    while True:
+        current = log_signature(data_dir)
+        if current != signature:
+            return current
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return current
+        time.sleep(min(poll_s, remaining))
+
+
 def verify_chain(data_dir: Path | None = None) -> tuple[bool, str]:
     """Verify the hash chain integrity. Returns (valid, error_message)."""
     path = _event_path(data_dir)
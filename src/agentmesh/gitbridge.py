@@ -51,6 +51,30 @@ def get_staged_files(cwd: str | None = None) -> list[str]:
     return [line for line in out.splitlines() if line.strip()]
 
 
+def get_staged_snapshot(cwd: str | None = None) -> tuple[list[str], str, str]:
+    """Return (staged files, staged diff, patch hash) for the index.
+
+    The name-only and full diffs run as two concurrent git processes, and
+    the results match get_staged_files/get_staged_diff/compute_patch_hash.
+    """
+    try:
+        names_proc = subprocess.Popen(
+            ["git", "diff", "--cached", "--name-only"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, cwd=cwd,
+        )
+    except FileNotFoundError:
+        return [], "", compute_patch_hash("")
+    try:
+        diff_text = _run_git(["diff", "--cached"], cwd=cwd)
+        names_out, _ = names_proc.communicate(timeout=10)
+    except subprocess.TimeoutExpired:
+        names_proc.kill()
+        names_proc.communicate()
+        names_out = ""
+    files = [line for line in names_out.strip().splitlines() if line.strip()]
+    return files, diff_text, compute_patch_hash(diff_text)
+
+
 def get_commit_files(commit_sha: str, cwd: str | None = None) -> list[str]:
     """Return list of file paths changed by a commit."""
     out = _run_git(["show", "--format=", "--name-only", commit_sha], cwd=cwd)
@@ -196,12 +196,14 @@ def transition_task(
     agent_id: str = "",
     reason: str = "",
     data_dir: Path | None = None,
+    pending_events: list[Any] | None = None,
     **update_kwargs: Any,
 ) -> Task:
     """Atomically transition a task to a new state.
 
     Validates the transition, updates the DB, emits a weave receipt
-    and an event log entry. Returns the updated Task.
+    and an event log entry. Returns the updated Task. With
+    *pending_events*, the event is queued there for the caller to append.
 
     Raises TransitionError if the transition is invalid.
     """
@@ -237,17 +239,16 @@ def transition_task(
     )
 
     # Emit event log entry (operational telemetry)
-    events.append_event(
-        kind=EventKind.TASK_TRANSITION,
-        agent_id=agent_id,
-        payload={
-            "task_id": task_id,
-            "from_state": current.value,
-            "to_state": to_state.value,
-            "reason": reason,
-        },
-        data_dir=data_dir,
-    )
+    payload = {
+        "task_id": task_id,
+        "from_state": current.value,
+        "to_state": to_state.value,
+        "reason": reason,
+    }
+    if pending_events is None:
+        events.append_event(kind=EventKind.TASK_TRANSITION, agent_id=agent_id, payload=payload, data_dir=data_dir)
+    else:
+        pending_events.append((EventKind.TASK_TRANSITION, agent_id, payload))
 
     # Re-fetch to return latest state
     updated = db.get_task(task_id, data_dir)
@@ -409,6 +410,71 @@ def abort_task(
     return task
 
 
+def abort_tasks_many(
+    task_ids: list[str],
+    reason: str = "",
+    data_dir: Path | None = None,
+    per_task: dict[str, tuple[str, str]] | None = None,
+) -> list[str]:
+    """Abort many tasks with batched state and attempt writes.
+
+    Tasks already in a terminal state are skipped. *per_task* maps a task_id
+    to the (agent_id, reason) its abort_task call would have used; other
+    tasks are logged under their assigned agent with *reason*. Per-task
+    receipts and events match abort_task. Returns the aborted task_ids.
+    """
+    abort_reason = reason or "aborted"
+    previous = db.update_tasks_state_many(
+        task_ids,
+        TaskState.ABORTED,
+        skip_states=TERMINAL_STATES,
+        data_dir=data_dir,
+    )
+    if not previous:
+        return []
+
+    overrides = per_task or {}
+    fields = {
+        t.task_id: overrides.get(t.task_id, (t.assigned_agent_id, abort_reason))
+        for t in previous
+    }
+    db.end_open_attempts_many(
+        [t.task_id for t in previous],
+        outcome="failure",
+        error_summary=abort_reason,
+        data_dir=data_dir,
+        error_summaries={tid: r for tid, (_, r) in fields.items()},
+    )
+
+    for task in previous:
+        agent_id, task_reason = fields[task.task_id]
+        weaver.append_weave(
+            trace_id=task.task_id,
+            episode_id=task.episode_id or None,
+            data_dir=data_dir,
+        )
+        events.append_event(
+            kind=EventKind.TASK_TRANSITION,
+            agent_id=agent_id,
+            payload={
+                "task_id": task.task_id,
+                "from_state": task.state.value,
+                "to_state": TaskState.ABORTED.value,
+                "reason": task_reason,
+            },
+            data_dir=data_dir,
+        )
+        assay_bridge.emit_bridge_event(
+            task_id=task.task_id,
+            terminal_state="ABORTED",
+            agent_id=agent_id,
+            episode_id=task.episode_id,
+            data_dir=data_dir,
+        )
+
+    return [t.task_id for t in previous]
+
+
 def complete_task(
     task_id: str,
     reason: str = "",
@@ -5,13 +5,16 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import select
 import signal
 import subprocess
 import sys
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from . import db, events, orch_control, orchestrator, weaver
 from .gitbridge import create_worktree, remove_worktree, run_tests
@@ -119,6 +122,13 @@ def _resolve_repo_cwd(record: SpawnRecord) -> str | None:
     return None
 
 
+def _real_repo_path(repo_cwd: str) -> str:
+    """Canonical repo path; "." is just getcwd(), which the kernel already resolved."""
+    if repo_cwd in ("", "."):
+        return os.getcwd()
+    return os.path.realpath(repo_cwd)
+
+
 def _load_repo_policy(repo_cwd: str) -> dict[str, Any]:
     if not repo_cwd:
         return {}
@@ -212,46 +222,66 @@ def _cleanup_worktree(record: SpawnRecord) -> None:
 
 
 def _get_pid_create_time(pid: int) -> float:
-    """Best-effort process creation time (epoch float). Returns 0.0 on failure.
+    """Best-effort process creation time (epoch float). Returns 0.0 on failure."""
+    return _get_pid_create_times([pid]).get(pid, 0.0)
+
+
+def _get_pid_create_times(pids: list[int]) -> dict[int, float]:
+    """Best-effort creation times for several processes in one probe.
 
-    Uses ``ps -o lstart= -p <pid>`` which works on macOS and Linux without
-    extra dependencies. Falls back to /proc on Linux if ps is unavailable.
+    Uses a single ``ps -o pid=,lstart= -p a,b,...`` which works on macOS and
+    Linux without extra dependencies. Falls back to /proc on Linux if ps is
+    unavailable. PIDs that cannot be resolved are omitted.
     """
     import platform
-    from datetime import datetime as _dt, timezone as _tz
+    from datetime import datetime as _dt
+
+    if not pids:
+        return {}
+    out: dict[int, float] = {}
 
     # Universal approach: ps -o lstart (works macOS + Linux)
     try:
         result = subprocess.run(
-            ["ps", "-o", "lstart=", "-p", str(pid)],
+            ["ps", "-o", "pid=,lstart=", "-p", ",".join(str(p) for p in pids)],
             capture_output=True, text=True, timeout=5,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            # Format: "Mon Jan  1 12:00:00 2024"
-            raw = " ".join(result.stdout.strip().split())  # normalize whitespace
-            dt = _dt.strptime(raw, "%a %b %d %H:%M:%S %Y")
-            # ps lstart is local time; convert to epoch
-            return dt.replace(tzinfo=None).timestamp()
+        for line in result.stdout.splitlines():
+            # Format: "<pid> Mon Jan  1 12:00:00 2024"
+            parts = line.split()
+            if len(parts) < 6:
+                continue
+            try:
+                dt = _dt.strptime(" ".join(parts[1:6]), "%a %b %d %H:%M:%S %Y")
+                # ps lstart is local time; convert to epoch
+                out[int(parts[0])] = dt.replace(tzinfo=None).timestamp()
+            except ValueError:
+                continue
+        if out:
+            return out
     except Exception:
         pass
 
     # Linux fallback: /proc/<pid>/stat
     if platform.system() == "Linux":
         try:
-            with open(f"/proc/{pid}/stat", "r") as f:
-                stat = f.read()
-            fields = stat.rsplit(")", 1)[-1].split()
-            starttime_ticks = int(fields[19])
             clk_tck = os.sysconf("SC_CLK_TCK")
             with open("/proc/stat", "r") as f:
-                for line in f:
-                    if line.startswith("btime "):
-                        boot_time = int(line.split()[1])
-                        return boot_time + starttime_ticks / clk_tck
+                boot_time = next(
+                    int(line.split()[1]) for line in f if line.startswith("btime ")
+                )
         except Exception:
-            pass
+            return out
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/stat", "r") as f:
+                    stat = f.read()
+                fields = stat.rsplit(")", 1)[-1].split()
+                out[pid] = boot_time + int(fields[19]) / clk_tck
+            except Exception:
+                continue
 
-    return 0.0
+    return out
 
 
 def _terminate_pid(pid: int) -> None:
@@ -313,7 +343,7 @@ def spawn(
     backend_version = getattr(adapter, "version", "") or ""
 
     spawn_id = f"spawn_{uuid.uuid4().hex[:12]}"
-    repo_root = str(Path(repo_cwd).resolve())
+    repo_root = _real_repo_path(repo_cwd)
 
     # Worktree path
     wt_dir = Path(repo_root) / ".worktrees" / spawn_id
@@ -475,6 +505,37 @@ def spawn(
     return record
 
 
+def spawn_many(
+    task_ids: list[str],
+    agent_id: str,
+    repo_cwd: str,
+    model: str = "sonnet",
+    timeout_s: int = 0,
+    backend: str = "claude_code",
+    data_dir: Path | None = None,
+) -> tuple[list[SpawnRecord], dict[str, str]]:
+    """Spawn a worker for each ASSIGNED task, resolving shared inputs once.
+
+    Each spawn commits independently, so one failure never rolls back
+    workers that are already running. Returns (records, {task_id: error}).
+    """
+    if orch_control.is_frozen(data_dir):
+        raise SpawnError("Orchestrator is frozen; new spawns are blocked")
+    repo_root = _real_repo_path(repo_cwd)
+
+    records: list[SpawnRecord] = []
+    errors: dict[str, str] = {}
+    for task_id in dict.fromkeys(task_ids):
+        try:
+            records.append(spawn(
+                task_id, agent_id, repo_root,
+                model=model, timeout_s=timeout_s, backend=backend, data_dir=data_dir,
+            ))
+        except SpawnError as exc:
+            errors[task_id] = str(exc)
+    return records, errors
+
+
 def check(spawn_id: str, data_dir: Path | None = None) -> CheckResult:
     """Poll-only liveness check. No side effects, no receipts."""
     record = _get_spawn(spawn_id, data_dir)
@@ -494,6 +555,118 @@ def check(spawn_id: str, data_dir: Path | None = None) -> CheckResult:
         return CheckResult(spawn_id=spawn_id, running=True, exit_code=None)
 
 
+def _wait_pids_exit(pids: list[int], timeout_s: float) -> dict[int, int | None]:
+    """Block until at least one of *pids* exits or *timeout_s* passes.
+
+    Returns {pid: exit_code} for every pid found exited (empty on timeout);
+    timeout_s <= 0 waits forever. All pidfds are watched by a single poll()
+    so the wait happens in the kernel (Linux 5.3+); falls back to
+    kill(pid, 0) polling elsewhere. exit_code is only known when this
+    process is the worker's parent.
+    """
+    timeout_ms = int(timeout_s * 1000) if timeout_s > 0 else None
+    exited: dict[int, int | None] = {}
+    fds: dict[int, int] = {}
+    try:
+        for pid in dict.fromkeys(pids):
+            try:
+                fds[os.pidfd_open(pid)] = pid
+            except ProcessLookupError:
+                exited[pid] = None
+            except (AttributeError, OSError):
+                # No pidfd for this one (old kernel, EMFILE, ...): release the
+                # ones already opened and fall back to kill() polling.
+                for fd in fds:
+                    os.close(fd)
+                fds.clear()
+                break
+        else:
+            if exited or not fds:
+                return exited
+            poller = select.poll()
+            for fd in fds:
+                poller.register(fd, select.POLLIN)
+            for fd, _event in poller.poll(timeout_ms):
+                try:
+                    info = os.waitid(os.P_PIDFD, fd, os.WEXITED | os.WNOHANG)
+                except (AttributeError, ChildProcessError, OSError):
+                    info = None
+                exited[fds[fd]] = info.si_status if info is not None else None
+            return exited
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+    deadline = time.monotonic() + timeout_s if timeout_s > 0 else None
+    while True:
+        for pid in pids:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                exited[pid] = None
+            except PermissionError:
+                pass
+        if exited:
+            return exited
+        if deadline is not None and time.monotonic() >= deadline:
+            return exited
+        remaining = 0.2 if deadline is None else deadline - time.monotonic()
+        time.sleep(max(0.0, min(0.2, remaining)))
+
+
+def _wait_pid_exit(pid: int, timeout_s: float) -> tuple[bool, int | None]:
+    """Block until *pid* exits or *timeout_s* passes. Returns (exited, exit_code)."""
+    exited = _wait_pids_exit([pid], timeout_s)
+    return pid in exited, exited.get(pid)
+
+
+def wait(
+    spawn_id: str,
+    timeout_s: float = 0.0,
+    data_dir: Path | None = None,
+) -> CheckResult:
+    """Block until the worker exits or *timeout_s* passes, then check().
+
+    No side effects, no receipts. timeout_s <= 0 waits indefinitely.
+    """
+    record = _get_spawn(spawn_id, data_dir)
+    if record.ended_at:
+        return check(spawn_id, data_dir)
+
+    _exited, exit_code = _wait_pid_exit(record.pid, timeout_s)
+    result = check(spawn_id, data_dir)
+    if not result.running and result.exit_code is None:
+        result.exit_code = exit_code
+    return result
+
+
+def wait_any(
+    spawn_ids: list[str],
+    timeout_s: float = 0.0,
+    data_dir: Path | None = None,
+) -> list[CheckResult]:
+    """Block until any of the workers exits or *timeout_s* passes.
+
+    Returns check() results for every worker found exited, in spawn_ids
+    order; empty on timeout. Already-finalized spawns count as exited
+    without waiting. No side effects, no receipts.
+    """
+    records = [_get_spawn(sid, data_dir) for sid in dict.fromkeys(spawn_ids)]
+    exit_codes: dict[int, int | None] = {}
+    if records and not any(r.ended_at for r in records):
+        exit_codes = _wait_pids_exit([r.pid for r in records], timeout_s)
+
+    results = []
+    for r in records:
+        if r.ended_at:
+            results.append(check(r.spawn_id, data_dir))
+        elif r.pid in exit_codes:
+            results.append(CheckResult(
+                spawn_id=r.spawn_id, running=False, exit_code=exit_codes[r.pid],
+            ))
+    return results
+
+
 def harvest(
     spawn_id: str,
     cleanup_worktree: bool = True,
@@ -516,21 +689,44 @@ def harvest(
     if status.running:
         raise SpawnError(f"Spawn {spawn_id} still running (pid={record.pid})")
 
-    # Read output via adapter. If backend is unknown (e.g., plugin not loaded
-    # in this runtime), fail closed instead of crashing watchdog/CLI.
+    worker_out = _read_worker_output(record)
+    outcome = "success" if worker_out.success else "failure"
+
+    # Claim finalization atomically BEFORE any side effects.
+    # If another caller (watchdog, manual CLI) finalized first, bail out.
+    now = _now()
+    claimed = db.finalize_spawn(spawn_id, ended_at=now, outcome=outcome, data_dir=data_dir)
+    if not claimed:
+        raise SpawnError(f"Spawn {spawn_id} already finalized (race)")
+
+    return _complete_harvest(record, worker_out, cleanup_worktree, data_dir)
+
+
+def _read_worker_output(record: SpawnRecord) -> WorkerOutput:
+    """Parse a finished worker's output via its adapter.
+
+    If the backend is unknown (e.g., plugin not loaded in this runtime),
+    fail closed instead of crashing watchdog/CLI.
+    """
     try:
         adapter = get_adapter(record.backend)
     except ValueError:
-        worker_out = WorkerOutput(
+        return WorkerOutput(
             success=False,
             raw={"error": "unknown_backend", "backend": record.backend},
             error_message=f"unknown backend: {record.backend}",
         )
-    else:
-        worker_out = normalize_worker_output(
-            adapter.parse_output(Path(record.output_path))
-        )
+    return normalize_worker_output(adapter.parse_output(Path(record.output_path)))
 
+
+def _complete_harvest(
+    record: SpawnRecord,
+    worker_out: WorkerOutput,
+    cleanup_worktree: bool,
+    data_dir: Path | None,
+) -> HarvestResult:
+    """Harvest side effects; the caller must already have won finalize CAS."""
+    spawn_id = record.spawn_id
     success = worker_out.success
     output_data = worker_out.raw
     outcome = "success" if success else "failure"
@@ -538,14 +734,6 @@ def harvest(
     verify_passed: bool | None = None
     verify_summary = ""
 
-    # Claim finalization atomically BEFORE any side effects.
-    # If another caller (watchdog, manual CLI) finalized first, bail out.
-    now = _now()
-    claimed = db.finalize_spawn(spawn_id, ended_at=now, outcome=outcome, data_dir=data_dir)
-    if not claimed:
-        raise SpawnError(f"Spawn {spawn_id} already finalized (race)")
-
-    # -- Side effects: only the winner of the CAS reaches here --
     task_for_meta = db.get_task(record.task_id, data_dir)
     task_meta = task_for_meta.meta if task_for_meta is not None else {}
     verify_cmd = _verification_command(task_meta, record.repo_cwd)
@@ -659,6 +847,59 @@ def harvest(
     )
 
 
+def harvest_many(
+    spawn_ids: list[str],
+    cleanup_worktree: bool = True,
+    data_dir: Path | None = None,
+) -> tuple[list[HarvestResult], dict[str, str]]:
+    """Harvest several finished workers.
+
+    Outputs are parsed concurrently and finalization is claimed for the
+    whole batch in one transaction; per-spawn side effects (verification,
+    task transitions, receipts) then run as in harvest(), outside the
+    write lock. Returns (results, {spawn_id: error}).
+    """
+    errors: dict[str, str] = {}
+    ready: list[SpawnRecord] = []
+    for spawn_id in dict.fromkeys(spawn_ids):
+        try:
+            record = _get_spawn(spawn_id, data_dir)
+        except SpawnError as exc:
+            errors[spawn_id] = str(exc)
+            continue
+        if record.ended_at:
+            errors[spawn_id] = f"Spawn {spawn_id} already harvested"
+        elif check(spawn_id, data_dir).running:
+            errors[spawn_id] = f"Spawn {spawn_id} still running (pid={record.pid})"
+        else:
+            ready.append(record)
+    if not ready:
+        return [], errors
+
+    with ThreadPoolExecutor(max_workers=min(8, len(ready))) as pool:
+        outputs = list(pool.map(_read_worker_output, ready))
+
+    now = _now()
+    claimed: set[str] = set()
+    with db.transaction(data_dir):
+        for outcome in ("success", "failure"):
+            ids = [
+                r.spawn_id for r, out in zip(ready, outputs)
+                if ("success" if out.success else "failure") == outcome
+            ]
+            claimed.update(db.finalize_spawns_many(
+                ids, ended_at=now, outcome=outcome, data_dir=data_dir,
+            ))
+
+    results: list[HarvestResult] = []
+    for record, worker_out in zip(ready, outputs):
+        if record.spawn_id not in claimed:
+            errors[record.spawn_id] = f"Spawn {record.spawn_id} already finalized (race)"
+            continue
+        results.append(_complete_harvest(record, worker_out, cleanup_worktree, data_dir))
+    return results, errors
+
+
 def abort(
     spawn_id: str,
     reason: str = "",
@@ -732,10 +973,87 @@ def abort(
     return record
 
 
+def abort_many(
+    spawn_ids: list[str],
+    reason: str = "",
+    cleanup_worktree: bool = True,
+    data_dir: Path | None = None,
+) -> list[SpawnRecord]:
+    """Abort several workers, batching the spawn/task/attempt DB writes.
+
+    Spawns that already ended (or are finalized concurrently) are skipped.
+    Returns the records this caller aborted.
+    """
+    active = {r.spawn_id: r for r in list_spawns(active_only=True, data_dir=data_dir)}
+    pending = [active[s] for s in dict.fromkeys(spawn_ids) if s in active]
+    for record in pending:
+        _terminate_pid(record.pid)
+
+    now = _now()
+    claimed = set(db.finalize_spawns_many(
+        [r.spawn_id for r in pending], ended_at=now, outcome="aborted", data_dir=data_dir,
+    ))
+    aborted = [r for r in pending if r.spawn_id in claimed]
+    if not aborted:
+        return []
+
+    orchestrator.abort_tasks_many(
+        [r.task_id for r in aborted],
+        data_dir=data_dir,
+        per_task={
+            r.task_id: (r.agent_id, reason or f"worker aborted: {r.spawn_id}")
+            for r in aborted
+        },
+    )
+    db.end_attempts_many(
+        [r.attempt_id for r in aborted if r.attempt_id],
+        outcome="aborted",
+        data_dir=data_dir,
+    )
+
+    for record in aborted:
+        record.ended_at = now
+        record.outcome = "aborted"
+        weaver.append_weave(
+            trace_id=record.spawn_id,
+            episode_id=record.episode_id or None,
+            data_dir=data_dir,
+        )
+        events.append_event(
+            kind=EventKind.WORKER_DONE,
+            agent_id=record.agent_id,
+            payload={
+                "spawn_id": record.spawn_id,
+                "task_id": record.task_id,
+                "outcome": "aborted",
+                "reason": reason,
+            },
+            data_dir=data_dir,
+        )
+
+    if cleanup_worktree:
+        for record in aborted:
+            _cleanup_worktree(record)
+
+    return aborted
+
+
 def list_spawns(
     active_only: bool = False,
     data_dir: Path | None = None,
 ) -> list[SpawnRecord]:
-    """List all spawn records, optionally filtered to active (no ended_at)."""
+    """List all spawn records, optionally filtered to active (no ended_at).
+
+    Served from a single SELECT over ``spawns``; no per-record lookups.
+    """
     rows = db.list_spawns_db(active_only=active_only, data_dir=data_dir)
     return [_row_to_record(r) for r in rows]
+
+
+def iter_spawns(
+    active_only: bool = False,
+    data_dir: Path | None = None,
+) -> Iterator[SpawnRecord]:
+    """Streaming list_spawns(): records are yielded as rows are read."""
+    for row in db.iter_spawns_db(active_only=active_only, data_dir=data_dir):
+        yield _row_to_record(row)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
@@ -19,22 +19,33 @@ from .models import Severity
 def render_status(data_dir: Path | None = None, console: Console | None = None,
                   as_json: bool = False) -> str | None:
     """Render the full status dashboard. Returns JSON string if as_json=True."""
+    if as_json:
+        return json.dumps(status_payload(data_dir), indent=2)
+
     c = console or Console()
+    c.print(build_renderable(data_dir))
+    return None
+
+
+def status_payload(data_dir: Path | None = None) -> dict[str, list[dict]]:
+    """Dashboard data as JSON-ready dicts (``model_dump(mode="json")``)."""
+    db.expire_stale_claims(data_dir)
+    return {
+        "agents": [a.model_dump(mode="json") for a in db.list_agents(data_dir)],
+        "claims": [cl.model_dump(mode="json") for cl in db.list_claims(data_dir, active_only=True)],
+        "messages": [m.model_dump(mode="json") for m in db.list_messages(data_dir, limit=10)],
+        "capsules": [cap.model_dump(mode="json") for cap in db.list_capsules(data_dir, limit=5)],
+    }
 
+
+def build_renderable(data_dir: Path | None = None) -> RenderableType:
+    """Build the dashboard as a single renderable (for printing or ``rich.live.Live``)."""
     db.expire_stale_claims(data_dir)
     agents = db.list_agents(data_dir)
     all_claims = db.list_claims(data_dir, active_only=True)
     msgs = db.list_messages(data_dir, limit=10)
     capsules = db.list_capsules(data_dir, limit=5)
 
-    if as_json:
-        return json.dumps({
-            "agents": [a.model_dump() for a in agents],
-            "claims": [cl.model_dump() for cl in all_claims],
-            "messages": [m.model_dump() for m in msgs],
-            "capsules": [cap.model_dump() for cap in capsules],
-        }, indent=2)
-
     # Agents table
     at = Table(title="Agents", show_header=True, header_style="bold")
     at.add_column("ID")
@@ -65,15 +76,7 @@ def render_status(data_dir: Path | None = None, console: Console | None = None,
         style = severity_style(m.severity)
         mt.add_row(m.from_agent, f"[{style}]{m.severity.value}[/]", m.body[:60], m.created_at[:19])
 
-    c.print()
-    c.print(at)
-    c.print()
-    c.print(ct)
-    c.print()
-    c.print(mt)
-
+    parts: list[RenderableType] = ["", at, "", ct, "", mt]
     if capsules:
-        c.print()
-        c.print(f"[dim]{len(capsules)} recent capsule(s)[/dim]")
-
-    return None
+        parts += ["", f"[dim]{len(capsules)} recent capsule(s)[/dim]"]
+    return Group(*parts)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from . import db, events
-from .models import AgentStatus, EventKind, TaskState
+from .models import AgentStatus, EventKind, Task, TaskState
 
 
 # Default: agent is stale after 5 minutes without heartbeat.
@@ -99,23 +100,44 @@ def abort_agent_tasks(
     return aborted
 
 
-def _is_pid_alive(pid: int, expected_create_time: float = 0.0) -> bool:
+def _live_pids() -> set[int] | None:
+    """Every PID visible in /proc in one directory read; None without /proc."""
+    try:
+        return {int(e) for e in os.listdir("/proc") if e.isdigit()}
+    except OSError:
+        return None
+
+
+def _is_pid_alive(
+    pid: int,
+    expected_create_time: float = 0.0,
+    live_pids: set[int] | None = None,
+    create_times: dict[int, float] | None = None,
+) -> bool:
     """Check if a process is still running.
 
     If *expected_create_time* is non-zero, also verify the running process
-    was created at the same time (guards against PID reuse).
+    was created at the same time (guards against PID reuse). Bulk callers
+    pass *live_pids* / *create_times* snapshots to skip per-PID probes.
     """
-    try:
-        os.kill(pid, 0)
-    except ProcessLookupError:
-        return False
-    except PermissionError:
-        pass  # exists but we can't signal -- fall through to reuse check
+    if live_pids is not None:
+        if pid not in live_pids:
+            return False
+    else:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass  # exists but we can't signal -- fall through to reuse check
 
     # PID exists.  If we have a fingerprint, verify it's the same process.
     if expected_create_time > 0:
-        from . import spawner
-        current_create_time = spawner._get_pid_create_time(pid)
+        if create_times is not None and pid in create_times:
+            current_create_time = create_times[pid]
+        else:
+            from . import spawner
+            current_create_time = spawner._get_pid_create_time(pid)
         if current_create_time > 0 and abs(current_create_time - expected_create_time) > 2.0:
             # Different process reused this PID
             return False
@@ -136,54 +158,99 @@ def _is_spawn_timed_out(spawn_row: dict, default_timeout_s: int) -> bool:
     return datetime.now(timezone.utc) > deadline
 
 
-def scan_spawns(
+def _scan_spawn_liveness(
     default_timeout_s: int = DEFAULT_SPAWN_TIMEOUT_S,
     data_dir: Path | None = None,
-) -> tuple[list[str], list[str]]:
-    """Scan active spawns: auto-harvest exited ones, auto-abort timed-out ones.
+) -> tuple[list[dict], list[dict]]:
+    """Read-only probe: classify active spawns as exited or timed out.
 
-    Returns (harvested_spawn_ids, timed_out_spawn_ids).
+    Returns (exited_rows, timed_out_rows). Performs no mutations.
     """
     from . import spawner
 
     active_rows = db.list_spawns_db(active_only=True, data_dir=data_dir)
+    if not active_rows:
+        return [], []
+
+    # One /proc read and one ps call cover every spawn, instead of a
+    # kill() + ps subprocess per PID.
+    live = _live_pids()
+    fingerprinted = sorted({
+        r["pid"] for r in active_rows
+        if (r.get("pid_started_at") or 0.0) > 0 and (live is None or r["pid"] in live)
+    })
+    create_times = spawner._get_pid_create_times(fingerprinted)
+    alive = {
+        r["spawn_id"]: _is_pid_alive(
+            r["pid"],
+            expected_create_time=r.get("pid_started_at", 0.0) or 0.0,
+            live_pids=live,
+            create_times=create_times,
+        )
+        for r in active_rows
+    }
+
+    # Re-read from DB to close TOCTOU gap (another process may have
+    # harvested/aborted a spawn between our list query and now).
+    exited: list[dict] = []
+    timed_out: list[dict] = []
+    for fresh in db.list_spawns_db(active_only=True, data_dir=data_dir):
+        if fresh["spawn_id"] not in alive:
+            continue
+        if not alive[fresh["spawn_id"]]:
+            exited.append(fresh)
+        elif _is_spawn_timed_out(fresh, default_timeout_s):
+            timed_out.append(fresh)
+
+    return exited, timed_out
+
+
+def _reap_spawns(
+    exited: list[dict],
+    timed_out: list[dict],
+    default_timeout_s: int = DEFAULT_SPAWN_TIMEOUT_S,
+    data_dir: Path | None = None,
+) -> tuple[list[str], list[str]]:
+    """Harvest exited spawns and abort timed-out ones. Returns acted-on spawn_ids."""
+    from . import spawner
+
     harvested: list[str] = []
-    timed_out: list[str] = []
+    aborted: list[str] = []
 
-    for row in active_rows:
-        spawn_id = row["spawn_id"]
+    for row in exited:
+        # Process exited -- auto-harvest
+        try:
+            spawner.harvest(row["spawn_id"], cleanup_worktree=True, data_dir=data_dir)
+            harvested.append(row["spawn_id"])
+        except spawner.SpawnError:
+            pass  # Already harvested by concurrent CLI/watchdog
 
-        # Re-read from DB to close TOCTOU gap (another process may have
-        # harvested/aborted this spawn between our list query and now).
-        fresh = db.get_spawn(spawn_id, data_dir)
-        if fresh is None or fresh.get("ended_at", ""):
-            continue
+    for row in timed_out:
+        # Still running but exceeded timeout -- abort
+        try:
+            spawner.abort(
+                row["spawn_id"],
+                reason=f"watchdog timeout ({row.get('timeout_s', 0) or default_timeout_s}s)",
+                cleanup_worktree=True,
+                data_dir=data_dir,
+            )
+            aborted.append(row["spawn_id"])
+        except spawner.SpawnError:
+            pass  # Already aborted by concurrent CLI/watchdog
 
-        pid = fresh["pid"]
-        pid_create_ts = fresh.get("pid_started_at", 0.0) or 0.0
-        alive = _is_pid_alive(pid, expected_create_time=pid_create_ts)
+    return harvested, aborted
 
-        if not alive:
-            # Process exited -- auto-harvest
-            try:
-                spawner.harvest(spawn_id, cleanup_worktree=True, data_dir=data_dir)
-                harvested.append(spawn_id)
-            except spawner.SpawnError:
-                pass  # Already harvested by concurrent CLI/watchdog
-        elif _is_spawn_timed_out(fresh, default_timeout_s):
-            # Still running but exceeded timeout -- abort
-            try:
-                spawner.abort(
-                    spawn_id,
-                    reason=f"watchdog timeout ({fresh.get('timeout_s', 0) or default_timeout_s}s)",
-                    cleanup_worktree=True,
-                    data_dir=data_dir,
-                )
-                timed_out.append(spawn_id)
-            except spawner.SpawnError:
-                pass  # Already aborted by concurrent CLI/watchdog
 
-    return harvested, timed_out
+def scan_spawns(
+    default_timeout_s: int = DEFAULT_SPAWN_TIMEOUT_S,
+    data_dir: Path | None = None,
+) -> tuple[list[str], list[str]]:
+    """Scan active spawns: auto-harvest exited ones, auto-abort timed-out ones.
+
+    Returns (harvested_spawn_ids, timed_out_spawn_ids).
+    """
+    exited, timed_out = _scan_spawn_liveness(default_timeout_s, data_dir)
+    return _reap_spawns(exited, timed_out, default_timeout_s, data_dir)
 
 
 def _task_budget_usd(meta: dict | None) -> float:
@@ -212,24 +279,23 @@ def _task_actual_cost_usd(task_id: str, data_dir: Path | None = None) -> float:
     return total
 
 
-def enforce_cost_budgets(
+def _scan_cost_exceeded(
     data_dir: Path | None = None,
-) -> tuple[list[str], list[str]]:
-    """Abort running tasks/spawns whose cumulative cost exceeded budget."""
-    from . import orchestrator, spawner, weaver
-
-    exceeded_tasks: list[str] = []
-    exceeded_spawns: list[str] = []
+) -> list[tuple[Task, float, float, list[str]]]:
+    """Read-only probe: running tasks over budget.
 
+    Returns (task, budget_usd, actual_usd, active_spawn_ids) tuples.
+    """
     running_tasks = db.list_tasks(data_dir=data_dir, state=TaskState.RUNNING, limit=500)
     if not running_tasks:
-        return exceeded_tasks, exceeded_spawns
+        return []
 
     active_rows = db.list_spawns_db(active_only=True, data_dir=data_dir)
     active_by_task: dict[str, list[str]] = {}
     for row in active_rows:
         active_by_task.setdefault(row.get("task_id", ""), []).append(row.get("spawn_id", ""))
 
+    exceeded: list[tuple[Task, float, float, list[str]]] = []
     for task in running_tasks:
         budget = _task_budget_usd(task.meta)
         if budget <= 0:
@@ -237,8 +303,27 @@ def enforce_cost_budgets(
         actual = _task_actual_cost_usd(task.task_id, data_dir=data_dir)
         if actual <= budget:
             continue
-
         spawn_ids = [s for s in active_by_task.get(task.task_id, []) if s]
+        exceeded.append((task, budget, actual, spawn_ids))
+    return exceeded
+
+
+def _abort_cost_exceeded(
+    exceeded: list[tuple[Task, float, float, list[str]]],
+    data_dir: Path | None = None,
+) -> tuple[list[str], list[str]]:
+    """Abort tasks/spawns found by _scan_cost_exceeded and emit receipts."""
+    from . import orchestrator, spawner, weaver
+
+    exceeded_tasks: list[str] = []
+    exceeded_spawns: list[str] = []
+
+    for task, budget, actual, spawn_ids in exceeded:
+        # An earlier phase of this pass may already have finished the task.
+        current = db.get_task(task.task_id, data_dir)
+        if current is None or current.state != TaskState.RUNNING:
+            continue
+
         if spawn_ids:
             for spawn_id in spawn_ids:
                 try:
@@ -282,17 +367,35 @@ def enforce_cost_budgets(
     return exceeded_tasks, exceeded_spawns
 
 
+def enforce_cost_budgets(
+    data_dir: Path | None = None,
+) -> tuple[list[str], list[str]]:
+    """Abort running tasks/spawns whose cumulative cost exceeded budget."""
+    return _abort_cost_exceeded(_scan_cost_exceeded(data_dir), data_dir)
+
+
 def scan(
     stale_threshold_s: int = DEFAULT_STALE_THRESHOLD_S,
     spawn_timeout_s: int = DEFAULT_SPAWN_TIMEOUT_S,
     data_dir: Path | None = None,
 ) -> WatchdogResult:
     """Run one watchdog pass: find stale agents, reap them, abort their tasks,
-    and auto-harvest/abort orphaned spawns."""
+    and auto-harvest/abort orphaned spawns.
+
+    The three read-only probes are independent and run concurrently; the
+    mutations they feed (reap, harvest/abort, budget aborts) run serially.
+    """
     result = WatchdogResult()
 
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        stale_f = pool.submit(check_stale_agents, stale_threshold_s, data_dir)
+        spawns_f = pool.submit(_scan_spawn_liveness, spawn_timeout_s, data_dir)
+        cost_f = pool.submit(_scan_cost_exceeded, data_dir)
+        stale = stale_f.result()
+        exited_rows, timed_out_rows = spawns_f.result()
+        over_budget = cost_f.result()
+
     # -- Agent liveness --
-    stale = check_stale_agents(stale_threshold_s, data_dir)
     result.stale_agents = stale
 
     for agent_id in stale:
@@ -303,10 +406,10 @@ def scan(
         result.aborted_tasks.extend(aborted)
 
     # -- Spawn liveness --
-    harvested, timed_out = scan_spawns(spawn_timeout_s, data_dir)
+    harvested, timed_out = _reap_spawns(exited_rows, timed_out_rows, spawn_timeout_s, data_dir)
     result.harvested_spawns = harvested
     result.timed_out_spawns = timed_out
-    exceeded_tasks, exceeded_spawns = enforce_cost_budgets(data_dir=data_dir)
+    exceeded_tasks, exceeded_spawns = _abort_cost_exceeded(over_budget, data_dir)
     result.cost_exceeded_tasks = exceeded_tasks
     result.cost_exceeded_spawns = exceeded_spawns
 
@@ -278,9 +278,16 @@ def create_and_sign(
     agent_id: str,
     cwd: str | None = None,
     data_dir: Path | None = None,
+    snapshot: tuple[list[str], str, str] | None = None,
+    episode_id: str | None = None,
 ) -> tuple[dict[str, Any], str, str, str, str] | None:
-    """Build, sign, persist, and encode witness. Returns trailers bundle or None."""
-    ep_id = episodes.get_current_episode(data_dir)
+    """Build, sign, persist, and encode witness. Returns trailers bundle or None.
+
+    *snapshot* is a gitbridge.get_staged_snapshot() result and *episode_id*
+    the current episode, when the caller already holds them; otherwise they
+    are read here.
+    """
+    ep_id = episodes.get_current_episode(data_dir) if episode_id is None else episode_id
     if not ep_id:
         return None
 
@@ -288,13 +295,13 @@ def create_and_sign(
     if not kid:
         return None
 
-    diff_text = gitbridge.get_staged_diff(cwd)
+    if snapshot is None:
+        snapshot = gitbridge.get_staged_snapshot(cwd)
+    files, diff_text, patch_hash = snapshot
     if not diff_text:
         return None
 
     patch_id = gitbridge.compute_patch_id_stable(diff_text, cwd)
-    patch_hash = gitbridge.compute_patch_hash(diff_text)
-    files = gitbridge.get_staged_files(cwd)
     signer_pub_b64 = keystore.public_key_b64(kid, data_dir)
 
     w = build_witness(
@@ -156,9 +156,14 @@ def normalize_worker_output(result: WorkerOutput | tuple[bool, dict[str, Any]])
 # ---------------------------------------------------------------------------
 # Registry
 # ---------------------------------------------------------------------------
+# Discovery happens once, at import: the built-in adapter plus any modules
+# named in AGENTMESH_ADAPTER_MODULES. Lookups and listings only read the
+# in-memory registry; nothing here rescans installed distributions.
 
 _ADAPTERS: dict[str, WorkerAdapter] = {}
 _ADAPTER_LOAD_ERRORS: list[str] = []
+# name -> (adapter it describes, info); stale once _ADAPTERS[name] is replaced.
+_ADAPTER_INFO: dict[str, tuple[WorkerAdapter, AdapterInfo]] = {}
 
 
 def register_adapter(adapter: WorkerAdapter) -> None:
@@ -178,20 +183,7 @@ def get_adapter(name: str) -> WorkerAdapter:
 
 def list_adapters() -> list[AdapterInfo]:
     """List registered backends with versions."""
-    out: list[AdapterInfo] = []
-    for name in sorted(_ADAPTERS):
-        adapter = _ADAPTERS[name]
-        mod = adapter.__class__.__module__
-        origin = _adapter_origin(adapter)
-        out.append(
-            AdapterInfo(
-                name=name,
-                version=getattr(adapter, "version", "") or "",
-                module=mod,
-                origin=origin,
-            )
-        )
-    return out
+    return [describe_adapter(name) for name in sorted(_ADAPTERS)]
 
 
 def get_adapter_load_errors() -> list[str]:
@@ -210,13 +202,23 @@ def _adapter_origin(adapter: WorkerAdapter) -> str:
 
 
 def describe_adapter(name: str) -> AdapterInfo:
+    """AdapterInfo for a registered backend, memoized per adapter instance.
+
+    Resolving the origin costs source lookups and a realpath walk, and spawn
+    paths ask for it more than once (policy gate + adapter_load event).
+    """
     adapter = get_adapter(name)
-    return AdapterInfo(
+    cached = _ADAPTER_INFO.get(name)
+    if cached is not None and cached[0] is adapter:
+        return cached[1]
+    info = AdapterInfo(
         name=name,
         version=getattr(adapter, "version", "") or "",
         module=adapter.__class__.__module__,
         origin=_adapter_origin(adapter),
     )
+    _ADAPTER_INFO[name] = (adapter, info)
+    return info
 
 
 def _read_policy(repo_cwd: str | Path | None) -> dict[str, Any]:
@@ -86,3 +86,27 @@ def test_bundle_json_includes_sbar(tmp_data_dir: Path) -> None:
     assert bundle is not None
     assert "sbar" in bundle
     assert bundle["sbar"]["situation"]["global_objective"] == "Bundle SBAR"
+
+
+def test_bundle_get_cli_sbar_and_summary(tmp_data_dir: Path) -> None:
+    from typer.testing import CliRunner
+
+    from agentmesh.cli import app
+
+    _register("a1", tmp_data_dir)
+    cap = build_capsule("a1", task_desc="Fix [/x] parser", data_dir=tmp_data_dir)
+    runner = CliRunner()
+    base = ["--data-dir", str(tmp_data_dir), "bundle", "get", cap.capsule_id]
+
+    result = runner.invoke(app, base + ["--sbar"])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0] == f"SBAR Handoff -- {cap.capsule_id}"
+    assert lines[2].startswith("Situation: Fix [/x] parser")
+    assert any(line.startswith("Recommendation: ") for line in lines)
+
+    result = runner.invoke(app, base)
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[:3] == [
+        f"Capsule: {cap.capsule_id}", "  Agent: a1", "  Task: Fix [/x] parser",
+    ]
@@ -6,8 +6,9 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from agentmesh import db
-from agentmesh.claims import make_claim, release, check, normalize_path, parse_resource_string
-from agentmesh.models import Agent, ClaimIntent, ClaimState, ResourceType
+from agentmesh import events
+from agentmesh.claims import make_claim, make_claims_bulk, release, release_many, check, normalize_path, parse_resource_string
+from agentmesh.models import Agent, ClaimIntent, ClaimState, EventKind, ResourceType
 
 
 def _register(agent_id: str, data_dir: Path) -> None:
@@ -201,3 +202,34 @@ def test_backward_compat_bare_path(tmp_data_dir: Path) -> None:
     assert ok
     assert clm.resource_type == ResourceType.FILE
     assert clm.path == normalize_path("/tmp/foo.py")
+
+
+def test_make_claims_bulk_partial_conflict(tmp_data_dir: Path) -> None:
+    """A conflict on one resource does not roll back the others in the batch."""
+    _register("a1", tmp_data_dir)
+    _register("a2", tmp_data_dir)
+    make_claim("a1", "/tmp/foo.py", data_dir=tmp_data_dir)
+    results = make_claims_bulk(
+        "a2",
+        [("/tmp/foo.py", ClaimIntent.EDIT, 60, ""), ("PORT:3000", ClaimIntent.EDIT, 60, "dev")],
+        data_dir=tmp_data_dir,
+    )
+    assert [ok for ok, _, _ in results] == [False, True]
+    assert results[0][2][0].agent_id == "a1"
+    assert results[1][1].resource_type == ResourceType.PORT
+    assert [c.path for c in db.list_claims(tmp_data_dir, agent_id="a2")] == ["3000"]
+    claim_events = [e for e in events.read_events(tmp_data_dir) if e.agent_id == "a2"]
+    assert [e.payload["path"] for e in claim_events] == ["3000"]
+
+
+def test_release_many(tmp_data_dir: Path) -> None:
+    """release_many frees each listed resource and logs one event per release."""
+    _register("a1", tmp_data_dir)
+    make_claim("a1", "/tmp/foo.py", data_dir=tmp_data_dir)
+    make_claim("a1", "LOCK:npm", data_dir=tmp_data_dir)
+    make_claim("a1", "/tmp/keep.py", data_dir=tmp_data_dir)
+    count = release_many("a1", ["/tmp/foo.py", "LOCK:npm", "/tmp/none.py"], data_dir=tmp_data_dir)
+    assert count == 2
+    assert [c.path for c in db.list_claims(tmp_data_dir, agent_id="a1")] == [normalize_path("/tmp/keep.py")]
+    released = [e.payload["path"] for e in events.read_events(tmp_data_dir) if e.kind == EventKind.RELEASE]
+    assert released == [normalize_path("/tmp/foo.py"), "npm"]
@@ -0,0 +1,227 @@
+"""Tests for CLI-wide plumbing: lazy imports, app build caching, agent id and JSON output."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import typer
+import typer.main
+
+from agentmesh.cli import app
+
+
+def test_cli_import_defers_worker_modules():
+    code = (
+        "import sys, agentmesh.cli; "
+        "print(type(sys.modules['agentmesh.spawner']).__name__, "
+        "type(sys.modules['agentmesh.worker_adapters']).__name__, "
+        "type(sys.modules['agentmesh.orchestrator']).__name__, "
+        "type(sys.modules['agentmesh.watchdog']).__name__, "
+        "'json' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout.split()
+    # Stdlib json is imported where it is used, never swapped for a lazy stub.
+    assert out == ["_LazyModule"] * 4 + ["False"]
+
+
+def test_cli_import_adds_no_stdlib_modules_beyond_typer():
+    code = (
+        "import sys, typer\n"
+        "before = set(sys.modules)\n"
+        "import agentmesh.cli\n"
+        "print(sorted(n for n in set(sys.modules) - before\n"
+        "             if not n.startswith('agentmesh') and n != '__future__'\n"
+        "             and type(sys.modules[n]).__name__ != '_LazyModule'))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    assert out == "[]"
+
+
+def test_cli_help_does_not_load_board_modules():
+    code = (
+        "import sys\n"
+        "from agentmesh.cli import app\n"
+        "try:\n"
+        "    app(['--help'], prog_name='agentmesh')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(n for n, m in sys.modules.items()\n"
+        "             if n.startswith('agentmesh.') and type(m).__name__ != '_LazyModule'))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout.splitlines()[-1]
+    assert out == "['agentmesh.cli']"
+
+
+def test_piped_output_does_not_import_rich(tmp_path):
+    code = (
+        "import sys\n"
+        "from agentmesh.cli import app\n"
+        "try:\n"
+        f"    app(['--data-dir', {str(tmp_path)!r}, 'worker', 'list'], prog_name='agentmesh')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('rich' in sys.modules)\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k not in ("FORCE_COLOR", "TTY_COMPATIBLE")}
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env,
+    ).stdout.splitlines()
+    assert out == ["No workers", "False"]
+
+
+def test_app_builds_click_command_once(capsys):
+    from agentmesh import __version__
+
+    app._built = None
+    with patch.object(typer.main, "get_command", wraps=typer.main.get_command) as spy:
+        for _ in range(2):
+            try:
+                app(["--version"], prog_name="agentmesh")
+            except SystemExit as exc:
+                assert exc.code == 0
+    assert spy.call_count == 1
+    assert capsys.readouterr().out.count(f"agentmesh {__version__}") == 2
+
+
+def test_app_builds_only_invoked_subcommand(tmp_path, capsys):
+    from agentmesh.cli import _sniff_subcommand
+
+    assert _sniff_subcommand(["--data-dir", "/x", "worker", "list"]) == "worker"
+    assert _sniff_subcommand(["--data-dir=/x", "status"]) == "status"
+    assert _sniff_subcommand(["--help"]) is None
+    assert _sniff_subcommand([]) is None
+
+    app._built = None
+    with patch.object(typer.main, "get_command", wraps=typer.main.get_command) as spy:
+        try:
+            app(["--data-dir", str(tmp_path), "worker", "list"], prog_name="agentmesh")
+        except SystemExit as exc:
+            assert exc.code == 0
+    assert list(app._built[1].commands) == ["worker"]
+    assert spy.call_count == 1
+    assert "No workers" in capsys.readouterr().out
+
+
+def test_app_run_leaves_typer_get_command_alone(tmp_path):
+    other = typer.Typer()
+
+    @other.command()
+    def hello() -> None:
+        pass
+
+    seen = []
+
+    def _list_spawns(**kwargs):
+        seen.append(typer.main.get_command(other))
+        return []
+
+    with patch("agentmesh.spawner.list_spawns", side_effect=_list_spawns):
+        try:
+            app(["--data-dir", str(tmp_path), "worker", "list"], prog_name="agentmesh")
+        except SystemExit as exc:
+            assert exc.code == 0
+    assert seen[0] is not app._built[1]
+    assert seen[0].callback.__name__ == "hello"
+
+
+def test_version_fast_path_skips_cli_import():
+    code = (
+        "import sys\n"
+        "sys.argv = ['agentmesh', '--version']\n"
+        "from agentmesh.__main__ import main\n"
+        "main()\n"
+        "print('typer' in sys.modules, 'agentmesh.cli' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+    from agentmesh import __version__
+    assert out == [f"agentmesh {__version__}", "False False"]
+
+
+def test_auto_agent_id_probes_session_once(monkeypatch):
+    from agentmesh import cli
+
+    monkeypatch.delenv("AGENTMESH_AGENT_ID", raising=False)
+    cli._session_agent_id.cache_clear()
+    with patch("agentmesh.cli.os.ttyname", return_value="/dev/pts/7") as tty:
+        assert cli._auto_agent_id() == "claude_7"
+        assert cli._auto_agent_id() == "claude_7"
+        monkeypatch.setenv("AGENTMESH_AGENT_ID", "explicit")
+        assert cli._auto_agent_id() == "explicit"
+    assert tty.call_count == 1
+    cli._session_agent_id.cache_clear()
+
+
+def test_session_agent_id_file_without_tty(tmp_path, monkeypatch):
+    from agentmesh import cli
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("TTY", raising=False)
+    cli._session_agent_id.cache_clear()
+    try:
+        with patch("agentmesh.cli.os.ttyname", side_effect=OSError):
+            created = cli._session_agent_id()
+            session_file = tmp_path / ".agentmesh" / ".session_id"
+            assert session_file.read_text() == created
+            cli._session_agent_id.cache_clear()
+            session_file.write_text("claude_saved\n")
+            assert cli._session_agent_id() == "claude_saved"
+    finally:
+        cli._session_agent_id.cache_clear()
+
+
+def test_json_text_matches_stdlib_layout():
+    from agentmesh import cli
+
+    obj = {"a": [1, 2.5, None], "b": {"c": True}, 3: "x"}
+    assert cli._json_text(obj) == json.dumps(obj, separators=(",", ":"))
+    assert cli._json_text(obj, pretty=True) == json.dumps(obj, indent=2)
+    assert cli._json_text({"n": 1 << 70}) == '{"n":1180591620717411303424}'
+    with patch.object(cli, "_orjson", return_value=None):
+        assert cli._json_text(obj) == json.dumps(obj, separators=(",", ":"))
+
+
+def test_json_text_non_ascii_and_floats():
+    from agentmesh import cli
+
+    obj = {"t": "café", "f": [1e16, 0.1, -2.5e-7, 3.0]}
+    with patch.object(cli, "_orjson", return_value=None):
+        assert cli._json_text(obj) == json.dumps(obj, separators=(",", ":"))
+        assert cli._json_text(obj) == '{"t":"caf\\u00e9","f":[1e+16,0.1,-2.5e-07,3.0]}'
+        assert cli._json_text({"x": float("nan")}) == '{"x":NaN}'
+    # orjson, when installed, differs in bytes but not in parsed values
+    # (NaN aside, which it writes as null) -- see _json_bytes.
+    assert json.loads(cli._json_text(obj)) == obj
+    assert json.loads(cli._json_text(obj, pretty=True)) == obj
+    if cli._orjson() is not None:
+        assert cli._json_text(obj).startswith('{"t":"café"')
+        assert cli._json_text({"x": float("nan")}) == '{"x":null}'
+
+
+def test_print_json_writes_bytes_after_pending_text(capfdbinary):
+    from agentmesh import cli
+
+    sys.stdout.write("before\n")
+    cli._print_json({"k": "é"})
+    out = capfdbinary.readouterr().out
+    assert out.startswith(b"before\n")
+    assert json.loads(out[len(b"before\n"):].decode()) == {"k": "é"}
+
+    # Text-only streams (no .buffer) still get the document.
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        cli._print_json([1, 2], pretty=True)
+    assert sink.getvalue() == json.dumps([1, 2], indent=2) + "\n"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import subprocess
 from pathlib import Path
@@ -240,6 +241,85 @@ def test_cli_commit_capsule_links_to_weave(tmp_path: Path, tmp_data_dir: Path, m
     assert evts[0].capsule_id.startswith("cap_")
 
 
+def test_cli_commit_capsule_rolls_back_with_weave(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    """A failed weave append must not leave an orphan capsule row or bundle file behind."""
+    from agentmesh import weaver
+
+    repo = _init_repo(tmp_path / "repo")
+    (repo / "orphan.py").write_text("o = 1\n")
+    subprocess.run(["git", "add", "orphan.py"], cwd=str(repo), capture_output=True, check=True)
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "cap_agent")
+
+    def _boom(**kwargs):
+        raise RuntimeError("weave failed")
+
+    monkeypatch.setattr(weaver, "append_weave", _boom)
+    result = runner.invoke(app, ["commit", "-m", "orphan", "--capsule", "--no-episode-trailer"])
+    assert result.exit_code != 0
+
+    assert db.list_capsules(tmp_data_dir) == []
+    assert db.list_weave_events(tmp_data_dir) == []
+    assert not list((tmp_data_dir / "bundles").glob("*.json"))
+
+
+def test_cli_commit_warms_witness_during_tests(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    """--run-tests imports the witness signer on a side thread while tests run."""
+    import threading
+
+    from agentmesh import cli
+
+    repo = _init_repo(tmp_path / "repo")
+    (repo / "warm.py").write_text("w = 1\n")
+    subprocess.run(["git", "add", "warm.py"], cwd=str(repo), capture_output=True, check=True)
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "warm_agent")
+    seen: list[str] = []
+    monkeypatch.setattr(cli, "_warm_witness", lambda: seen.append(threading.current_thread().name))
+
+    result = runner.invoke(app, ["commit", "-m", "warm", "--run-tests", "python3 -c 'print(1)'"])
+    assert result.exit_code == 0, result.output
+    assert seen == ["agentmesh-witness-warm"]
+
+
+def test_cli_commit_reads_current_episode_once(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    """Trailer and assay env share one read of the current episode."""
+    from agentmesh import episodes
+
+    repo = _init_repo(tmp_path / "repo")
+    ep_id = start_episode(title="once", data_dir=tmp_data_dir)
+    (repo / ".agentmesh").mkdir(parents=True, exist_ok=True)
+    (repo / ".agentmesh" / "policy.json").write_text(
+        '{"assay":{"emit_on_commit":true,"command":"python3 -c \\"print(1)\\""}}'
+    )
+    (repo / "once.py").write_text("o = 1\n")
+    subprocess.run(["git", "add", "once.py"], cwd=str(repo), capture_output=True, check=True)
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "once_agent")
+    reads: list[str] = []
+    real = episodes.get_current_episode
+
+    def _counting(data_dir=None):
+        reads.append(str(data_dir))
+        return real(data_dir)
+
+    monkeypatch.setattr(episodes, "get_current_episode", _counting)
+    result = runner.invoke(app, ["commit", "-m", "once"])
+    assert result.exit_code == 0, result.output
+    assert len(reads) == 1
+
+    log = subprocess.run(
+        ["git", "log", "-1", "--format=%B"], cwd=str(repo), capture_output=True, text=True,
+    ).stdout
+    assert ep_id in log
+
+
 def test_weave_verify_beyond_100_events(tmp_data_dir: Path) -> None:
     """Weave verify must check ALL events, not just first 100."""
     # Create 105 valid events
@@ -511,3 +591,41 @@ def test_cli_bridge_emit_json_output(tmp_path: Path, tmp_data_dir: Path, monkeyp
     assert parsed["schema_version"] == "1"
     assert "bridge_status" in parsed
     assert parsed["bridge_status"] in ("BRIDGE_EMIT_OK", "BRIDGE_EMIT_DEGRADED")
+
+
+def test_cli_commit_runs_capsule_git_outside_transaction(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    """The capsule's git probes run before the board write lock is taken."""
+    from agentmesh import capsules
+
+    repo = _init_repo(tmp_path / "repo")
+    (repo / "lock.py").write_text("l = 1\n")
+    subprocess.run(["git", "add", "lock.py"], cwd=str(repo), capture_output=True, check=True)
+
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "cap_agent")
+    in_tx: list[bool] = []
+    open_tx = [False]
+    real_run_git = capsules._run_git
+    real_transaction = db.transaction
+
+    @contextlib.contextmanager
+    def _tracking_transaction(data_dir=None):
+        with real_transaction(data_dir) as conn:
+            open_tx[0] = True
+            try:
+                yield conn
+            finally:
+                open_tx[0] = False
+
+    def _tracking_run_git(args, cwd=None):
+        in_tx.append(open_tx[0])
+        return real_run_git(args, cwd=cwd)
+
+    monkeypatch.setattr(db, "transaction", _tracking_transaction)
+    monkeypatch.setattr(capsules, "_run_git", _tracking_run_git)
+    result = runner.invoke(app, ["commit", "-m", "locked", "--capsule", "--no-episode-trailer"])
+    assert result.exit_code == 0, result.output
+    assert in_tx and not any(in_tx)
+    [cap] = db.list_capsules(tmp_data_dir)
+    assert (tmp_data_dir / "bundles" / f"{cap.capsule_id}.json").is_file()
@@ -197,6 +197,41 @@ def test_wal_mode(tmp_data_dir: Path) -> None:
     assert mode == "wal"
 
 
+def test_data_version_tracks_other_connections(tmp_data_dir: Path) -> None:
+    before = db.data_version(tmp_data_dir)
+    assert db.data_version(tmp_data_dir) == before
+    other = sqlite3.connect(str(tmp_data_dir / "board.db"))
+    other.execute("CREATE TABLE IF NOT EXISTS _probe (x)")
+    other.commit()
+    other.close()
+    assert db.data_version(tmp_data_dir) != before
+
+
+def test_connection_tuning_pragmas(tmp_data_dir: Path) -> None:
+    conn = db.get_connection(tmp_data_dir)
+    sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+    temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+    busy = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+    conn.close()
+    assert (sync, temp_store, busy) == (1, 2, 5000)  # NORMAL, MEMORY
+
+
+def test_wal_pragma_applied_once_per_board(tmp_data_dir: Path) -> None:
+    path = tmp_data_dir / "board.db"
+    db._wal_paths.discard(str(path))
+    first = db._open_connection(path)
+    assert str(path) in db._wal_paths
+    first.close()
+
+    # Later connections skip the pragma but still see the persisted mode.
+    second = db._open_connection(path)
+    mode = second.execute("PRAGMA journal_mode").fetchone()[0]
+    mmap = second.execute("PRAGMA mmap_size").fetchone()[0]
+    second.close()
+    assert mode == "wal"
+    assert mmap == 268435456
+
+
 def test_register_and_get_agent(tmp_data_dir: Path) -> None:
     now = _now()
     a = Agent(
@@ -211,6 +246,13 @@ def test_register_and_get_agent(tmp_data_dir: Path) -> None:
     assert got.display_name == "Test"
 
 
+def test_agent_exists(tmp_data_dir: Path) -> None:
+    assert not db.agent_exists("a1", tmp_data_dir)
+    db.register_agent(Agent(agent_id="a1", cwd="/tmp"), tmp_data_dir)
+    db.deregister_agent("a1", tmp_data_dir)
+    assert db.agent_exists("a1", tmp_data_dir)
+
+
 def test_deregister_agent(tmp_data_dir: Path) -> None:
     a = Agent(agent_id="test02", cwd="/tmp")
     db.register_agent(a, tmp_data_dir)
@@ -356,3 +398,142 @@ def test_migrate_claims_preserves_episode_and_priority_fields(tmp_path: Path) ->
     assert clm.episode_id == "ep_preserve"
     assert clm.priority == 9
     assert clm.effective_priority == 10
+
+
+def test_transaction_commits_helpers_together(tmp_path):
+    db.init_db(tmp_path)
+    with db.transaction(tmp_path):
+        db.register_agent(Agent(agent_id="tx_a"), tmp_path)
+        db.register_agent(Agent(agent_id="tx_b"), tmp_path)
+        # Reads inside the block see the block's own writes.
+        assert db.get_agent("tx_a", tmp_path) is not None
+    assert {a.agent_id for a in db.list_agents(tmp_path)} >= {"tx_a", "tx_b"}
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    db.init_db(tmp_path)
+    with pytest.raises(RuntimeError):
+        with db.transaction(tmp_path):
+            db.register_agent(Agent(agent_id="tx_gone"), tmp_path)
+            raise RuntimeError("boom")
+    assert db.get_agent("tx_gone", tmp_path) is None
+
+
+def test_transaction_nested_begin_uses_savepoint(tmp_path):
+    """check_and_claim's own BEGIN/rollback stays scoped inside transaction()."""
+    db.init_db(tmp_path)
+    db.register_agent(Agent(agent_id="holder"), tmp_path)
+    db.register_agent(Agent(agent_id="other"), tmp_path)
+    now = _now()
+    held = Claim(claim_id="c_held", agent_id="holder", path="/f.py",
+                 created_at=now, expires_at="2099-01-01T00:00:00+00:00")
+    assert db.check_and_claim(held, data_dir=tmp_path)[0]
+
+    with db.transaction(tmp_path):
+        db.register_agent(Agent(agent_id="tx_kept"), tmp_path)
+        clash = Claim(claim_id="c_clash", agent_id="other", path="/f.py",
+                      created_at=now, expires_at="2099-01-01T00:00:00+00:00")
+        ok, conflicts = db.check_and_claim(clash, data_dir=tmp_path)
+        assert not ok and conflicts
+
+    assert db.get_agent("tx_kept", tmp_path) is not None
+    active = db.list_claims(tmp_path, active_only=True)
+    assert [c.claim_id for c in active] == ["c_held"]
+
+
+def test_get_connection_reuses_pooled_connection(tmp_path):
+    db.init_db(tmp_path)
+    first = db.get_connection(tmp_path)
+    raw = first._conn
+    first.close()
+    second = db.get_connection(tmp_path)
+    try:
+        assert second._conn is raw
+        # Re-entrant use on the same thread gets a separate connection.
+        inner = db.get_connection(tmp_path)
+        assert getattr(inner, "_conn", inner) is not raw
+        inner.close()
+    finally:
+        second.close()
+
+
+def test_pooled_close_rolls_back_open_transaction(tmp_path):
+    db.init_db(tmp_path)
+    conn = db.get_connection(tmp_path)
+    conn.execute(
+        "INSERT INTO agents (agent_id, registered_at, last_heartbeat) VALUES ('half', ?, ?)",
+        (_now(), _now()),
+    )
+    conn.close()
+    assert db.get_agent("half", tmp_path) is None
+
+
+def test_close_pooled_connections_reopens_on_demand(tmp_path):
+    db.init_db(tmp_path)
+    db.close_pooled_connections()
+    db.register_agent(Agent(agent_id="after_close"), tmp_path)
+    assert db.get_agent("after_close", tmp_path) is not None
+
+
+def test_transaction_runs_on_pooled_connection(tmp_path):
+    from unittest.mock import patch
+
+    db.init_db(tmp_path)
+    db.list_agents(tmp_path)  # warm this thread's pool
+    with patch.object(db, "_open_connection", wraps=db._open_connection) as opens:
+        with db.transaction(tmp_path):
+            db.register_agent(Agent(agent_id="pooled_tx"), tmp_path)
+        with pytest.raises(RuntimeError):
+            with db.transaction(tmp_path):
+                db.register_agent(Agent(agent_id="rolled_back"), tmp_path)
+                raise RuntimeError("boom")
+        assert [a.agent_id for a in db.list_agents(tmp_path)] == ["pooled_tx"]
+    assert opens.call_count == 0
+
+
+def test_init_db_once_skips_repeat_init(tmp_path):
+    from unittest.mock import patch
+
+    with patch.object(db, "init_db", wraps=db.init_db) as spy:
+        db.init_db_once(tmp_path)
+        db.init_db_once(tmp_path)
+        assert spy.call_count == 1
+
+        db.close_pooled_connections()
+        # Move aside rather than unlink so the new file cannot reuse the inode.
+        (tmp_path / "board.db").rename(tmp_path / "board.db.old")
+        db.init_db_once(tmp_path)
+        assert spy.call_count == 2
+    assert db.list_agents(tmp_path) == []
+
+
+def test_init_db_once_serializes_concurrent_first_calls(tmp_path):
+    import threading
+    from unittest.mock import patch
+
+    start = threading.Barrier(4)
+
+    def _worker():
+        start.wait()
+        db.init_db_once(tmp_path)
+
+    with patch.object(db, "init_db", wraps=db.init_db) as spy:
+        threads = [threading.Thread(target=_worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert spy.call_count == 1
+
+
+def test_init_db_skips_migrations_on_stamped_board(tmp_path):
+    from unittest.mock import patch
+
+    db.init_db(tmp_path)
+    conn = db.get_connection(tmp_path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == db._SCHEMA_VERSION
+    conn.close()
+
+    with patch.object(db, "migrate_claims_add_resource_type") as migrate:
+        db.init_db(tmp_path)
+    migrate.assert_not_called()
@@ -65,3 +65,15 @@ def test_no_episode_default(tmp_data_dir: Path) -> None:
     assert clm.episode_id == ""
     msg = post("a1", "no ep", data_dir=tmp_data_dir)
     assert msg.episode_id == ""
+
+
+def test_current_episode_reads_file_without_stat(tmp_data_dir: Path, monkeypatch) -> None:
+    ep_id = start_episode(title="stat", data_dir=tmp_data_dir)
+
+    def _no_exists(self: Path) -> bool:
+        raise AssertionError("exists() should not be called")
+
+    monkeypatch.setattr(Path, "exists", _no_exists)
+    assert get_current_episode(tmp_data_dir) == ep_id
+    (tmp_data_dir / "current_episode").unlink()
+    assert get_current_episode(tmp_data_dir) == ""
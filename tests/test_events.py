@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from agentmesh.events import append_event, read_events, verify_chain, _GENESIS_HASH
+from agentmesh.events import append_event, append_events, read_events, verify_chain, _GENESIS_HASH
 from agentmesh.models import EventKind
 
 
@@ -22,6 +22,19 @@ def test_append_chain(tmp_data_dir: Path) -> None:
     assert e2.prev_hash == e1.event_hash
 
 
+def test_append_events_batch_chains(tmp_data_dir: Path) -> None:
+    e0 = append_event(EventKind.REGISTER, agent_id="a1", data_dir=tmp_data_dir)
+    batch = append_events(
+        [(EventKind.CLAIM, "a1", {"path": "a.py"}), (EventKind.CLAIM, "a1", {"path": "b.py"})],
+        data_dir=tmp_data_dir,
+    )
+    assert [e.seq for e in batch] == [2, 3]
+    assert batch[0].prev_hash == e0.event_hash
+    assert batch[1].prev_hash == batch[0].event_hash
+    assert verify_chain(tmp_data_dir) == (True, "")
+    assert append_events([], data_dir=tmp_data_dir) == []
+
+
 def test_read_events(tmp_data_dir: Path) -> None:
     append_event(EventKind.REGISTER, agent_id="a1", data_dir=tmp_data_dir)
     append_event(EventKind.HEARTBEAT, agent_id="a1", data_dir=tmp_data_dir)
@@ -58,3 +71,29 @@ def test_verify_chain_tampered(tmp_data_dir: Path) -> None:
     valid, err = verify_chain(tmp_data_dir)
     assert not valid
     assert "Hash mismatch" in err
+
+
+def test_wait_for_change_wakes_on_append(tmp_data_dir: Path) -> None:
+    import threading
+    import time
+
+    from agentmesh.events import log_signature, wait_for_change
+
+    before = log_signature(tmp_data_dir)
+    timer = threading.Timer(
+        0.1, append_event, args=(EventKind.HEARTBEAT,), kwargs={"data_dir": tmp_data_dir},
+    )
+    timer.start()
+    started = time.monotonic()
+    after = wait_for_change(before, timeout_s=5.0, data_dir=tmp_data_dir)
+    timer.join()
+    assert after != before
+    assert time.monotonic() - started < 2.0
+
+
+def test_wait_for_change_times_out_when_idle(tmp_data_dir: Path) -> None:
+    from agentmesh.events import log_signature, wait_for_change
+
+    append_event(EventKind.REGISTER, agent_id="a1", data_dir=tmp_data_dir)
+    sig = log_signature(tmp_data_dir)
+    assert wait_for_change(sig, timeout_s=0.1, data_dir=tmp_data_dir) == sig
@@ -9,6 +9,7 @@ from agentmesh.gitbridge import (
     compute_patch_hash,
     get_staged_diff,
     get_staged_files,
+    get_staged_snapshot,
     git_commit,
     is_git_repo,
 )
@@ -55,6 +56,23 @@ def test_staged_files_and_diff(tmp_path: Path) -> None:
     assert "x = 1" in diff
 
 
+def test_staged_snapshot_matches_individual_helpers(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path / "repo")
+    (repo / "init.txt").write_text("init\n")
+    subprocess.run(["git", "add", "init.txt"], cwd=str(repo), capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", "init"], cwd=str(repo), capture_output=True, check=True)
+    assert get_staged_snapshot(str(repo)) == ([], "", compute_patch_hash(""))
+
+    (repo / "a.py").write_text("a = 1\n")
+    (repo / "b.py").write_text("b = 2\n")
+    subprocess.run(["git", "add", "a.py", "b.py"], cwd=str(repo), capture_output=True, check=True)
+
+    files, diff, patch_hash = get_staged_snapshot(str(repo))
+    assert files == get_staged_files(str(repo)) == ["a.py", "b.py"]
+    assert diff == get_staged_diff(str(repo))
+    assert patch_hash == compute_patch_hash(diff)
+
+
 def test_compute_patch_hash() -> None:
     diff = "diff --git a/foo.py b/foo.py\n+x = 1\n"
     h1 = compute_patch_hash(diff)
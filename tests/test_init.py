@@ -76,3 +76,36 @@ def test_init_skips_existing_without_force(tmp_path: Path) -> None:
     forced = runner.invoke(app, ["init", "--repo", str(repo), "--force"])
     assert forced.exit_code == 0, forced.output
     assert agents_path.read_text() != "custom\n"
+    assert forced.output.count("updated") == 3
+    assert "created" not in forced.output
+
+
+def test_init_compact_writes_minified_json(tmp_path: Path) -> None:
+    """--compact should write single-line JSON scaffold files."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+
+    result = runner.invoke(app, ["init", "--repo", str(repo), "--compact"])
+    assert result.exit_code == 0, result.output
+
+    for name in ("capabilities.json", "policy.json"):
+        text = (repo / ".agentmesh" / name).read_text()
+        assert text.count("\n") == 1
+        assert json.loads(text)["schema_version"] == "1.0"
+
+
+def test_init_escapes_test_command_in_json(tmp_path: Path) -> None:
+    """Placeholder values are JSON-encoded, so quotes and $ survive intact."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    command = 'pytest -k "not slow" $EXTRA'
+
+    result = runner.invoke(app, ["init", "--repo", str(repo), "--test-command", command])
+    assert result.exit_code == 0, result.output
+
+    caps = json.loads((repo / ".agentmesh" / "capabilities.json").read_text())
+    policy = json.loads((repo / ".agentmesh" / "policy.json").read_text())
+    assert caps["recommended_defaults"]["test_command"] == command
+    assert caps["recommended_defaults"]["claim_ttl_seconds"] == 1800
+    assert policy["task_finish"]["run_tests"] == command
+    assert policy["task_finish"]["capsule"] is True
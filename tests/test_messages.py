@@ -47,3 +47,30 @@ def test_mark_read(tmp_data_dir: Path) -> None:
     db.mark_read(msg.msg_id, "a2", tmp_data_dir)
     unread = inbox(agent_id="a2", unread=True, data_dir=tmp_data_dir)
     assert len(unread) == 0
+
+
+def test_inbox_cli_renders_one_line_per_message(tmp_data_dir: Path) -> None:
+    from typer.testing import CliRunner
+
+    from agentmesh.cli import app
+
+    _register("a1", tmp_data_dir)
+    post("a1", "fyi msg", severity=Severity.FYI, data_dir=tmp_data_dir)
+    post("a1", "blocker msg", to_agent="a2", severity=Severity.BLOCKER, data_dir=tmp_data_dir)
+    result = CliRunner().invoke(app, ["--data-dir", str(tmp_data_dir), "inbox", "-a", "a2"])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert len(lines) == 2
+    assert {line.split(":")[0] for line in lines} == {"[BLOCKER] a1 -> a2", "[FYI] a1"}
+
+
+def test_inbox_cli_prints_bracketed_bodies_verbatim(tmp_data_dir: Path) -> None:
+    from typer.testing import CliRunner
+
+    from agentmesh.cli import app
+
+    _register("a1", tmp_data_dir)
+    post("a1", "see [fix] and [/x] now", data_dir=tmp_data_dir)
+    result = CliRunner().invoke(app, ["--data-dir", str(tmp_data_dir), "inbox", "-a", "a2"])
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("[FYI] a1: see [fix] and [/x] now  ")
@@ -46,6 +46,19 @@ def test_orch_create_json(tmp_path):
     assert data["task_id"].startswith("task_")
 
 
+def test_orch_create_json_compact_by_default(tmp_path):
+    _setup(tmp_path)
+    compact = _invoke(["orch", "create", "--title", "Compact", "--json"], tmp_path)
+    assert compact.exit_code == 0
+    assert len(compact.output.strip().splitlines()) == 1
+    assert '"state":"planned"' in compact.output
+
+    pretty = _invoke(["orch", "create", "--title", "Pretty", "--json", "--pretty"], tmp_path)
+    assert pretty.exit_code == 0
+    assert '  "state": "planned"' in pretty.output
+    assert json.loads(pretty.output)["title"] == "Pretty"
+
+
 # -- orch list --
 
 def test_orch_list(tmp_path):
@@ -58,6 +71,42 @@ def test_orch_list(tmp_path):
     assert "T2" in result.output
 
 
+def test_orch_list_rows_align_without_agent(tmp_path):
+    _setup(tmp_path)
+    _invoke(["orch", "create", "--title", "T1"], tmp_path)
+    _invoke(["orch", "create", "--title", "T2"], tmp_path)
+    lines = _invoke(["orch", "list"], tmp_path).output.splitlines()
+    assert len(lines) == 2
+    assert sorted(line.split()[1:] for line in lines) == [["planned", "-", "T1"], ["planned", "-", "T2"]]
+    assert len({line.index(" T") for line in lines}) == 1
+
+
+def test_orch_rejects_unknown_state_names(tmp_path):
+    _setup(tmp_path)
+    task_id = json.loads(_invoke(["orch", "create", "--title", "T", "--json"], tmp_path).output)["task_id"]
+
+    advance = _invoke(["orch", "advance", task_id, "--to", "runing"], tmp_path)
+    assert advance.exit_code == 1
+    assert "Invalid state 'runing'" in advance.output
+    assert db.get_task(task_id, tmp_path).state.value == "planned"
+
+    listed = _invoke(["orch", "list", "--state", "bogus"], tmp_path)
+    assert listed.exit_code == 1
+    assert "Valid: planned" in listed.output
+
+
+def test_orch_list_json(tmp_path):
+    _setup(tmp_path)
+    _invoke(["orch", "create", "--title", "T1"], tmp_path)
+    result = _invoke(["orch", "list", "--json"], tmp_path)
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert len(data) == 1
+    assert set(data[0]) == {"task_id", "title", "state", "assigned_agent_id", "branch"}
+    assert data[0]["title"] == "T1"
+    assert data[0]["state"] == "planned"
+
+
 # -- orch assign + show --
 
 def test_orch_assign_and_show(tmp_path):
@@ -201,6 +250,29 @@ def test_orch_freeze_toggle(tmp_path):
     assert orch_control.is_frozen(tmp_path) is False
 
 
+def test_orch_freeze_logs_nothing_when_commit_fails(tmp_path):
+    import sqlite3
+
+    _setup(tmp_path)
+    real_transaction = db.transaction
+
+    @contextmanager
+    def _failing_commit(data_dir=None):
+        with real_transaction(data_dir):
+            yield
+            raise sqlite3.OperationalError("database is locked")
+
+    with patch.object(db, "transaction", _failing_commit):
+        froze = _invoke(["orch", "freeze"], tmp_path)
+        locked = _invoke(["orch", "lock-merges"], tmp_path)
+
+    assert froze.exit_code != 0 and locked.exit_code != 0
+    assert orch_control.is_frozen(tmp_path) is False
+    kinds = {e.kind for e in events.read_events(tmp_path)}
+    assert EventKind.ORCH_FREEZE not in kinds
+    assert EventKind.ORCH_LOCK_MERGES not in kinds
+
+
 def test_merge_lock_blocks_transition_to_merged(tmp_path):
     _setup(tmp_path)
     task = orchestrator.create_task("merge lock", data_dir=tmp_path)
@@ -228,6 +300,19 @@ def test_orch_abort_all_clears_lock(tmp_path):
     assert orch_control.lease_holders(tmp_path) == []
 
 
+def test_orch_abort_all_aborts_open_tasks(tmp_path):
+    _setup(tmp_path)
+    open_task = orchestrator.create_task("open", data_dir=tmp_path)
+    done = orchestrator.create_task("done", data_dir=tmp_path)
+    orchestrator.abort_task(done.task_id, data_dir=tmp_path)
+
+    result = _invoke(["orch", "abort-all", "--json"], tmp_path)
+    assert result.exit_code == 0
+    payload = json.loads(result.output)
+    assert payload["aborted_tasks"] == [open_task.task_id]
+    assert db.get_task(open_task.task_id, tmp_path).state == TaskState.ABORTED
+
+
 def test_orch_watch_once_json(tmp_path):
     _setup(tmp_path)
     events.append_event(
@@ -243,6 +328,19 @@ def test_orch_watch_once_json(tmp_path):
     assert payload["kind"] == "TASK_TRANSITION"
 
 
+def test_orch_watch_plain_output_is_not_markup(tmp_path):
+    _setup(tmp_path)
+    events.append_event(
+        EventKind.TASK_TRANSITION,
+        agent_id="[bold]agent[/bold]",
+        payload={"task_id": "task_x", "from_state": "planned", "to_state": "assigned"},
+        data_dir=tmp_path,
+    )
+    result = _invoke(["orch", "watch", "--once"], tmp_path)
+    assert result.exit_code == 0
+    assert "[bold]agent[/bold]" in result.output
+
+
 def test_orch_lease_renew_json(tmp_path):
     _setup(tmp_path)
     owner = "orchctl_test_owner"
@@ -268,6 +366,29 @@ def test_orch_run_json_single_iteration(tmp_path):
     assert "clean" in payload
 
 
+def test_orch_run_sleep_subtracts_scan_time(tmp_path):
+    """The loop sleeps only for what is left of the interval after a scan."""
+    _setup(tmp_path)
+    from agentmesh import watchdog
+
+    real_scan = watchdog.scan
+    clock = {"ns": 0}
+
+    def _slow_scan(*args, **kwargs):
+        clock["ns"] += 3_000_000_000  # scan "takes" 3s of a 5s interval
+        return real_scan(*args, **kwargs)
+
+    sleeps: list[float] = []
+    with patch("agentmesh.cli.time.monotonic_ns", side_effect=lambda: clock["ns"]), \
+            patch("agentmesh.cli.time.sleep", side_effect=sleeps.append), \
+            patch.object(watchdog, "scan", _slow_scan):
+        result = _invoke(
+            ["orch", "run", "--max-iterations", "2", "--interval", "5", "--json"], tmp_path,
+        )
+    assert result.exit_code == 0
+    assert sleeps == [2.0]
+
+
 def test_orch_run_fails_on_lease_renew_failure(tmp_path):
     _setup(tmp_path)
 
@@ -114,6 +114,23 @@ def test_transition_from_terminal_rejected(data_dir, agent):
         orchestrator.transition_task(task.task_id, TaskState.PLANNED, data_dir=data_dir)
 
 
+def test_get_task_with_attempts(data_dir, agent):
+    task = orchestrator.create_task("Joined", data_dir=data_dir)
+    orchestrator.assign_task(task.task_id, agent.agent_id, data_dir=data_dir)
+
+    found = db.get_task_with_attempts(task.task_id, data_dir)
+    assert found is not None
+    got, attempts = found
+    assert got == db.get_task(task.task_id, data_dir)
+    assert attempts == db.list_attempts(task.task_id, data_dir)
+    assert [a.attempt_number for a in attempts] == [1]
+    assert db.get_task_with_attempts("task_missing", data_dir) is None
+
+    # Inside an outer write transaction the reads join it.
+    with db.transaction(data_dir):
+        assert db.get_task_with_attempts(task.task_id, data_dir)[0].task_id == task.task_id
+
+
 def test_transition_nonexistent_task(data_dir):
     with pytest.raises(orchestrator.TransitionError, match="not found"):
         orchestrator.transition_task("task_nonexistent", TaskState.ASSIGNED, data_dir=data_dir)
@@ -139,6 +156,40 @@ def test_abort_from_planned(data_dir):
     assert task.state == TaskState.ABORTED
 
 
+def test_abort_tasks_many_skips_terminal(data_dir, agent):
+    running = orchestrator.create_task("Running", data_dir=data_dir)
+    orchestrator.assign_task(running.task_id, agent.agent_id, data_dir=data_dir)
+    orchestrator.transition_task(running.task_id, TaskState.RUNNING, data_dir=data_dir)
+    planned = orchestrator.create_task("Planned", data_dir=data_dir)
+    done = orchestrator.create_task("Done", data_dir=data_dir)
+    orchestrator.abort_task(done.task_id, data_dir=data_dir)
+
+    aborted = orchestrator.abort_tasks_many(
+        [running.task_id, planned.task_id, done.task_id],
+        reason="bulk",
+        data_dir=data_dir,
+    )
+
+    assert aborted == [running.task_id, planned.task_id]
+    for task_id in aborted:
+        assert db.get_task(task_id, data_dir).state == TaskState.ABORTED
+    attempts = db.list_attempts(running.task_id, data_dir)
+    assert attempts[-1].outcome == "failure"
+    assert attempts[-1].error_summary == "bulk"
+
+
+def test_abort_tasks_many_queries_only_requested_ids(data_dir, monkeypatch):
+    monkeypatch.setattr(db, "_IN_CHUNK", 2)
+    tasks = [orchestrator.create_task(f"T{i}", data_dir=data_dir) for i in range(4)]
+    bystander = orchestrator.create_task("Untouched", data_dir=data_dir)
+    ids = [t.task_id for t in reversed(tasks)] + ["task_missing", tasks[0].task_id]
+
+    aborted = orchestrator.abort_tasks_many(ids, data_dir=data_dir)
+
+    assert aborted == [t.task_id for t in reversed(tasks)]
+    assert db.get_task(bystander.task_id, data_dir).state == TaskState.PLANNED
+
+
 def test_merge_transition_blocked_when_merges_locked(data_dir, agent):
     task = orchestrator.create_task("Lock merges", data_dir=data_dir)
     orchestrator.assign_task(task.task_id, agent.agent_id, data_dir=data_dir)
@@ -161,3 +161,15 @@ def test_classify_warns_on_malformed_policy(tmp_path: Path, capsys) -> None:
 
     assert result.classification == REVIEW
     assert "failed to parse" in capsys.readouterr().err
+
+
+def test_classify_cli_json_keeps_bracketed_paths(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "src" / "[id].py").write_text("x = 1\n")
+    monkeypatch.chdir(repo)
+
+    result = runner.invoke(app, ["classify", "--json", "src/[id].py"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["results"][0]["path"].endswith("[id].py")
@@ -292,6 +292,68 @@ def test_check_exited(tmp_path: Path) -> None:
         assert result.running is False
 
 
+def _record_real_spawn(data_dir: Path, spawn_id: str, pid: int) -> None:
+    db.create_spawn(
+        spawn_id=spawn_id, task_id="task_none", attempt_id="",
+        agent_id="agent_spawn", pid=pid, worktree_path="/tmp/wt",
+        branch="feat/wait", episode_id="", context_hash="sha256:abc",
+        started_at="2026-01-01T00:00:00+00:00", data_dir=data_dir,
+    )
+
+
+def test_wait_returns_when_worker_exits(tmp_path: Path) -> None:
+    data_dir = _setup_orch(tmp_path)
+    from agentmesh import spawner
+
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    _record_real_spawn(data_dir, "spawn_wait_exit", proc.pid)
+
+    result = spawner.wait("spawn_wait_exit", timeout_s=10, data_dir=data_dir)
+    proc.poll()
+    assert result.running is False
+    assert result.exit_code in (0, None)
+
+
+def test_wait_times_out_on_running_worker(tmp_path: Path) -> None:
+    data_dir = _setup_orch(tmp_path)
+    from agentmesh import spawner
+
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        _record_real_spawn(data_dir, "spawn_wait_slow", proc.pid)
+        result = spawner.wait("spawn_wait_slow", timeout_s=0.2, data_dir=data_dir)
+        assert result.running is True
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_wait_any_returns_first_exited_worker(tmp_path: Path) -> None:
+    data_dir = _setup_orch(tmp_path)
+    from agentmesh import spawner
+
+    fast = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    slow = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        _record_real_spawn(data_dir, "spawn_any_fast", fast.pid)
+        _record_real_spawn(data_dir, "spawn_any_slow", slow.pid)
+
+        assert spawner.wait_any(
+            ["spawn_any_slow"], timeout_s=0.2, data_dir=data_dir,
+        ) == []
+
+        results = spawner.wait_any(
+            ["spawn_any_slow", "spawn_any_fast"], timeout_s=10, data_dir=data_dir,
+        )
+        assert [r.spawn_id for r in results] == ["spawn_any_fast"]
+        assert results[0].running is False
+        assert results[0].exit_code in (0, None)
+    finally:
+        slow.kill()
+        slow.wait()
+        fast.poll()
+
+
 def test_harvest_success(tmp_path: Path) -> None:
     repo = _init_repo(tmp_path)
     data_dir = _setup_orch(tmp_path)
@@ -320,6 +382,40 @@ def test_harvest_success(tmp_path: Path) -> None:
     assert t.state == TaskState.PR_OPEN
 
 
+def test_harvest_many_mixed_outcomes(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    data_dir = _setup_orch(tmp_path)
+    ok_task = _make_assigned_task(data_dir, branch="feat/ok")
+    bad_task = _make_assigned_task(data_dir, branch="feat/bad")
+
+    from agentmesh import spawner
+
+    with patch("subprocess.Popen", FakePopen):
+        with patch.object(spawner, "create_worktree", return_value=(True, "")):
+            ok = spawner.spawn(ok_task, "agent_spawn", str(repo), data_dir=data_dir)
+            bad = spawner.spawn(bad_task, "agent_spawn", str(repo), data_dir=data_dir)
+
+    output_path = Path(ok.output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({"result": "done", "cost_usd": 0.05}))
+
+    with patch("os.kill", side_effect=ProcessLookupError):
+        with patch.object(spawner, "remove_worktree", return_value=(True, "")):
+            results, errors = spawner.harvest_many(
+                [ok.spawn_id, "spawn_missing", bad.spawn_id], data_dir=data_dir,
+            )
+            again, again_errors = spawner.harvest_many([ok.spawn_id], data_dir=data_dir)
+
+    assert {r.spawn_id: r.outcome for r in results} == {
+        ok.spawn_id: "success", bad.spawn_id: "failure",
+    }
+    assert list(errors) == ["spawn_missing"]
+    assert db.get_task(ok_task, data_dir).state == TaskState.PR_OPEN
+    assert db.get_task(bad_task, data_dir).state == TaskState.ABORTED
+    assert again == []
+    assert "already harvested" in again_errors[ok.spawn_id]
+
+
 def test_harvest_failure(tmp_path: Path) -> None:
     repo = _init_repo(tmp_path)
     data_dir = _setup_orch(tmp_path)
@@ -381,6 +477,75 @@ def test_abort_spawn(tmp_path: Path) -> None:
     assert t.state == TaskState.ABORTED
 
 
+def test_abort_many_spawns(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    data_dir = _setup_orch(tmp_path)
+    task_a = _make_assigned_task(data_dir, branch="feat/a")
+    task_b = _make_assigned_task(data_dir, branch="feat/b")
+
+    from agentmesh import spawner
+
+    with patch("subprocess.Popen", FakePopen):
+        with patch.object(spawner, "create_worktree", return_value=(True, "")):
+            rec_a = spawner.spawn(task_a, "agent_spawn", str(repo), data_dir=data_dir)
+            rec_b = spawner.spawn(task_b, "agent_spawn", str(repo), data_dir=data_dir)
+
+    with patch("os.kill"):
+        with patch.object(spawner, "remove_worktree", return_value=(True, "")) as rm:
+            aborted = spawner.abort_many(
+                [rec_a.spawn_id, rec_b.spawn_id, "spawn_missing"],
+                reason="bulk",
+                data_dir=data_dir,
+            )
+            again = spawner.abort_many([rec_a.spawn_id], data_dir=data_dir)
+
+    assert [r.spawn_id for r in aborted] == [rec_a.spawn_id, rec_b.spawn_id]
+    assert all(r.outcome == "aborted" for r in aborted)
+    assert again == []
+    assert rm.call_count == 2
+    for task_id in (task_a, task_b):
+        assert db.get_task(task_id, data_dir).state == TaskState.ABORTED
+        assert db.list_attempts(task_id, data_dir)[-1].outcome == "aborted"
+    assert spawner.list_spawns(active_only=True, data_dir=data_dir) == []
+
+
+def test_abort_many_logs_same_task_fields_as_abort(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    data_dir = _setup_orch(tmp_path)
+    db.register_agent(Agent(agent_id="agent_worker", cwd="/tmp"), data_dir)
+    task_a = _make_assigned_task(data_dir, branch="feat/a")
+    task_b = _make_assigned_task(data_dir, branch="feat/b")
+
+    from agentmesh import spawner
+
+    with patch("subprocess.Popen", FakePopen):
+        with patch.object(spawner, "create_worktree", return_value=(True, "")):
+            rec_a = spawner.spawn(task_a, "agent_worker", str(repo), data_dir=data_dir)
+            rec_b = spawner.spawn(task_b, "agent_worker", str(repo), data_dir=data_dir)
+
+    with patch("os.kill"):
+        with patch.object(spawner, "remove_worktree", return_value=(True, "")):
+            spawner.abort(rec_a.spawn_id, data_dir=data_dir)
+            spawner.abort_many([rec_b.spawn_id], data_dir=data_dir)
+
+    def _abort_fields(task_id: str, spawn_id: str) -> tuple:
+        (ev,) = [
+            e for e in events.read_events(data_dir)
+            if e.kind == EventKind.TASK_TRANSITION
+            and e.payload["task_id"] == task_id and e.payload["to_state"] == "aborted"
+        ]
+        attempt = db.list_attempts(task_id, data_dir)[-1]
+        return (
+            ev.agent_id,
+            ev.payload["reason"].replace(spawn_id, "<spawn>"),
+            attempt.outcome,
+            attempt.error_summary.replace(spawn_id, "<spawn>"),
+        )
+
+    assert _abort_fields(task_a, rec_a.spawn_id) == _abort_fields(task_b, rec_b.spawn_id)
+    assert _abort_fields(task_b, rec_b.spawn_id)[:2] == ("agent_worker", "worker aborted: <spawn>")
+
+
 def test_abort_rejects_already_ended_spawn(tmp_path: Path) -> None:
     repo = _init_repo(tmp_path)
     data_dir = _setup_orch(tmp_path)
@@ -429,6 +594,68 @@ def test_list_spawns(tmp_path: Path) -> None:
     assert len(active) == 1
 
 
+def test_spawn_resolves_dot_repo_to_cwd(tmp_path: Path, monkeypatch) -> None:
+    repo = _init_repo(tmp_path)
+    data_dir = _setup_orch(tmp_path)
+    task_id = _make_assigned_task(data_dir)
+    link = tmp_path / "repo_link"
+    link.symlink_to(repo)
+    monkeypatch.chdir(link)
+
+    from agentmesh import spawner
+
+    with patch("subprocess.Popen", FakePopen):
+        with patch.object(spawner, "create_worktree", return_value=(True, "")):
+            record = spawner.spawn(task_id, "agent_spawn", ".", data_dir=data_dir)
+
+    assert record.repo_cwd == os.path.realpath(repo)
+    assert spawner._real_repo_path(str(link)) == os.path.realpath(repo)
+
+
+def test_spawn_many_collects_per_task_errors(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    data_dir = _setup_orch(tmp_path)
+    task_a = _make_assigned_task(data_dir, branch="feat/a")
+    task_b = _make_assigned_task(data_dir, branch="feat/b")
+
+    from agentmesh import spawner
+
+    with patch("subprocess.Popen", FakePopen):
+        with patch.object(spawner, "create_worktree", return_value=(True, "")):
+            records, errors = spawner.spawn_many(
+                [task_a, "task_missing", task_b], "agent_spawn", str(repo), data_dir=data_dir,
+            )
+
+    assert [r.task_id for r in records] == [task_a, task_b]
+    assert list(errors) == ["task_missing"]
+    assert "not found" in errors["task_missing"]
+    assert len(spawner.list_spawns(active_only=True, data_dir=data_dir)) == 2
+
+
+def test_list_spawns_single_query(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    data_dir = _setup_orch(tmp_path)
+    from agentmesh import db, spawner
+
+    with patch("subprocess.Popen", FakePopen):
+        with patch.object(spawner, "create_worktree", return_value=(True, "")):
+            for _ in range(3):
+                task_id = _make_assigned_task(data_dir)
+                spawner.spawn(task_id, "agent_spawn", str(repo), data_dir=data_dir)
+
+    real_get_connection = db.get_connection
+    calls = []
+
+    def counting(data_dir=None):
+        calls.append(data_dir)
+        return real_get_connection(data_dir)
+
+    with patch.object(db, "get_connection", side_effect=counting):
+        records = spawner.list_spawns(data_dir=data_dir)
+    assert len(records) == 3
+    assert len(calls) == 1
+
+
 def test_list_spawns_active_filter(tmp_path: Path) -> None:
     repo = _init_repo(tmp_path)
     data_dir = _setup_orch(tmp_path)
@@ -479,6 +706,31 @@ def test_adapter_registry() -> None:
         get_adapter("nonexistent_backend_xyz")
 
 
+def test_describe_adapter_memoized_per_instance() -> None:
+    from agentmesh import worker_adapters
+
+    class _MemoAdapter(worker_adapters.ClaudeCodeAdapter):
+        name = "memo_test"
+        version = "v1"
+
+    register_adapter(_MemoAdapter())
+    try:
+        with patch.object(
+            worker_adapters, "_adapter_origin", wraps=worker_adapters._adapter_origin,
+        ) as spy:
+            first = worker_adapters.describe_adapter("memo_test")
+            assert worker_adapters.describe_adapter("memo_test") is first
+            assert spy.call_count == 1
+
+            replacement = _MemoAdapter()
+            replacement.version = "v2"
+            register_adapter(replacement)
+            assert worker_adapters.describe_adapter("memo_test").version == "v2"
+            assert spy.call_count == 2
+    finally:
+        _ADAPTERS.pop("memo_test", None)
+
+
 def test_load_adapters_from_modules_registers_exported_adapters(tmp_path: Path) -> None:
     mod_name = "am_test_adapter_mod"
     mod_file = tmp_path / f"{mod_name}.py"
@@ -1085,3 +1337,26 @@ def test_spawn_emits_env_sanitized_event(tmp_path: Path) -> None:
 
     assert payload["env_sanitized"] is True
     assert "CLAUDECODE" in payload["stripped_keys"]
+
+
+def test_wait_pids_exit_closes_pidfds_when_a_later_open_fails():
+    """A pidfd_open failure part-way through releases the fds already opened."""
+    import errno
+
+    from agentmesh import spawner
+
+    opened: list[int] = []
+
+    def _pidfd_open(pid):
+        if opened:
+            raise OSError(errno.EMFILE, "Too many open files")
+        fd = os.open(os.devnull, os.O_RDONLY)
+        opened.append(fd)
+        return fd
+
+    with patch.object(spawner.os, "pidfd_open", _pidfd_open, create=True):
+        # Both pids are alive (this process), so the kill() fallback times out.
+        assert spawner._wait_pids_exit([os.getpid(), os.getppid()], 0.01) == {}
+    assert len(opened) == 1
+    with pytest.raises(OSError):
+        os.fstat(opened[0])
@@ -6,12 +6,15 @@ import json
 from pathlib import Path
 
 from rich.console import Console
+from typer.testing import CliRunner
 
 from agentmesh import db
 from agentmesh.claims import make_claim
 from agentmesh.messages import post
 from agentmesh.models import Agent, Severity
-from agentmesh.status import render_status
+from agentmesh import events
+from agentmesh.cli import app
+from agentmesh.status import build_renderable, render_status
 
 
 def _register(agent_id: str, data_dir: Path) -> None:
@@ -47,3 +50,39 @@ def test_status_expires_stale_claims(tmp_data_dir: Path) -> None:
     result = render_status(data_dir=tmp_data_dir, as_json=True)
     data = json.loads(result)
     assert len(data["claims"]) == 0
+
+
+def test_build_renderable_matches_printed_dashboard(tmp_data_dir: Path) -> None:
+    _register("a1", tmp_data_dir)
+    make_claim("a1", "/tmp/foo.py", data_dir=tmp_data_dir)
+    printed = Console(record=True, width=120, force_terminal=False)
+    render_status(data_dir=tmp_data_dir, console=printed)
+    built = Console(record=True, width=120, force_terminal=False)
+    built.print(build_renderable(tmp_data_dir))
+    assert built.export_text() == printed.export_text()
+
+
+def test_status_watch_repaints_in_place(tmp_data_dir: Path, monkeypatch) -> None:
+    _register("a1", tmp_data_dir)
+
+    def _stop(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(events, "wait_for_change", _stop)
+    monkeypatch.setattr(Console, "clear", lambda self, home=True: (_ for _ in ()).throw(
+        AssertionError("watch should not clear the screen")))
+    result = CliRunner().invoke(app, ["--data-dir", str(tmp_data_dir), "status", "--watch"])
+    assert result.exit_code == 0, result.output
+    assert "Agents" in result.output
+    assert "a1" in result.output
+
+
+def test_status_cli_json_keeps_long_values_on_one_line(tmp_data_dir: Path) -> None:
+    _register("a1", tmp_data_dir)
+    body = " ".join(["word"] * 60)
+    post("a1", body, data_dir=tmp_data_dir)
+    result = CliRunner().invoke(app, ["--data-dir", str(tmp_data_dir), "status", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["messages"][0]["body"] == body
+    assert data == json.loads(render_status(data_dir=tmp_data_dir, as_json=True))
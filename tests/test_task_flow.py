@@ -196,3 +196,239 @@ def test_task_commands_use_policy_defaults(
     assert db.list_capsules(tmp_data_dir) == []
     assert len(db.list_claims(tmp_data_dir, agent_id="task_agent")) == 1
     assert get_current_episode(tmp_data_dir) != ""
+
+
+def test_register_records_cwd_of_each_invocation(
+    tmp_path: Path,
+    tmp_data_dir: Path,
+    monkeypatch,
+) -> None:
+    """Process context is cached per invocation, not across in-process runs."""
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    for name in ("one", "two"):
+        work = tmp_path / name
+        work.mkdir()
+        monkeypatch.chdir(work)
+        result = runner.invoke(app, ["register", "--agent", f"agent_{name}"])
+        assert result.exit_code == 0, result.output
+        agent = db.get_agent(f"agent_{name}", tmp_data_dir)
+        assert agent is not None
+        assert agent.cwd == str(work)
+
+
+def test_claim_auto_registers_agent_with_ordered_events(
+    tmp_path: Path,
+    tmp_data_dir: Path,
+    monkeypatch,
+) -> None:
+    """claim for an unknown agent registers it and logs REGISTER before CLAIMs."""
+    from agentmesh.events import read_events, verify_chain
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    result = runner.invoke(app, ["claim", "--agent", "fresh", "a.py", "PORT:8080"])
+    assert result.exit_code == 0, result.output
+
+    assert db.get_agent("fresh", tmp_data_dir) is not None
+    assert len(db.list_claims(tmp_data_dir, agent_id="fresh")) == 2
+    kinds = [e.kind.value for e in read_events(tmp_data_dir) if e.agent_id == "fresh"]
+    assert kinds == ["REGISTER", "CLAIM", "CLAIM"]
+    assert verify_chain(tmp_data_dir)[0]
+
+
+def test_claim_output_labels_non_file_resources(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    result = runner.invoke(app, ["claim", "--agent", "lbl", "a.py", "PORT:8080", "LOCK:npm"])
+    assert result.exit_code == 0, result.output
+    assert "Claimed [PORT] 8080" in result.output
+    assert "Claimed [LOCK] npm" in result.output
+    assert "[FILE]" not in result.output
+
+
+def test_enum_options_reject_unknown_values(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    assert runner.invoke(app, ["register", "--agent", "enum"]).exit_code == 0
+    result = runner.invoke(app, ["heartbeat", "--agent", "enum", "--status", "napping"])
+    assert result.exit_code == 1
+    assert "Invalid status 'napping'. Valid: idle, busy" in result.output
+    result = runner.invoke(app, ["msg", "hi", "--agent", "enum", "--severity", "LOUD"])
+    assert result.exit_code == 1
+    assert "Invalid severity 'LOUD'" in result.output
+    assert runner.invoke(app, ["heartbeat", "--agent", "enum", "--status", "idle"]).exit_code == 0
+
+
+def test_data_dir_option_overrides_env(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    other = tmp_path / "env_board"
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(other))
+    result = runner.invoke(app, ["--data-dir", str(tmp_data_dir), "register", "--agent", "flagged"])
+    assert result.exit_code == 0, result.output
+    assert db.agent_exists("flagged", tmp_data_dir)
+    assert not (other / "board.db").exists()
+    # The next invocation without the flag falls back to the env var again.
+    assert runner.invoke(app, ["register", "--agent", "env_agent"]).exit_code == 0
+    assert db.agent_exists("env_agent", other)
+
+
+def test_claim_reports_each_resource_once(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    assert runner.invoke(app, ["claim", "--agent", "holder", "b.py"]).exit_code == 0
+    result = runner.invoke(app, ["claim", "--agent", "other", "[id].py", "b.py"])
+    assert result.exit_code == 1
+    out = result.output.replace(" \n", " ")
+    assert "[id].py (ttl=1800s)" in out
+    assert out.count("CONFLICT on") == 1
+    assert "claimed by holder" in out
+
+
+def test_check_json_lists_conflicting_claims(tmp_path: Path, tmp_data_dir: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    assert runner.invoke(app, ["claim", "--agent", "holder", "a.py"]).exit_code == 0
+    for _ in range(2):
+        result = runner.invoke(app, ["check", "a.py", "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert [(c["agent_id"], c["resource_type"]) for c in data] == [("holder", "file")]
+
+
+def test_task_start_claims_remaining_resources_after_conflict(
+    tmp_path: Path,
+    tmp_data_dir: Path,
+    monkeypatch,
+) -> None:
+    """A conflict on one --claim still claims the others, tagged with the episode."""
+    repo = _init_repo(tmp_path / "repo")
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    assert runner.invoke(app, ["claim", "--agent", "holder", "PORT:3000"]).exit_code == 0
+
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "task_agent")
+    result = runner.invoke(
+        app,
+        ["task", "start", "--title", "Ports", "--claim", "PORT:3000", "--claim", "src/app.py"],
+    )
+    assert result.exit_code == 1
+    assert "CONFLICT on" in result.output
+
+    ep_id = get_current_episode(tmp_data_dir)
+    held = db.list_claims(tmp_data_dir, agent_id="task_agent")
+    assert [c.path for c in held] == [str((repo / "src/app.py").resolve())]
+    assert held[0].episode_id == ep_id
+
+
+def test_task_finish_logs_bookkeeping_events_after_commit(
+    tmp_path: Path,
+    tmp_data_dir: Path,
+    monkeypatch,
+) -> None:
+    """task finish appends its commit/transition/release/episode events as one ordered batch."""
+    from agentmesh import orchestrator
+    from agentmesh.events import read_events, verify_chain
+
+    repo = _init_repo(tmp_path / "repo")
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "task_agent")
+    db.init_db(tmp_data_dir)
+    task = orchestrator.create_task("Bridge", data_dir=tmp_data_dir)
+    orchestrator.assign_task(task.task_id, "task_agent", data_dir=tmp_data_dir)
+
+    start = runner.invoke(
+        app, ["task", "start", "--title", "Bridge", "--orch-task", task.task_id, "--claim", "src/b.py"],
+    )
+    assert start.exit_code == 0, start.output
+    (repo / "src").mkdir(parents=True, exist_ok=True)
+    (repo / "src/b.py").write_text("B = 1\n")
+    subprocess.run(["git", "add", "src/b.py"], cwd=str(repo), capture_output=True, check=True)
+
+    finish = runner.invoke(
+        app, ["task", "finish", "--message", "add b", "--no-capsule", "--orch-task", task.task_id],
+    )
+    assert finish.exit_code == 0, finish.output
+
+    logged = read_events(tmp_data_dir)
+    kinds = [e.kind.value for e in logged]
+    assert kinds[-4:] == ["COMMIT", "TASK_TRANSITION", "RELEASE", "EPISODE_END"]
+    # One append_events() write: the batch shares a single timestamp.
+    assert len({e.ts for e in logged[-4:]}) == 1
+    assert verify_chain(tmp_data_dir)[0]
+    assert db.get_task(task.task_id, tmp_data_dir).state.value == "pr_open"
+
+
+def test_task_finish_rollback_keeps_episode_pointer_and_prints_nothing(
+    tmp_path: Path,
+    tmp_data_dir: Path,
+    monkeypatch,
+) -> None:
+    """A failed bookkeeping transaction leaves the episode current and reports no success."""
+    import sqlite3
+
+    from agentmesh import orchestrator
+
+    repo = _init_repo(tmp_path / "repo")
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("AGENTMESH_DATA_DIR", str(tmp_data_dir))
+    monkeypatch.setenv("AGENTMESH_AGENT_ID", "task_agent")
+    db.init_db(tmp_data_dir)
+    task = orchestrator.create_task("Rollback", data_dir=tmp_data_dir)
+    orchestrator.assign_task(task.task_id, "task_agent", data_dir=tmp_data_dir)
+
+    start = runner.invoke(
+        app, ["task", "start", "--title", "Rollback", "--orch-task", task.task_id, "--claim", "src/r.py"],
+    )
+    assert start.exit_code == 0, start.output
+    ep_id = get_current_episode(tmp_data_dir)
+    (repo / "src").mkdir(parents=True, exist_ok=True)
+    (repo / "src/r.py").write_text("R = 1\n")
+    subprocess.run(["git", "add", "src/r.py"], cwd=str(repo), capture_output=True, check=True)
+
+    real_end = db.end_episode
+
+    def _end_then_fail(*args, **kwargs):
+        real_end(*args, **kwargs)
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(db, "end_episode", _end_then_fail)
+    finish = runner.invoke(
+        app, ["task", "finish", "--message", "add r", "--no-capsule", "--orch-task", task.task_id],
+    )
+
+    assert finish.exit_code != 0
+    assert "pr_open" not in finish.output
+    assert "Released" not in finish.output
+    assert "ended" not in finish.output
+    assert get_current_episode(tmp_data_dir) == ep_id
+    assert db.get_task(task.task_id, tmp_data_dir).state.value != "pr_open"
+
+
+def test_load_policy_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    from agentmesh import cli
+
+    policy_path = tmp_path / ".agentmesh" / "policy.json"
+    assert cli._load_policy(tmp_path) == {}
+
+    policy_path.parent.mkdir()
+    policy_path.write_text(json.dumps({"claims": {"ttl_seconds": 60}}))
+    first = cli._load_policy(tmp_path)
+    assert first == {"claims": {"ttl_seconds": 60}}
+    assert cli._load_policy(tmp_path) is first
+
+    policy_path.write_text(json.dumps({"claims": {"ttl_seconds": 900}}))
+    assert cli._load_policy(tmp_path) == {"claims": {"ttl_seconds": 900}}
+
+
+def test_load_policy_defaults_to_invocation_cwd(tmp_path: Path, monkeypatch) -> None:
+    from agentmesh import cli
+
+    (tmp_path / ".agentmesh").mkdir()
+    (tmp_path / ".agentmesh" / "policy.json").write_text(json.dumps({"task_finish": {"signoff": True}}))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli, "_PROC", None)
+    assert cli._load_policy() == {"task_finish": {"signoff": True}}
+
+    # The cwd is captured once per invocation; later chdirs do not move it.
+    monkeypatch.chdir(tmp_path.parent)
+    assert cli._load_policy() == {"task_finish": {"signoff": True}}
@@ -299,6 +299,30 @@ def test_pid_reuse_no_fingerprint_falls_back(data_dir):
     assert alive is True
 
 
+@pytest.mark.skipif(not Path("/proc/self").exists(), reason="needs /proc")
+def test_scan_liveness_probes_all_spawns_at_once(data_dir):
+    """One /proc snapshot + one create-time probe, no per-PID kill()."""
+    import os
+    from agentmesh import spawner
+
+    me = os.getpid()
+    real_create = spawner._get_pid_create_time(me)
+    _create_spawn_with_task(data_dir, "spawn_live", pid=me, pid_started_at=real_create)
+    _create_spawn_with_task(data_dir, "spawn_reused", pid=me, pid_started_at=real_create - 3600)
+    _create_spawn_with_task(data_dir, "spawn_gone", pid=2**22 + 7)
+
+    with patch("os.kill", side_effect=AssertionError("per-PID probe")):
+        with patch.object(
+            spawner, "_get_pid_create_times", wraps=spawner._get_pid_create_times,
+        ) as spy:
+            exited, timed_out = watchdog._scan_spawn_liveness(data_dir=data_dir)
+
+    assert spy.call_count == 1
+    assert spy.call_args.args[0] == [me]
+    assert sorted(r["spawn_id"] for r in exited) == ["spawn_gone", "spawn_reused"]
+    assert timed_out == []
+
+
 # -- Race idempotency --
 
 def test_scan_spawns_idempotent_already_harvested(data_dir):
@@ -315,3 +339,35 @@ def test_scan_spawns_idempotent_already_harvested(data_dir):
     # Should skip it because the re-read sees ended_at is set
     assert "spawn_race" not in harvested
     assert timed_out == []
+
+
+# -- Read-only probes --
+
+def test_spawn_liveness_probe_does_not_mutate(data_dir):
+    """The liveness probe classifies spawns without harvesting them."""
+    _create_spawn_with_task(data_dir, "spawn_probe", pid=99990)
+
+    with patch("agentmesh.watchdog._is_pid_alive", return_value=False):
+        exited, timed_out = watchdog._scan_spawn_liveness(data_dir=data_dir)
+
+    assert [r["spawn_id"] for r in exited] == ["spawn_probe"]
+    assert timed_out == []
+    assert not db.get_spawn("spawn_probe", data_dir).get("ended_at", "")
+
+
+def test_cost_probe_skips_task_finished_earlier_in_pass(data_dir):
+    """A task aborted by the reap phase is not re-aborted for cost."""
+    db.register_agent(Agent(agent_id="spender", last_heartbeat=_stale_ts(600)), data_dir)
+    t = orchestrator.create_task("Spendy", meta={"max_cost_usd": 1.0}, data_dir=data_dir)
+    orchestrator.assign_task(t.task_id, "spender", data_dir=data_dir)
+    orchestrator.transition_task(t.task_id, TaskState.RUNNING, data_dir=data_dir)
+    events.append_event(
+        EventKind.WORKER_DONE,
+        payload={"task_id": t.task_id, "cost_usd": 2.0},
+        data_dir=data_dir,
+    )
+
+    result = watchdog.scan(stale_threshold_s=300, data_dir=data_dir)
+
+    assert t.task_id in result.aborted_tasks
+    assert result.cost_exceeded_tasks == []
@@ -144,3 +144,22 @@ def test_concurrent_append_assigns_unique_monotonic_sequences(tmp_data_dir: Path
     assert sorted(seqs) == list(range(1, 31))
     valid, err = verify_weave(tmp_data_dir)
     assert valid, err
+
+
+def test_weave_export_json_matches_model_dump(tmp_data_dir: Path) -> None:
+    import json
+
+    append_weave(git_commit_sha="a1", affected_symbols=["x.py", "y.py"], episode_id="ep_1", data_dir=tmp_data_dir)
+    append_weave(git_commit_sha="b2", episode_id="ep_2", data_dir=tmp_data_dir)
+
+    for episode in (None, "ep_1"):
+        expected = [e.model_dump() for e in db.list_weave_events(tmp_data_dir, episode_id=episode)]
+        assert db.list_weave_event_dicts(tmp_data_dir, episode_id=episode) == expected
+        assert [list(d) for d in db.list_weave_event_dicts(tmp_data_dir, episode_id=episode)] == [
+            list(d) for d in expected
+        ]
+
+    result = runner.invoke(app, ["--data-dir", str(tmp_data_dir), "weave", "export", "-e", "ep_1"])
+    assert result.exit_code == 0, result.output
+    exported = json.loads(result.output)
+    assert [e["affected_symbols"] for e in exported] == [["x.py", "y.py"]]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from unittest.mock import patch, MagicMock
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from typer.testing import CliRunner
 
@@ -65,6 +65,72 @@ def test_worker_spawn_json(tmp_path):
     assert data["backend_version"] == "agentmesh:0.7.0"
 
 
+def test_worker_spawn_batch_reports_errors(tmp_path):
+    _setup(tmp_path)
+    fake_record = spawner.SpawnRecord(
+        spawn_id="spawn_abc123",
+        task_id="task_a",
+        attempt_id="att_xyz",
+        agent_id="agent_cli",
+        pid=12345,
+        worktree_path="/tmp/wt",
+        branch="feat/a",
+        episode_id="",
+        context_hash="sha256:abc",
+        started_at="2026-01-01T00:00:00Z",
+    )
+    outcome = ([fake_record], {"task_b": "Task task_b not found"})
+
+    with patch("agentmesh.spawner.spawn_many", return_value=outcome) as mock_many:
+        result = _invoke(
+            ["worker", "spawn-batch", "task_a", "task_b", "--agent", "agent_cli", "--json"],
+            tmp_path,
+        )
+
+    assert result.exit_code == 1
+    assert mock_many.call_args.args[0] == ["task_a", "task_b"]
+    data = json.loads(result.output)
+    assert data["spawned"][0]["spawn_id"] == "spawn_abc123"
+    assert data["errors"] == {"task_b": "Task task_b not found"}
+
+
+def test_worker_spawn_text_output(tmp_path):
+    _setup(tmp_path)
+    fake_record = spawner.SpawnRecord(
+        spawn_id="spawn_abc123",
+        task_id="task_a",
+        attempt_id="att_xyz",
+        agent_id="agent_cli",
+        pid=12345,
+        worktree_path="/tmp/wt",
+        branch="feat/a",
+        episode_id="",
+        context_hash="sha256:abc",
+        started_at="2026-01-01T00:00:00Z",
+        backend_version="agentmesh:0.7.0",
+    )
+
+    with patch("agentmesh.spawner.spawn", return_value=fake_record):
+        result = _invoke(["worker", "spawn", "task_a", "--agent", "agent_cli"], tmp_path)
+
+    assert result.exit_code == 0
+    assert result.output == (
+        "Spawned spawn_abc123  pid=12345\n"
+        "  task=task_a  branch=feat/a  backend=claude_code@agentmesh:0.7.0\n"
+        "  worktree=/tmp/wt\n"
+    )
+
+
+def test_worker_spawn_error_exits_nonzero(tmp_path):
+    _setup(tmp_path)
+
+    with patch("agentmesh.spawner.spawn", side_effect=spawner.SpawnError("Task t1 not found")):
+        result = _invoke(["worker", "spawn", "t1", "--agent", "agent_cli"], tmp_path)
+
+    assert result.exit_code == 1
+    assert result.output == "Task t1 not found\n"
+
+
 # -- worker check --
 
 def test_worker_check_json(tmp_path):
@@ -111,6 +177,120 @@ def test_worker_list_json(tmp_path):
     data = json.loads(result.output)
     assert len(data) == 1
     assert data[0]["spawn_id"] == "spawn_abc123"
+    assert data[0] == {
+        "spawn_id": "spawn_abc123", "task_id": "task_xyz", "pid": 12345,
+        "branch": "feat/test", "ended_at": "", "outcome": "",
+    }
+    assert list(data[0]) == ["spawn_id", "task_id", "pid", "branch", "outcome", "ended_at"]
+
+
+def test_worker_list_json_is_compact_and_unwrapped(tmp_path):
+    _setup(tmp_path)
+    fake_record = spawner.SpawnRecord(
+        spawn_id="spawn_abc123",
+        task_id="task_xyz",
+        attempt_id="att_xyz",
+        agent_id="agent_cli",
+        pid=12345,
+        worktree_path="/tmp/wt",
+        branch="feat/[bold]" + "x" * 120,
+        episode_id="",
+        context_hash="sha256:abc",
+        started_at="2026-01-01T00:00:00Z",
+    )
+
+    with patch("agentmesh.spawner.list_spawns", return_value=[fake_record]):
+        compact = _invoke(["worker", "list", "--json"], tmp_path)
+        pretty = _invoke(["worker", "list", "--json", "--pretty"], tmp_path)
+
+    assert compact.output.count("\n") == 1
+    assert json.loads(compact.output)[0]["branch"] == fake_record.branch
+    assert json.loads(pretty.output) == json.loads(compact.output)
+    assert '\n  {\n    "spawn_id"' in pretty.output
+
+
+def test_worker_wait_json(tmp_path):
+    _setup(tmp_path)
+    exited = [spawner.CheckResult(spawn_id="spawn_b", running=False, exit_code=0)]
+
+    with patch("agentmesh.spawner.wait_any", return_value=exited) as mock_wait:
+        result = _invoke(
+            ["worker", "wait", "spawn_a", "spawn_b", "--timeout", "5", "--json"], tmp_path,
+        )
+
+    assert result.exit_code == 0
+    assert mock_wait.call_args.args[0] == ["spawn_a", "spawn_b"]
+    assert mock_wait.call_args.kwargs["timeout_s"] == 5.0
+    assert json.loads(result.output) == [
+        {"spawn_id": "spawn_b", "running": False, "exit_code": 0},
+    ]
+
+
+def test_worker_list_plain_output_when_piped(tmp_path):
+    _setup(tmp_path)
+    fake_record = spawner.SpawnRecord(
+        spawn_id="spawn_abc123",
+        task_id="task_xyz",
+        attempt_id="att_xyz",
+        agent_id="agent_cli",
+        pid=12345,
+        worktree_path="/tmp/wt",
+        branch="feat/" + "x" * 120,
+        episode_id="",
+        context_hash="sha256:abc",
+        started_at="2026-01-01T00:00:00Z",
+    )
+
+    done = replace(fake_record, spawn_id="spawn_def456", branch="feat/[done]", outcome="success")
+
+    with patch("agentmesh.spawner.list_spawns", return_value=[fake_record, done]):
+        listed = _invoke(["worker", "list"], tmp_path)
+    with patch("agentmesh.spawner.list_spawns", return_value=[]):
+        empty = _invoke(["worker", "list"], tmp_path)
+
+    assert listed.output == (
+        f"  spawn_abc123  pid=12345  running     {fake_record.branch}\n"
+        "  spawn_def456  pid=12345  success     feat/[done]\n"
+    )
+    assert empty.output == "No workers\n"
+
+
+def test_worker_harvest_batch_json(tmp_path):
+    _setup(tmp_path)
+    results = [spawner.HarvestResult(spawn_id="spawn_a", outcome="success")]
+
+    with patch("agentmesh.spawner.harvest_many", return_value=(results, {})) as mock_many:
+        result = _invoke(
+            ["worker", "harvest-batch", "spawn_a", "--keep-worktree", "--json"], tmp_path,
+        )
+
+    assert result.exit_code == 0
+    assert mock_many.call_args.kwargs["cleanup_worktree"] is False
+    assert json.loads(result.output) == {
+        "harvested": [{"spawn_id": "spawn_a", "outcome": "success"}],
+        "errors": {},
+    }
+
+
+def test_worker_list_ndjson_streams_records(tmp_path):
+    _setup(tmp_path)
+    for i in range(3):
+        db.create_spawn(
+            spawn_id=f"spawn_{i}", task_id=f"task_{i}", attempt_id="",
+            agent_id="agent_cli", pid=1000 + i, worktree_path="/tmp/wt",
+            branch=f"feat/{i}", episode_id="", context_hash="sha256:abc",
+            started_at=f"2026-01-01T00:00:0{i}+00:00", data_dir=tmp_path,
+        )
+
+    result = _invoke(["worker", "list", "--ndjson"], tmp_path)
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert [json.loads(line)["spawn_id"] for line in lines] == ["spawn_0", "spawn_1", "spawn_2"]
+    assert json.loads(lines[1]) == {
+        "spawn_id": "spawn_1", "task_id": "task_1", "pid": 1001,
+        "branch": "feat/1", "outcome": "", "ended_at": "",
+    }
 
 
 def test_worker_backends_json(tmp_path):
@@ -126,3 +306,24 @@ def test_worker_backends_json(tmp_path):
     data = json.loads(result.output)
     assert data["backends"][0]["name"] == "claude_code"
     assert data["backends"][0]["version"] == "agentmesh:0.7.0"
+
+
+def test_worker_error_fast_exit_skips_atexit(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import atexit, sys; "
+        "atexit.register(lambda: print('atexit ran')); "
+        "from agentmesh.cli import app; "
+        "app(sys.argv[1:], prog_name='agentmesh')"
+    )
+    env = {**os.environ, "AGENTMESH_FAST_EXIT": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-c", code, "--data-dir", str(tmp_path), "worker", "check", "spawn_nope"],
+        capture_output=True, text=True, env=env,
+    )
+    assert proc.returncode == 1
+    assert proc.stderr == "Spawn spawn_nope not found\n"
+    assert "atexit ran" not in proc.stdout